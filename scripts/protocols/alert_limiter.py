@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Ierahkwa Alert Limiter -- Shared Token-Bucket Rate Limiting
+One rate limiter for every alert sender in scripts/protocols (notify_guardians,
+peace_oracle, bio_ledger, ierahkwa_sentinel), so cron-invoked CLI runs and
+long-running daemons share a single view and cannot jointly flood guardians.
+
+State lives in a small SQLite database in WAL mode: one row per bucket,
+keyed by scope, level and region.  Each check is a single-row read and
+upsert inside a BEGIN IMMEDIATE transaction, so it is O(1) and safe across
+processes.  If the database cannot be opened the limiter falls back to
+process memory.
+
+Buckets hold up to ``burst`` tokens and refill one token per ``interval``
+seconds.  With burst=1 this is exactly "one alert per interval".
+
+Each sender has its own buckets (its ``scope``).  Senders that reach
+guardians use ``acquire_guardian``, which also takes a token from a budget
+shared by every sender, keyed by (level, region) only.  That caps the
+combined rate no matter how many senders fire at once.  Senders with no
+region of their own use GLOBAL_REGION.
+
+Environment variables
+---------------------
+ALERT_LIMITER_DB      SQLite state file; a relative
+                      path is taken from the project
+                      root, not the working directory (default: data/alert_limiter.db)
+RATE_LIMIT_RED        Seconds per level-5 token       (default: 3600)
+RATE_LIMIT_WARNING    Seconds per level-4 token       (default: 600)
+RATE_LIMIT_INFO       Seconds per level 1-3 token,
+                      0 = unlimited                   (default: 0)
+ALERT_BURST_RED       Level-5 burst allowance         (default: 1)
+ALERT_BURST_WARNING   Level-4 burst allowance         (default: 1)
+ALERT_BURST_INFO      Level 1-3 burst allowance       (default: 1)
+ALERT_SHARED_INTERVAL Seconds per token of the budget
+                      shared by all guardian-facing
+                      senders, 0 = unlimited          (default: 60)
+ALERT_SHARED_BURST    Shared budget burst allowance   (default: 10)
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parent.parent
+# Cron runs and daemons start from different directories; anchor relative
+# paths to the project so they all open the same store
+ALERT_LIMITER_DB = PROJECT_ROOT / os.environ.get("ALERT_LIMITER_DB", "data/alert_limiter.db")
+RATE_LIMIT_RED = float(os.environ.get("RATE_LIMIT_RED", "3600"))
+RATE_LIMIT_WARNING = float(os.environ.get("RATE_LIMIT_WARNING", "600"))
+RATE_LIMIT_INFO = float(os.environ.get("RATE_LIMIT_INFO", "0"))
+ALERT_BURST_RED = float(os.environ.get("ALERT_BURST_RED", "1"))
+ALERT_BURST_WARNING = float(os.environ.get("ALERT_BURST_WARNING", "1"))
+ALERT_BURST_INFO = float(os.environ.get("ALERT_BURST_INFO", "1"))
+ALERT_SHARED_INTERVAL = float(os.environ.get("ALERT_SHARED_INTERVAL", "60"))
+ALERT_SHARED_BURST = float(os.environ.get("ALERT_SHARED_BURST", "10"))
+
+logger = logging.getLogger("ierahkwa.alert_limiter")
+
+# Drop idle buckets roughly once per this many writes
+PRUNE_EVERY = 256
+
+# Scope of the cross-sender guardian budget, and the region used by
+# senders that have none
+SHARED_SCOPE = "shared"
+GLOBAL_REGION = "global"
+
+
+def level_policy(level: int) -> tuple[float, float]:
+    """(interval seconds per token, burst) for an alert level 1-5."""
+    if level >= 5:
+        return RATE_LIMIT_RED, ALERT_BURST_RED
+    if level >= 4:
+        return RATE_LIMIT_WARNING, ALERT_BURST_WARNING
+    return RATE_LIMIT_INFO, ALERT_BURST_INFO
+
+
+# ---------------------------------------------------------------------------
+# Limiter
+# ---------------------------------------------------------------------------
+
+
+class AlertLimiter:
+    """Cross-process token buckets keyed by (scope, level, region)."""
+
+    def __init__(self, db_path: Path = ALERT_LIMITER_DB):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._mem: dict[str, tuple[float, float, float, float]] = {}
+        self._writes = 0
+        self.conn: Optional[sqlite3.Connection] = None
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(db_path), timeout=5.0, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    key     TEXT PRIMARY KEY,
+                    tokens  REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    per_s   REAL NOT NULL,
+                    burst   REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self.conn = conn
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Alert limiter store %s unavailable (%s); "
+                           "limiting this process only.", db_path, exc)
+
+    @staticmethod
+    def key(level: int, region: str, scope: str = "ntfy") -> str:
+        return f"{scope}|{level}|{region}"
+
+    @staticmethod
+    def _refill(tokens: float, updated: float, now: float,
+                interval: float, burst: float) -> float:
+        return min(burst, tokens + max(0.0, now - updated) / interval)
+
+    def _update(self, key: str, interval: float, burst: float, delta: float,
+                now: float, only_if_available: bool) -> tuple[bool, float]:
+        """Apply ``delta`` tokens to a bucket; return (applied, tokens after)."""
+        if self.conn is None:
+            tokens, updated, _, _ = self._mem.get(key, (burst, now, interval, burst))
+            tokens = self._refill(tokens, updated, now, interval, burst)
+            if only_if_available and tokens + delta < 0:
+                return False, tokens
+            tokens = min(burst, max(0.0, tokens + delta))
+            self._mem[key] = (tokens, now, interval, burst)
+            return True, tokens
+
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens = burst if row is None else self._refill(row[0], row[1], now,
+                                                            interval, burst)
+            if only_if_available and tokens + delta < 0:
+                conn.execute("COMMIT")
+                return False, tokens
+            tokens = min(burst, max(0.0, tokens + delta))
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?, ?)",
+                (key, tokens, now, interval, burst),
+            )
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                # A bucket idle for interval*burst is full again: same as absent
+                conn.execute(
+                    "DELETE FROM buckets WHERE updated + per_s * burst < ?", (now,)
+                )
+            conn.execute("COMMIT")
+            return True, tokens
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self, level: int, region: str, scope: str = "ntfy",
+                interval: Optional[float] = None, burst: Optional[float] = None,
+                now: Optional[float] = None) -> bool:
+        """Take one token if available. False means the alert is rate-limited.
+
+        ``interval``/``burst`` override the level policy for senders with
+        their own cadence (e.g. bio_ledger's ALERT_COOLDOWN).
+        """
+        p_interval, p_burst = level_policy(level)
+        interval = p_interval if interval is None else interval
+        burst = p_burst if burst is None else burst
+        if interval <= 0:
+            return True
+        now = time.time() if now is None else now
+        with self._lock:
+            try:
+                ok, _ = self._update(self.key(level, region, scope), interval,
+                                     max(burst, 1.0), -1.0, now, True)
+                return ok
+            except sqlite3.Error as exc:
+                logger.error("Alert limiter check failed (allowing alert): %s", exc)
+                return True
+
+    def refund(self, level: int, region: str, scope: str = "ntfy",
+               interval: Optional[float] = None, burst: Optional[float] = None,
+               now: Optional[float] = None) -> None:
+        """Return a token taken by acquire() for an alert that was not delivered."""
+        p_interval, p_burst = level_policy(level)
+        interval = p_interval if interval is None else interval
+        burst = p_burst if burst is None else burst
+        if interval <= 0:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            try:
+                self._update(self.key(level, region, scope), interval,
+                             max(burst, 1.0), 1.0, now, False)
+            except sqlite3.Error as exc:
+                logger.error("Alert limiter refund failed: %s", exc)
+
+    def acquire_guardian(self, level: int, region: str, scope: str,
+                         interval: Optional[float] = None, burst: Optional[float] = None,
+                         now: Optional[float] = None, bucket: Optional[str] = None) -> bool:
+        """acquire() on the sender's own bucket and on the shared budget.
+
+        The sender's bucket is keyed by ``bucket`` (default: ``region``),
+        the shared one by level and ``region``.  Both tokens are taken or
+        neither: if the shared budget is spent, the sender's token is
+        refunded.
+        """
+        now = time.time() if now is None else now
+        own = region if bucket is None else bucket
+        if not self.acquire(level, own, scope, interval, burst, now):
+            return False
+        if not self.acquire(level, region, SHARED_SCOPE, ALERT_SHARED_INTERVAL,
+                            ALERT_SHARED_BURST, now):
+            self.refund(level, own, scope, interval, burst, now)
+            return False
+        return True
+
+    def refund_guardian(self, level: int, region: str, scope: str,
+                        interval: Optional[float] = None, burst: Optional[float] = None,
+                        now: Optional[float] = None, bucket: Optional[str] = None) -> None:
+        """Return both tokens taken by acquire_guardian()."""
+        now = time.time() if now is None else now
+        self.refund(level, region if bucket is None else bucket, scope, interval, burst, now)
+        self.refund(level, region, SHARED_SCOPE, ALERT_SHARED_INTERVAL,
+                    ALERT_SHARED_BURST, now)
+
+    def status(self, now: Optional[float] = None) -> list[dict]:
+        """Every tracked bucket with its current (refilled) token count."""
+        now = time.time() if now is None else now
+        with self._lock:
+            if self.conn is None:
+                rows = sorted((k, *v) for k, v in self._mem.items())
+            else:
+                rows = self.conn.execute(
+                    "SELECT key, tokens, updated, per_s, burst FROM buckets ORDER BY key"
+                ).fetchall()
+        out = []
+        for key, tokens, updated, interval, burst in rows:
+            scope, level, region = key.split("|", 2)
+            tokens = self._refill(tokens, updated, now, interval, burst)
+            out.append({"scope": scope, "level": int(level), "region": region,
+                        "tokens": round(tokens, 3), "burst": burst,
+                        "interval_s": interval, "last": updated})
+        return out
+
+    def reset(self, scope: Optional[str] = None) -> int:
+        """Forget buckets (all, or one scope). Returns the number removed."""
+        with self._lock:
+            if self.conn is None:
+                keys = [k for k in self._mem if scope is None or k.startswith(f"{scope}|")]
+                for k in keys:
+                    del self._mem[k]
+                return len(keys)
+            if scope is None:
+                return self.conn.execute("DELETE FROM buckets").rowcount
+            return self.conn.execute(
+                "DELETE FROM buckets WHERE key LIKE ?", (f"{scope}|%",)
+            ).rowcount
+
+
+_limiter: Optional[AlertLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> AlertLimiter:
+    """Process-wide limiter on ALERT_LIMITER_DB."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AlertLimiter()
+        return _limiter
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def benchmark(n: int = 5000) -> dict:
+    """Time acquire() on a scratch database."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        limiter = AlertLimiter(Path(tmp) / "bench.db")
+        start = time.perf_counter()
+        allowed = sum(limiter.acquire(5, f"R{i % 50}", scope="bench") for i in range(n))
+        elapsed = time.perf_counter() - start
+        limiter.conn.close()
+    return {"checks": n, "allowed": allowed,
+            "us_per_check": round(elapsed / n * 1e6, 1)}
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    parser = argparse.ArgumentParser(description="Ierahkwa shared alert rate limiter")
+    sub = parser.add_subparsers(dest="command", help="Available commands")
+    sub.add_parser("status", help="Show tracked buckets")
+    reset_p = sub.add_parser("reset", help="Clear rate-limit state")
+    reset_p.add_argument("--scope", default=None, help="Only clear this scope")
+    bench_p = sub.add_parser("benchmark", help="Time limiter checks")
+    bench_p.add_argument("-n", type=int, default=5000, help="Number of checks")
+    args = parser.parse_args()
+
+    if args.command == "status":
+        print(json.dumps(get_limiter().status(), indent=2))
+    elif args.command == "reset":
+        print(json.dumps({"removed": get_limiter().reset(args.scope)}))
+    elif args.command == "benchmark":
+        print(json.dumps(benchmark(args.n), indent=2))
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,15 @@ Environment variables
 ---------------------
 BIO_SERIAL_PORT       Serial port for ESP32          (default: /dev/ttyUSB1)
 BIO_SERIAL_BAUD       Baud rate                      (default: 115200)
+BIO_SERIAL_PORTS      Comma list of port[@baud][=device_id] to read
+                      concurrently                   (default: BIO_SERIAL_PORT)
+BIO_TCP_PORT          TCP JSON-lines listener, 0=off  (default: 0)
+BIO_UDP_PORT          UDP JSON-lines listener, 0=off  (default: 0)
+BIO_INGEST_HOST       Bind address for TCP/UDP        (default: 0.0.0.0)
+BIO_INGEST_QUEUE      Lines buffered before readers
+                      are paused                      (default: 1000)
+BIO_MAX_SOURCES       Network sources tracked; idle
+                      ones beyond this are forgotten  (default: 1024)
 MATRIX_HOMESERVER     Matrix server URL               (default: https://matrix.ierahkwa.org)
 MATRIX_USER           Bot Matrix user ID              (e.g. @bio-oracle:ierahkwa.org)
 MATRIX_PASSWORD       Password for the bot user
@@ -21,17 +30,33 @@ BIO_DB_PATH           SQLite database path            (default: data/bio_ledger.
 FLASK_PORT            REST API port                   (default: 5555)
 LOG_DIR               Logging directory               (default: logs/)
 IPFS_BATCH_INTERVAL   Seconds between IPFS batches    (default: 3600)
-ALERT_COOLDOWN        Seconds between repeat alerts   (default: 300)
+ALERT_COOLDOWN        Seconds between repeat alerts,
+                      shared via alert_limiter        (default: 300)
+BIO_WRITE_BATCH       Rows per group commit           (default: 200)
+BIO_WRITE_INTERVAL_MS Max ms before a partial commit  (default: 250)
+BIO_WRITE_QUEUE       Writer queue bound (rows)       (default: 10000)
+HISTORY_MAX_POINTS    Max buckets per history reply   (default: 1000)
+ANOMALY_Z             Std-devs for spike/rate alerts  (default: 4.0)
+ANOMALY_CUSUM_K       CUSUM slack, std-devs           (default: 0.5)
+ANOMALY_CUSUM_H       CUSUM drift alarm level         (default: 8.0)
+ANOMALY_WARMUP        Samples before a sensor alerts  (default: 30)
+ANOMALY_ALPHA         EWMA mean/variance weight       (default: 0.01)
+ANOMALY_MAX_DEVICES   Devices with baselines kept;
+                      least recently seen evicted     (default: 1024)
 """
 
+import argparse
 import asyncio
 import json
 import logging
 import os
+import queue
 import sqlite3
 import sys
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -42,6 +67,11 @@ try:
 except ImportError:
     serial = None
 
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
 try:
     from flask import Flask, jsonify, request as flask_request
 except ImportError:
@@ -62,12 +92,23 @@ try:
 except ImportError:
     sys.exit("requests is required: pip install requests")
 
+try:
+    from scripts.protocols.alert_limiter import GLOBAL_REGION, get_limiter
+except ImportError:
+    from alert_limiter import GLOBAL_REGION, get_limiter
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 BIO_SERIAL_PORT = os.environ.get("BIO_SERIAL_PORT", "/dev/ttyUSB1")
 BIO_SERIAL_BAUD = int(os.environ.get("BIO_SERIAL_BAUD", "115200"))
+BIO_SERIAL_PORTS = os.environ.get("BIO_SERIAL_PORTS", BIO_SERIAL_PORT)
+BIO_TCP_PORT = int(os.environ.get("BIO_TCP_PORT", "0"))
+BIO_UDP_PORT = int(os.environ.get("BIO_UDP_PORT", "0"))
+BIO_INGEST_HOST = os.environ.get("BIO_INGEST_HOST", "0.0.0.0")
+BIO_INGEST_QUEUE = int(os.environ.get("BIO_INGEST_QUEUE", "1000"))
+BIO_MAX_SOURCES = int(os.environ.get("BIO_MAX_SOURCES", "1024"))
 MATRIX_HOMESERVER = os.environ.get("MATRIX_HOMESERVER", "https://matrix.ierahkwa.org")
 MATRIX_USER = os.environ.get("MATRIX_USER", "@bio-oracle:ierahkwa.org")
 MATRIX_PASSWORD = os.environ.get("MATRIX_PASSWORD", "")
@@ -82,6 +123,16 @@ FLASK_PORT = int(os.environ.get("FLASK_PORT", "5555"))
 LOG_DIR = Path(os.environ.get("LOG_DIR", "logs"))
 IPFS_BATCH_INTERVAL = int(os.environ.get("IPFS_BATCH_INTERVAL", "3600"))
 ALERT_COOLDOWN = int(os.environ.get("ALERT_COOLDOWN", "300"))
+BIO_WRITE_BATCH = int(os.environ.get("BIO_WRITE_BATCH", "200"))
+BIO_WRITE_INTERVAL_MS = int(os.environ.get("BIO_WRITE_INTERVAL_MS", "250"))
+BIO_WRITE_QUEUE = int(os.environ.get("BIO_WRITE_QUEUE", "10000"))
+HISTORY_MAX_POINTS = int(os.environ.get("HISTORY_MAX_POINTS", "1000"))
+ANOMALY_Z = float(os.environ.get("ANOMALY_Z", "4.0"))
+ANOMALY_CUSUM_K = float(os.environ.get("ANOMALY_CUSUM_K", "0.5"))
+ANOMALY_CUSUM_H = float(os.environ.get("ANOMALY_CUSUM_H", "8.0"))
+ANOMALY_WARMUP = int(os.environ.get("ANOMALY_WARMUP", "30"))
+ANOMALY_ALPHA = float(os.environ.get("ANOMALY_ALPHA", "0.01"))
+ANOMALY_MAX_DEVICES = int(os.environ.get("ANOMALY_MAX_DEVICES", "1024"))
 
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 BIO_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -125,6 +176,7 @@ class BioReading:
     uv_index: float = 0.0
     alerts: list = field(default_factory=list)
     ipfs_cid: str = ""
+    device_id: str = ""
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -197,6 +249,8 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     """Create the bio_readings table and return a connection."""
     conn = sqlite3.connect(str(db_path), check_same_thread=False)
     conn.execute("PRAGMA journal_mode=WAL")
+    # In WAL mode NORMAL only fsyncs at checkpoints; commits stay atomic
+    conn.execute("PRAGMA synchronous=NORMAL")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS bio_readings (
@@ -210,7 +264,8 @@ def init_db(db_path: Path) -> sqlite3.Connection:
             water_ph        REAL,
             uv_index        REAL,
             alerts          TEXT,
-            ipfs_cid        TEXT
+            ipfs_cid        TEXT,
+            device_id       TEXT NOT NULL DEFAULT ''
         )
         """
     )
@@ -223,65 +278,362 @@ def init_db(db_path: Path) -> sqlite3.Connection:
             level           TEXT NOT NULL,
             value           REAL,
             message         TEXT,
-            governance_tx   TEXT
+            governance_tx   TEXT,
+            device_id       TEXT NOT NULL DEFAULT ''
         )
         """
     )
+    # Databases created before device tagging lack the column
+    for table in ("bio_readings", "bio_alerts"):
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if "device_id" not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN device_id TEXT NOT NULL DEFAULT ''")
+    rollup_cols = ",\n".join(
+        f"            {f}_min REAL, {f}_max REAL, {f}_sum REAL" for f in SENSOR_FIELDS
+    )
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS bio_rollups (
+            resolution      TEXT NOT NULL,
+            bucket          INTEGER NOT NULL,
+            count           INTEGER NOT NULL,
+{rollup_cols},
+            PRIMARY KEY (resolution, bucket)
+        ) WITHOUT ROWID
+        """
+    )
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_readings_ts ON bio_readings (timestamp DESC)"
     )
     conn.execute(
         "CREATE INDEX IF NOT EXISTS idx_alerts_ts ON bio_alerts (timestamp DESC)"
     )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_readings_device_ts "
+        "ON bio_readings (device_id, timestamp DESC)"
+    )
     conn.commit()
+    backfill_rollups(conn)
+    return conn
+
+
+def open_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a read-only connection for API queries.
+
+    WAL readers never block the writer (and vice versa), so each API
+    thread gets its own connection instead of sharing the ingest one.
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute("PRAGMA query_only=ON")
     return conn
 
 
+INSERT_READING_SQL = """
+    INSERT INTO bio_readings
+        (timestamp, soil_moisture, air_quality_aqi, temperature_c,
+         humidity_pct, co2_ppm, water_ph, uv_index, alerts, ipfs_cid, device_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_ALERT_SQL = """
+    INSERT INTO bio_alerts
+        (timestamp, alert_type, level, value, message, governance_tx, device_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def reading_row(reading: BioReading) -> tuple:
+    """Column tuple for INSERT_READING_SQL."""
+    return (
+        reading.timestamp,
+        reading.soil_moisture,
+        reading.air_quality_aqi,
+        reading.temperature_c,
+        reading.humidity_pct,
+        reading.co2_ppm,
+        reading.water_ph,
+        reading.uv_index,
+        json.dumps(reading.alerts, ensure_ascii=False),
+        reading.ipfs_cid,
+        reading.device_id,
+    )
+
+
+def alert_row(alert_type: str, level: str, value: float, message: str,
+              governance_tx: str = "", device_id: str = "") -> tuple:
+    """Column tuple for INSERT_ALERT_SQL, stamped now."""
+    return (datetime.now(timezone.utc).isoformat(), alert_type, level, value,
+            message, governance_tx, device_id)
+
+
 def store_reading(conn: sqlite3.Connection, reading: BioReading) -> int:
     """Insert a reading into the database. Return the row id."""
-    cur = conn.execute(
-        """
-        INSERT INTO bio_readings
-            (timestamp, soil_moisture, air_quality_aqi, temperature_c,
-             humidity_pct, co2_ppm, water_ph, uv_index, alerts, ipfs_cid)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            reading.timestamp,
-            reading.soil_moisture,
-            reading.air_quality_aqi,
-            reading.temperature_c,
-            reading.humidity_pct,
-            reading.co2_ppm,
-            reading.water_ph,
-            reading.uv_index,
-            json.dumps(reading.alerts, ensure_ascii=False),
-            reading.ipfs_cid,
-        ),
-    )
+    cur = conn.execute(INSERT_READING_SQL, reading_row(reading))
     conn.commit()
     return cur.lastrowid
 
 
 def store_alert(conn: sqlite3.Connection, alert_type: str, level: str,
-                value: float, message: str, governance_tx: str = "") -> None:
+                value: float, message: str, governance_tx: str = "",
+                device_id: str = "") -> None:
     """Record an alert event."""
-    conn.execute(
-        """
-        INSERT INTO bio_alerts (timestamp, alert_type, level, value, message, governance_tx)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (datetime.now(timezone.utc).isoformat(), alert_type, level, value,
-         message, governance_tx),
+    conn.execute(INSERT_ALERT_SQL,
+                 alert_row(alert_type, level, value, message, governance_tx, device_id))
+    conn.commit()
+
+
+class LedgerWriter:
+    """Single writer thread that group-commits queued rows.
+
+    Producers enqueue rows on a bounded queue (blocking when it is full, so
+    a burst applies back-pressure instead of growing memory).  The writer
+    commits once per ``batch_size`` rows or every ``interval_ms``, whichever
+    comes first, using ``executemany`` per table.  Rollups for the batch's
+    readings are upserted in the same transaction.  If a batch fails it is
+    retried one row per transaction, so only the offending rows are dropped
+    (and counted in ``rows_failed``).
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: Path, batch_size: int = BIO_WRITE_BATCH,
+                 interval_ms: int = BIO_WRITE_INTERVAL_MS, max_queue: int = BIO_WRITE_QUEUE):
+        self.conn = init_db(db_path)
+        self.batch_size = max(1, batch_size)
+        self.interval = max(1, interval_ms) / 1000.0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="bio-writer", daemon=True)
+        self.rows_committed = 0
+        self.rows_failed = 0
+        self.batches_committed = 0
+        self.last_batch_ms = 0.0
+        self._thread.start()
+
+    # -- Producer side --
+
+    def put_reading(self, reading: BioReading) -> None:
+        self._queue.put((INSERT_READING_SQL, reading_row(reading)))
+
+    def put_alert(self, alert_type: str, level: str, value: float, message: str,
+                  governance_tx: str = "", device_id: str = "") -> None:
+        self._queue.put((INSERT_ALERT_SQL,
+                         alert_row(alert_type, level, value, message, governance_tx, device_id)))
+
+    def flush(self) -> None:
+        """Block until every row queued so far has been committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commit what is queued, stop the thread and close the connection."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self.conn.close()
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "rows_committed": self.rows_committed,
+            "rows_failed": self.rows_failed,
+            "batches_committed": self.batches_committed,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+        }
+
+    # -- Writer thread --
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                self._queue.task_done()
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: list[tuple]) -> None:
+        """Insert ``batch`` and its rollups in one transaction."""
+        grouped: dict[str, list[tuple]] = {}
+        for sql, row in batch:
+            grouped.setdefault(sql, []).append(row)
+        with self.conn:
+            for sql, rows in grouped.items():
+                self.conn.executemany(sql, rows)
+            readings = grouped.get(INSERT_READING_SQL)
+            if readings:
+                self.conn.executemany(UPSERT_ROLLUP_SQL, rollup_rows(readings))
+
+    def _commit(self, batch: list[tuple]) -> None:
+        start = time.perf_counter()
+        try:
+            self._write(batch)
+            self.rows_committed += len(batch)
+        except Exception as exc:
+            # Isolate the bad rows instead of losing the whole batch
+            logger.warning("Bio-ledger batch of %d rows failed (%s); retrying row by row",
+                           len(batch), exc)
+            for item in batch:
+                try:
+                    self._write([item])
+                    self.rows_committed += 1
+                except Exception as row_exc:
+                    self.rows_failed += 1
+                    logger.error("Bio-ledger row dropped: %s -- %r", row_exc, item[1])
+        self.last_batch_ms = (time.perf_counter() - start) * 1000
+        self.batches_committed += 1
+
+
+# ---------------------------------------------------------------------------
+# Rollups -- minute / hour / day aggregates maintained at ingest
+# ---------------------------------------------------------------------------
+
+ROLLUP_RESOLUTIONS = {"minute": 60, "hour": 3600, "day": 86400}
+
+_ROLLUP_COLUMNS = ["resolution", "bucket", "count"] + [
+    f"{f}_{agg}" for f in SENSOR_FIELDS for agg in ("min", "max", "sum")
+]
+
+UPSERT_ROLLUP_SQL = (
+    f"INSERT INTO bio_rollups ({', '.join(_ROLLUP_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_ROLLUP_COLUMNS))}) "
+    "ON CONFLICT (resolution, bucket) DO UPDATE SET count = count + excluded.count, "
+    + ", ".join(
+        f"{f}_min = MIN({f}_min, excluded.{f}_min), "
+        f"{f}_max = MAX({f}_max, excluded.{f}_max), "
+        f"{f}_sum = {f}_sum + excluded.{f}_sum"
+        for f in SENSOR_FIELDS
     )
+)
+
+
+def _epoch(timestamp: str) -> int:
+    return int(datetime.fromisoformat(timestamp).timestamp())
+
+
+def rollup_rows(rows: list[tuple]) -> list[tuple]:
+    """Aggregate INSERT_READING_SQL rows into UPSERT_ROLLUP_SQL rows.
+
+    One row per (resolution, bucket) touched by the batch, so a batch of
+    readings costs at most three upserts per distinct minute.
+    """
+    buckets: dict[tuple[str, int], list] = {}
+    for row in rows:
+        try:
+            ts = _epoch(row[0])
+        except (TypeError, ValueError):
+            continue
+        values = row[1:1 + len(SENSOR_FIELDS)]
+        for name, width in ROLLUP_RESOLUTIONS.items():
+            key = (name, ts - ts % width)
+            acc = buckets.get(key)
+            if acc is None:
+                acc = [0]
+                for v in values:
+                    acc.extend((v, v, 0.0))
+                buckets[key] = acc
+            acc[0] += 1
+            for i, v in enumerate(values):
+                j = 1 + 3 * i
+                if v < acc[j]:
+                    acc[j] = v
+                if v > acc[j + 1]:
+                    acc[j + 1] = v
+                acc[j + 2] += v
+    return [(name, bucket, *acc) for (name, bucket), acc in buckets.items()]
+
+
+def backfill_rollups(conn: sqlite3.Connection) -> None:
+    """Build rollups from bio_readings when the table is new and empty."""
+    if conn.execute("SELECT 1 FROM bio_rollups LIMIT 1").fetchone():
+        return
+    if not conn.execute("SELECT 1 FROM bio_readings LIMIT 1").fetchone():
+        return
+    aggregates = ", ".join(f"MIN({f}), MAX({f}), SUM({f})" for f in SENSOR_FIELDS)
+    for name, width in ROLLUP_RESOLUTIONS.items():
+        conn.execute(
+            f"""
+            INSERT INTO bio_rollups ({', '.join(_ROLLUP_COLUMNS)})
+            SELECT ?, (CAST(strftime('%s', timestamp) AS INTEGER) / ?) * ?, COUNT(*), {aggregates}
+            FROM bio_readings
+            WHERE strftime('%s', timestamp) IS NOT NULL
+            GROUP BY 2
+            """,
+            (name, width, width),
+        )
     conn.commit()
+    logger.info("Backfilled bio_rollups from existing readings.")
+
+
+def pick_resolution(start: float, end: float, max_points: int = HISTORY_MAX_POINTS) -> str:
+    """Finest level whose bucket count over [start, end] stays <= max_points."""
+    span = max(0.0, end - start)
+    for name, width in ROLLUP_RESOLUTIONS.items():
+        if span / width <= max_points:
+            return name
+    return "day"
 
 
-def get_latest_readings(conn: sqlite3.Connection, limit: int = 50) -> list[dict]:
-    """Return the most recent readings as a list of dicts."""
+def get_rollups(conn: sqlite3.Connection, resolution: str, start: float, end: float,
+                limit: int = HISTORY_MAX_POINTS) -> list[dict]:
+    """Return rollup buckets in [start, end] (epoch seconds), oldest first."""
+    width = ROLLUP_RESOLUTIONS[resolution]
     cur = conn.execute(
-        "SELECT * FROM bio_readings ORDER BY timestamp DESC LIMIT ?", (limit,)
+        f"SELECT {', '.join(_ROLLUP_COLUMNS[1:])} FROM bio_rollups "
+        "WHERE resolution = ? AND bucket >= ? AND bucket <= ? ORDER BY bucket LIMIT ?",
+        (resolution, int(start) - int(start) % width, int(end), limit),
     )
+    points = []
+    for row in cur.fetchall():
+        bucket, count = row[0], row[1]
+        point = {
+            "t": datetime.fromtimestamp(bucket, timezone.utc).isoformat(),
+            "count": count,
+        }
+        for i, name in enumerate(SENSOR_FIELDS):
+            lo, hi, total = row[2 + 3 * i:5 + 3 * i]
+            point[name] = {
+                "min": lo,
+                "max": hi,
+                "avg": round(total / count, 3) if count else None,
+            }
+        points.append(point)
+    return points
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+def get_latest_readings(conn: sqlite3.Connection, limit: int = 50,
+                        device_id: Optional[str] = None) -> list[dict]:
+    """Return the most recent readings as a list of dicts, optionally for one device."""
+    if device_id is None:
+        cur = conn.execute(
+            "SELECT * FROM bio_readings ORDER BY timestamp DESC LIMIT ?", (limit,)
+        )
+    else:
+        cur = conn.execute(
+            "SELECT * FROM bio_readings WHERE device_id = ? ORDER BY timestamp DESC LIMIT ?",
+            (device_id, limit),
+        )
     columns = [desc[0] for desc in cur.description]
     rows = []
     for row in cur.fetchall():
@@ -295,6 +647,45 @@ def get_latest_readings(conn: sqlite3.Connection, limit: int = 50) -> list[dict]
     return rows
 
 
+def get_readings_between(conn: sqlite3.Connection, start: float, end: float,
+                         limit: int = 5000) -> list[dict]:
+    """Raw readings with start <= timestamp <= end (epoch seconds), oldest first."""
+    cur = conn.execute(
+        "SELECT * FROM bio_readings WHERE timestamp >= ? AND timestamp <= ? "
+        "ORDER BY timestamp LIMIT ?",
+        (datetime.fromtimestamp(start, timezone.utc).isoformat(),
+         datetime.fromtimestamp(end, timezone.utc).isoformat(), limit),
+    )
+    columns = [desc[0] for desc in cur.description]
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+
+def get_recent_averages(conn: sqlite3.Connection, limit: int = 100) -> tuple[dict, int]:
+    """Per-field averages over the newest ``limit`` readings, computed in SQL."""
+    averages = ", ".join(f"ROUND(AVG({f}), 2)" for f in SENSOR_FIELDS)
+    row = conn.execute(
+        f"SELECT COUNT(*), {averages} FROM "
+        "(SELECT * FROM bio_readings ORDER BY timestamp DESC LIMIT ?)",
+        (limit,),
+    ).fetchone()
+    count = row[0]
+    return {f: (v if v is not None else 0) for f, v in zip(SENSOR_FIELDS, row[1:])}, count
+
+
+def parse_time_arg(value: Optional[str]) -> Optional[float]:
+    """Parse an API time argument (epoch seconds or ISO-8601) to epoch seconds."""
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 def get_recent_alerts(conn: sqlite3.Connection, limit: int = 100) -> list[dict]:
     """Return the most recent alerts."""
     cur = conn.execute(
@@ -309,26 +700,252 @@ def get_recent_alerts(conn: sqlite3.Connection, limit: int = 100) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-def parse_sensor_json(raw_line: str) -> Optional[BioReading]:
-    """Parse a JSON line from the ESP32 serial output into a BioReading."""
+def parse_sensor_json(raw_line: str, device_id: str = "") -> Optional[BioReading]:
+    """Parse a JSON line from the ESP32 serial output into a BioReading.
+
+    A ``device_id`` field in the JSON wins over the id of the source it
+    arrived on.  Returns None for lines that are not a JSON object or whose
+    sensor fields are null or non-numeric.
+    """
     try:
         data = json.loads(raw_line.strip())
     except json.JSONDecodeError:
         return None
+    if not isinstance(data, dict):
+        return None
 
-    reading = BioReading(
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        soil_moisture=float(data.get("soil_moisture", 0)),
-        air_quality_aqi=int(data.get("air_quality_aqi", 0)),
-        temperature_c=float(data.get("temperature_c", 0)),
-        humidity_pct=float(data.get("humidity_pct", 0)),
-        co2_ppm=int(data.get("co2_ppm", 0)),
-        water_ph=float(data.get("water_ph", 7.0)),
-        uv_index=float(data.get("uv_index", 0)),
-    )
+    try:
+        reading = BioReading(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            soil_moisture=float(data.get("soil_moisture", 0)),
+            air_quality_aqi=int(data.get("air_quality_aqi", 0)),
+            temperature_c=float(data.get("temperature_c", 0)),
+            humidity_pct=float(data.get("humidity_pct", 0)),
+            co2_ppm=int(data.get("co2_ppm", 0)),
+            water_ph=float(data.get("water_ph", 7.0)),
+            uv_index=float(data.get("uv_index", 0)),
+            device_id=str(data.get("device_id") or device_id),
+        )
+    except (TypeError, ValueError, OverflowError):
+        # null / non-numeric field values (e.g. a sensor that failed to read)
+        return None
     return reading
 
 
+# ---------------------------------------------------------------------------
+# Ingestion -- many serial ports plus TCP/UDP JSON lines, one asyncio loop
+# ---------------------------------------------------------------------------
+
+
+def parse_serial_specs(spec: str) -> list[tuple[str, int, str]]:
+    """Parse ``port[@baud][=device_id]`` entries into (port, baud, device_id)."""
+    specs = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        entry, _, device_id = entry.partition("=")
+        port, _, baud = entry.partition("@")
+        specs.append((port, int(baud) if baud else BIO_SERIAL_BAUD,
+                      device_id or Path(port).name))
+    return specs
+
+
+class _UDPLineProtocol(asyncio.DatagramProtocol):
+    def __init__(self, ingest: "SensorIngest"):
+        self.ingest = ingest
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        for line in data.splitlines():
+            self.ingest.offer_nowait(f"udp:{addr[0]}", line)
+
+
+class SensorIngest:
+    """Multiplex sensor sources into one bounded queue.
+
+    Every configured serial port, TCP client and UDP sender is read by a
+    coroutine in a single event loop.  Lines go onto an ``asyncio.Queue``
+    of ``max_queue`` entries; when it is full, serial and TCP readers stop
+    reading (TCP flow control pushes back on the sender) and UDP
+    datagrams are counted as dropped.  Parsed readings are handed to
+    ``handler`` on a single worker thread so slow alert or governance
+    calls never block the loop.
+    """
+
+    RECONNECT_DELAY = 5
+
+    def __init__(self, handler, serial_specs: list[tuple[str, int, str]],
+                 tcp_port: int = 0, udp_port: int = 0, host: str = BIO_INGEST_HOST,
+                 max_queue: int = BIO_INGEST_QUEUE, max_sources: int = BIO_MAX_SOURCES):
+        self.handler = handler
+        self.serial_specs = serial_specs
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+        self.host = host
+        self.max_queue = max_queue
+        self.max_sources = max(1, max_sources)
+        # device_id -> source info, least recently active first
+        self.sources: OrderedDict[str, dict] = OrderedDict()
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: list[asyncio.Task] = []
+
+    def _source(self, device_id: str, kind: str) -> dict:
+        src = self.sources.get(device_id)
+        if src is not None:
+            self.sources.move_to_end(device_id)
+            return src
+        src = {"kind": kind, "connected": False, "lines": 0, "last_seen": None}
+        self.sources[device_id] = src
+        if len(self.sources) > self.max_sources:
+            # Forget the least recently active UDP/TCP senders; configured
+            # serial ports and open TCP connections are always kept
+            excess = len(self.sources) - self.max_sources
+            idle = []
+            for key, info in self.sources.items():
+                if len(idle) >= excess:
+                    break
+                if info["kind"] != "serial" and not info["connected"] and key != device_id:
+                    idle.append(key)
+            for key in idle:
+                del self.sources[key]
+        return src
+
+    async def _offer(self, device_id: str, line: bytes) -> None:
+        await self._queue.put((device_id, line))
+
+    def offer_nowait(self, device_id: str, line: bytes) -> None:
+        try:
+            self._queue.put_nowait((device_id, line))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    # -- Sources --
+
+    async def _serial_source(self, port: str, baud: int, device_id: str) -> None:
+        src = self._source(device_id, "serial")
+        src["port"] = port
+        loop = asyncio.get_running_loop()
+        while True:
+            handle = None
+            try:
+                if serial_asyncio is not None:
+                    reader, _ = await serial_asyncio.open_serial_connection(url=port, baudrate=baud)
+                    readline = reader.readline
+                else:
+                    handle = await loop.run_in_executor(
+                        None, lambda: serial.Serial(port=port, baudrate=baud, timeout=2))
+
+                    async def readline():
+                        return await loop.run_in_executor(None, handle.readline)
+                src["connected"] = True
+                logger.info("Serial port opened: %s @ %d baud (%s)", port, baud, device_id)
+                while True:
+                    raw = await readline()
+                    if serial_asyncio is not None and not raw:
+                        raise EOFError("serial port closed")
+                    if raw:
+                        await self._offer(device_id, raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.error("Serial source %s failed: %s", port, exc)
+            finally:
+                src["connected"] = False
+                if handle is not None:
+                    handle.close()
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _tcp_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername") or ("?",)
+        device_id = f"tcp:{peer[0]}"
+        src = self._source(device_id, "tcp")
+        src["connected"] = True
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                await self._offer(device_id, raw)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as exc:
+            logger.warning("TCP source %s dropped: %s", device_id, exc)
+        finally:
+            src["connected"] = False
+            writer.close()
+
+    # -- Consumer --
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bio-process")
+        try:
+            while True:
+                device_id, raw = await self._queue.get()
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                src = self._source(device_id, "udp")
+                src["lines"] += 1
+                src["last_seen"] = datetime.now(timezone.utc).isoformat()
+                try:
+                    reading = parse_sensor_json(line, device_id)
+                    if reading is None:
+                        logger.debug("Unparseable line from %s: %s", device_id, line[:120])
+                        continue
+                    await loop.run_in_executor(worker, self.handler, reading)
+                except Exception as exc:
+                    logger.exception("Failed to process reading from %s: %s", device_id, exc)
+        finally:
+            worker.shutdown(wait=False)
+
+    # -- Lifecycle --
+
+    async def run(self) -> None:
+        """Start all sources and the consumer; runs until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._tasks = [asyncio.create_task(self._consume())]
+        if self.serial_specs and serial is None and serial_asyncio is None:
+            logger.error("pyserial not installed. pip install pyserial")
+        else:
+            for port, baud, device_id in self.serial_specs:
+                self._tasks.append(asyncio.create_task(self._serial_source(port, baud, device_id)))
+        servers = []
+        if self.tcp_port:
+            server = await asyncio.start_server(self._tcp_client, self.host, self.tcp_port)
+            servers.append(server)
+            logger.info("TCP sensor listener on %s:%d", self.host, self.tcp_port)
+        if self.udp_port:
+            transport, _ = await self._loop.create_datagram_endpoint(
+                lambda: _UDPLineProtocol(self), local_addr=(self.host, self.udp_port))
+            servers.append(transport)
+            logger.info("UDP sensor listener on %s:%d", self.host, self.udp_port)
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            for server in servers:
+                server.close()
+
+    def stop(self) -> None:
+        """Thread-safe: cancel every ingestion task."""
+        if self._loop is not None and not self._loop.is_closed():
+            for task in self._tasks:
+                self._loop.call_soon_threadsafe(task.cancel)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "dropped_udp": self.dropped,
+            "sources": self.sources,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Threshold evaluation
 # ---------------------------------------------------------------------------
@@ -364,6 +981,201 @@ def evaluate_thresholds(reading: BioReading) -> list[dict]:
     return triggered
 
 
+# ---------------------------------------------------------------------------
+# Streaming anomaly detection
+# ---------------------------------------------------------------------------
+
+ANOMALY_MESSAGES = {
+    "SPIKE": ("Pico anomalo en {field}", "Anomalous spike in {field}"),
+    "DRIFT": ("Deriva sostenida en {field}", "Sustained drift in {field}"),
+    "RATE": ("Cambio brusco en {field}", "Abrupt rate of change in {field}"),
+}
+
+
+class AnomalyDetector:
+    """Per-sensor streaming statistics for every field in SENSOR_FIELDS.
+
+    Each device keeps a fixed set of floats per field: an EWMA baseline
+    mean and variance, two-sided CUSUM sums of the standardized deviation
+    from that baseline, the previous value, and an EWMA mean/variance of
+    the rate of change.  ``observe`` is O(1) time and memory per reading
+    and reports:
+
+    SPIKE  value is more than ``z`` std-devs from the baseline mean
+    DRIFT  a CUSUM sum exceeded ``cusum_h`` (small but persistent shift)
+    RATE   rate of change is more than ``z`` std-devs from its usual rate
+
+    Updates are winsorized at the spike bound, so one outlier neither
+    inflates the baseline nor trips DRIFT.  Until a sensor has seen
+    1/alpha samples the averages are plain running means, so the baseline
+    is usable as soon as warm-up ends.  Alerts are WARNING level and use
+    the same dict shape as ``evaluate_thresholds`` so they share the
+    cooldown path.
+
+    At most ``max_devices`` device baselines are kept; the least recently
+    seen device is evicted (and re-warms from scratch if it returns), so
+    readings with ever-new device ids cannot grow memory without bound.
+    """
+
+    # Per-field state layout (flat list, STATE_WIDTH floats per field)
+    _MEAN, _VAR, _CUSUM_POS, _CUSUM_NEG, _LAST, _RATE, _RATE_VAR = range(7)
+    STATE_WIDTH = 7
+
+    def __init__(self, z: float = ANOMALY_Z, cusum_k: float = ANOMALY_CUSUM_K,
+                 cusum_h: float = ANOMALY_CUSUM_H, warmup: int = ANOMALY_WARMUP,
+                 alpha: float = ANOMALY_ALPHA, max_devices: int = ANOMALY_MAX_DEVICES):
+        self.z = z
+        self.cusum_k = cusum_k
+        self.cusum_h = cusum_h
+        self.warmup = warmup
+        self.alpha = alpha
+        self.max_devices = max(1, max_devices)
+        # device_id -> [count, last_ts, *STATE_WIDTH floats per field], LRU order
+        self._devices: OrderedDict[str, list] = OrderedDict()
+
+    def observe(self, reading: BioReading) -> list[dict]:
+        """Fold ``reading`` into its device's state and return anomalies."""
+        values = [float(getattr(reading, name)) for name in SENSOR_FIELDS]
+        try:
+            ts = datetime.fromisoformat(reading.timestamp).timestamp()
+        except (TypeError, ValueError):
+            ts = time.time()
+
+        state = self._devices.get(reading.device_id)
+        if state is None:
+            state = [0, ts]
+            for v in values:
+                state.extend((v, 0.0, 0.0, 0.0, v, 0.0, 0.0))
+            self._devices[reading.device_id] = state
+            if len(self._devices) > self.max_devices:
+                self._devices.popitem(last=False)
+        else:
+            self._devices.move_to_end(reading.device_id)
+
+        count = state[0] + 1
+        dt = ts - state[1]
+        state[0], state[1] = count, ts
+        armed = count > self.warmup
+        # Plain running averages until 1/alpha samples
+        a = max(self.alpha, 1.0 / count)
+        a_rate = max(self.alpha, 1.0 / max(count - 1, 1))
+        z, k, h = self.z, self.cusum_k, self.cusum_h
+        found = []
+
+        for i, x in enumerate(values):
+            base = 2 + i * self.STATE_WIDTH
+            mean, var, pos, neg, last, rate_mean, rate_var = state[base:base + self.STATE_WIDTH]
+            std = var ** 0.5
+            rate = (x - last) / dt if dt > 0 else 0.0
+
+            if std > 0:
+                # Winsorized standardized deviation
+                dev = min(max((x - mean) / std, -z), z)
+                x_upd = mean + dev * std
+                if armed:
+                    pos = max(0.0, pos + dev - k)
+                    neg = max(0.0, neg - dev - k)
+            else:
+                dev, x_upd = 0.0, x
+
+            if armed and std > 0:
+                if abs(x - mean) > z * std:
+                    found.append(self._alert("SPIKE", i, x, mean, z * std))
+                if pos > h or neg > h:
+                    found.append(self._alert("DRIFT", i, x, mean, h * std))
+                    pos = neg = 0.0
+                rate_std = rate_var ** 0.5
+                if dt > 0 and rate_std > 0 and abs(rate - rate_mean) > z * rate_std:
+                    found.append(self._alert("RATE", i, rate, rate_mean, z * rate_std))
+
+            diff = x_upd - mean
+            incr = a * diff
+            mean += incr
+            var = (1 - a) * (var + diff * incr)
+            if dt > 0:
+                rdiff = rate - rate_mean
+                rincr = a_rate * rdiff
+                rate_mean += rincr
+                rate_var = (1 - a_rate) * (rate_var + rdiff * rincr)
+            state[base:base + self.STATE_WIDTH] = (mean, var, pos, neg, x, rate_mean, rate_var)
+        return found
+
+    @staticmethod
+    def _alert(kind: str, index: int, value: float, expected: float, band: float) -> dict:
+        name = SENSOR_FIELDS[index]
+        msg_es, msg_en = ANOMALY_MESSAGES[kind]
+        return {
+            "alert": f"ANOMALY_{kind}:{name}",
+            "level": ALERT_LEVEL_WARNING,
+            "field": name,
+            "value": round(value, 4),
+            "threshold": round(expected, 4),
+            "band": round(band, 4),
+            "message_es": msg_es.format(field=name),
+            "message_en": msg_en.format(field=name),
+        }
+
+    def snapshot(self, device_id: str) -> Optional[dict]:
+        """Current baseline per field for ``device_id`` (for the API)."""
+        state = self._devices.get(device_id)
+        if state is None:
+            return None
+        out = {"samples": state[0]}
+        for i, name in enumerate(SENSOR_FIELDS):
+            base = 2 + i * self.STATE_WIDTH
+            out[name] = {
+                "mean": round(state[base + self._MEAN], 4),
+                "std": round(state[base + self._VAR] ** 0.5, 4),
+                "cusum": round(max(state[base + self._CUSUM_POS],
+                                   state[base + self._CUSUM_NEG]), 3),
+            }
+        return out
+
+
+def replay_anomaly_benchmark(db_path: Path = BIO_DB_PATH, limit: int = 100000) -> dict:
+    """Replay stored bio_readings through a fresh detector and time it.
+
+    Returns per-reading cost in microseconds and anomaly counts by kind.
+    """
+    conn = open_readonly(db_path)
+    cur = conn.execute(
+        f"SELECT timestamp, {', '.join(SENSOR_FIELDS)}, device_id FROM bio_readings "
+        "ORDER BY timestamp LIMIT ?",
+        (limit,),
+    )
+    readings = [
+        BioReading(timestamp=row[0], device_id=row[-1] or "",
+                   **dict(zip(SENSOR_FIELDS, (v or 0 for v in row[1:-1]))))
+        for row in cur.fetchall()
+    ]
+    conn.close()
+
+    detector = AnomalyDetector()
+    counts: dict[str, int] = {}
+    start = time.perf_counter()
+    for reading in readings:
+        for alert in detector.observe(reading):
+            kind = alert["alert"].split(":", 1)[0]
+            counts[kind] = counts.get(kind, 0) + 1
+    elapsed = time.perf_counter() - start
+
+    threshold_start = time.perf_counter()
+    for reading in readings:
+        evaluate_thresholds(reading)
+    threshold_elapsed = time.perf_counter() - threshold_start
+
+    n = len(readings)
+    result = {
+        "readings": n,
+        "devices": len(detector._devices),
+        "detector_us_per_reading": round(elapsed / n * 1e6, 2) if n else 0.0,
+        "thresholds_us_per_reading": round(threshold_elapsed / n * 1e6, 2) if n else 0.0,
+        "anomalies": counts,
+    }
+    logger.info("Anomaly replay benchmark: %s", result)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Governance trigger -- IerahkwaTreasury proposal
 # ---------------------------------------------------------------------------
@@ -508,86 +1320,56 @@ class BioLedger:
     evaluation, governance triggers, IPFS archival, and the REST API."""
 
     def __init__(self):
-        self.conn = init_db(BIO_DB_PATH)
+        self._writer = LedgerWriter(BIO_DB_PATH)
+        self._readers = threading.local()
         self._running = False
-        self._serial_port: Optional[serial.Serial] = None
-        self._last_alert_times: dict[str, float] = {}
+        self._ingest = SensorIngest(
+            self._process_reading,
+            parse_serial_specs(BIO_SERIAL_PORTS),
+            tcp_port=BIO_TCP_PORT,
+            udp_port=BIO_UDP_PORT,
+        )
+        self._detector = AnomalyDetector()
         self._pending_ipfs_batch: list[dict] = []
         self._last_ipfs_pin = time.time()
         self._flask_app = self._create_flask_app()
 
-    # -- Alert cooldown ------------------------------------------------
-
-    def _alert_on_cooldown(self, alert_name: str) -> bool:
-        last = self._last_alert_times.get(alert_name, 0)
-        return (time.time() - last) < ALERT_COOLDOWN
-
-    def _record_alert_time(self, alert_name: str) -> None:
-        self._last_alert_times[alert_name] = time.time()
-
-    # -- Serial reader -------------------------------------------------
-
-    def _open_serial(self) -> bool:
-        if serial is None:
-            logger.error("pyserial not installed. pip install pyserial")
-            return False
-        try:
-            self._serial_port = serial.Serial(
-                port=BIO_SERIAL_PORT,
-                baudrate=BIO_SERIAL_BAUD,
-                timeout=2,
-            )
-            logger.info(
-                "Serial port opened: %s @ %d baud",
-                BIO_SERIAL_PORT,
-                BIO_SERIAL_BAUD,
-            )
-            return True
-        except serial.SerialException as exc:
-            logger.error("Cannot open serial port %s: %s", BIO_SERIAL_PORT, exc)
-            return False
+    # -- Database access -----------------------------------------------
 
-    def _serial_reader_loop(self) -> None:
-        """Continuously read lines from the ESP32 serial port."""
-        logger.info("Serial reader thread started.")
-        reconnect_delay = 5
+    def _read_conn(self) -> sqlite3.Connection:
+        """Per-thread read-only connection for the API."""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = open_readonly(BIO_DB_PATH)
+            self._readers.conn = conn
+        return conn
 
-        while self._running:
-            if self._serial_port is None or not self._serial_port.is_open:
-                if not self._open_serial():
-                    time.sleep(reconnect_delay)
-                    continue
+    # -- Alert cooldown ------------------------------------------------
 
-            try:
-                raw = self._serial_port.readline()
-                if not raw:
-                    continue
-                line = raw.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
+    def _alert_on_cooldown(self, alert_name: str, level: str) -> bool:
+        """Take a cooldown token; True if this alert fired too recently.
 
-                reading = parse_sensor_json(line)
-                if reading is None:
-                    logger.debug("Non-JSON serial line: %s", line[:120])
-                    continue
+        State is shared with other processes and survives restarts.
+        """
+        return not get_limiter().acquire_guardian(
+            5 if level == ALERT_LEVEL_EMERGENCY else 4, GLOBAL_REGION,
+            scope="bio", interval=ALERT_COOLDOWN, burst=1, bucket=alert_name,
+        )
 
-                self._process_reading(reading)
+    # -- Ingestion -----------------------------------------------------
 
-            except serial.SerialException as exc:
-                logger.error("Serial read error: %s", exc)
-                self._serial_port = None
-                time.sleep(reconnect_delay)
-            except Exception as exc:
-                logger.exception("Unexpected error in serial reader: %s", exc)
-                time.sleep(1)
+    def _ingest_thread(self) -> None:
+        """Run every sensor source in one event loop on its own thread."""
+        logger.info("Sensor ingestion thread started.")
+        asyncio.run(self._ingest.run())
 
     def _process_reading(self, reading: BioReading) -> None:
         """Evaluate thresholds, store, queue for IPFS, and alert."""
-        alerts = evaluate_thresholds(reading)
+        alerts = evaluate_thresholds(reading) + self._detector.observe(reading)
         reading.alerts = [a["alert"] for a in alerts]
 
-        # Store in SQLite
-        store_reading(self.conn, reading)
+        # Store in SQLite (group-committed by the writer thread)
+        self._writer.put_reading(reading)
 
         # Queue for IPFS batch
         self._pending_ipfs_batch.append(reading.to_dict())
@@ -596,26 +1378,26 @@ class BioLedger:
         if (time.time() - self._last_ipfs_pin) >= IPFS_BATCH_INTERVAL:
             self._flush_ipfs_batch()
 
-        # Process alerts
+        # Process alerts (cooldown is per station)
         for alert_info in alerts:
-            if self._alert_on_cooldown(alert_info["alert"]):
+            cooldown_key = f"{reading.device_id}:{alert_info['alert']}"
+            if self._alert_on_cooldown(cooldown_key, alert_info["level"]):
                 continue
-            self._record_alert_time(alert_info["alert"])
 
             level = alert_info["level"]
             alert_name = alert_info["alert"]
 
-            store_alert(
-                self.conn,
+            self._writer.put_alert(
                 alert_name,
                 level,
                 alert_info["value"],
                 alert_info["message_en"],
+                device_id=reading.device_id,
             )
 
             # Matrix notification
             matrix_msg = (
-                f"[BIO-{level}] {alert_info['message_es']}\n"
+                f"[BIO-{level}] {reading.device_id} {alert_info['message_es']}\n"
                 f"{alert_info['message_en']}\n"
                 f"Valor / Value: {alert_info['value']} "
                 f"(umbral / threshold: {alert_info['threshold']})"
@@ -630,11 +1412,12 @@ class BioLedger:
                 )
                 tx_hash = submit_emergency_proposal(alert_info)
                 if tx_hash:
-                    store_alert(
-                        self.conn, alert_name, level,
+                    self._writer.put_alert(
+                        alert_name, level,
                         alert_info["value"],
                         f"Governance proposal submitted: {tx_hash}",
                         governance_tx=tx_hash,
+                        device_id=reading.device_id,
                     )
                     send_matrix_alert_sync(
                         f"[GOVERNANCE] Propuesta de emergencia enviada: tx={tx_hash}"
@@ -662,20 +1445,55 @@ class BioLedger:
         def api_latest():
             limit = flask_request.args.get("limit", 10, type=int)
             limit = min(limit, 500)
-            readings = get_latest_readings(self.conn, limit)
+            device_id = flask_request.args.get("device")
+            readings = get_latest_readings(self._read_conn(), limit, device_id)
             return jsonify({"status": "ok", "count": len(readings), "readings": readings})
 
         @app.route("/api/bio/history", methods=["GET"])
         def api_history():
-            limit = flask_request.args.get("limit", 100, type=int)
-            limit = min(limit, 5000)
-            readings = get_latest_readings(self.conn, limit)
-            return jsonify({"status": "ok", "count": len(readings), "readings": readings})
+            args = flask_request.args
+            if not any(k in args for k in ("from", "to", "resolution")):
+                limit = args.get("limit", 100, type=int)
+                limit = min(limit, 5000)
+                readings = get_latest_readings(self._read_conn(), limit)
+                return jsonify({"status": "ok", "count": len(readings), "readings": readings})
+
+            try:
+                end = parse_time_arg(args.get("to")) or time.time()
+                start = parse_time_arg(args.get("from"))
+                if start is None:
+                    start = end - 86400
+            except ValueError as exc:
+                return jsonify({"status": "error", "error": f"bad time: {exc}"}), 400
+            if start > end:
+                return jsonify({"status": "error", "error": "from is after to"}), 400
+
+            resolution = args.get("resolution", "auto")
+            if resolution == "auto":
+                resolution = pick_resolution(start, end)
+            window = {
+                "from": datetime.fromtimestamp(start, timezone.utc).isoformat(),
+                "to": datetime.fromtimestamp(end, timezone.utc).isoformat(),
+                "resolution": resolution,
+            }
+            if resolution == "raw":
+                limit = min(args.get("limit", 5000, type=int), 5000)
+                readings = get_readings_between(self._read_conn(), start, end, limit)
+                return jsonify({"status": "ok", **window, "count": len(readings),
+                                "truncated": len(readings) >= limit, "readings": readings})
+            if resolution not in ROLLUP_RESOLUTIONS:
+                return jsonify({
+                    "status": "error",
+                    "error": f"resolution must be auto, raw or one of {list(ROLLUP_RESOLUTIONS)}",
+                }), 400
+            points = get_rollups(self._read_conn(), resolution, start, end)
+            return jsonify({"status": "ok", **window, "count": len(points),
+                            "truncated": len(points) >= HISTORY_MAX_POINTS, "points": points})
 
         @app.route("/api/bio/alerts", methods=["GET"])
         def api_alerts():
             limit = flask_request.args.get("limit", 50, type=int)
-            alerts = get_recent_alerts(self.conn, min(limit, 1000))
+            alerts = get_recent_alerts(self._read_conn(), min(limit, 1000))
             return jsonify({"status": "ok", "count": len(alerts), "alerts": alerts})
 
         @app.route("/api/bio/thresholds", methods=["GET"])
@@ -684,45 +1502,41 @@ class BioLedger:
 
         @app.route("/api/bio/status", methods=["GET"])
         def api_status():
-            serial_ok = (
-                self._serial_port is not None and self._serial_port.is_open
+            ingest = self._ingest.stats
+            serial_ok = any(
+                src["connected"] for src in ingest["sources"].values() if src["kind"] == "serial"
             )
-            readings = get_latest_readings(self.conn, 1)
+            readings = get_latest_readings(self._read_conn(), 1)
             last_reading = readings[0] if readings else None
             return jsonify({
                 "status": "ok",
                 "serial_connected": serial_ok,
-                "serial_port": BIO_SERIAL_PORT,
+                "serial_port": [port for port, _, _ in self._ingest.serial_specs],
+                "ingest": ingest,
+                "baseline": (
+                    self._detector.snapshot(last_reading.get("device_id", ""))
+                    if last_reading else None
+                ),
                 "last_reading": last_reading,
                 "pending_ipfs_batch": len(self._pending_ipfs_batch),
+                "writer": self._writer.stats,
             })
 
         @app.route("/api/bio/dashboard", methods=["GET"])
         def api_dashboard():
             """Visualization data for ConscienceDashboard integration."""
-            readings = get_latest_readings(self.conn, 100)
-            alerts = get_recent_alerts(self.conn, 20)
+            conn = self._read_conn()
+            readings = get_latest_readings(conn, 1)
+            alerts = get_recent_alerts(conn, 20)
             latest = readings[0] if readings else {}
-
-            # Compute simple stats
-            def avg_field(name):
-                vals = [r.get(name) for r in readings if r.get(name) is not None]
-                return round(sum(vals) / len(vals), 2) if vals else 0
+            averages, sample_count = get_recent_averages(conn, 100)
 
             return jsonify({
                 "status": "ok",
                 "current": latest,
-                "averages": {
-                    "soil_moisture": avg_field("soil_moisture"),
-                    "air_quality_aqi": avg_field("air_quality_aqi"),
-                    "temperature_c": avg_field("temperature_c"),
-                    "humidity_pct": avg_field("humidity_pct"),
-                    "co2_ppm": avg_field("co2_ppm"),
-                    "water_ph": avg_field("water_ph"),
-                    "uv_index": avg_field("uv_index"),
-                },
+                "averages": averages,
                 "recent_alerts": alerts,
-                "sample_count": len(readings),
+                "sample_count": sample_count,
             })
 
         return app
@@ -761,7 +1575,8 @@ class BioLedger:
         """Start all BioLedger subsystems."""
         logger.info("=" * 60)
         logger.info("  Ierahkwa Bio-Ledger starting")
-        logger.info("  Serial: %s @ %d baud", BIO_SERIAL_PORT, BIO_SERIAL_BAUD)
+        logger.info("  Serial: %s", BIO_SERIAL_PORTS or "(none)")
+        logger.info("  TCP/UDP: %s / %s", BIO_TCP_PORT or "off", BIO_UDP_PORT or "off")
         logger.info("  Database: %s", BIO_DB_PATH)
         logger.info("  REST API: http://0.0.0.0:%d", FLASK_PORT)
         logger.info("=" * 60)
@@ -772,9 +1587,9 @@ class BioLedger:
         flask_thread = threading.Thread(target=self._run_flask, daemon=True)
         flask_thread.start()
 
-        # Serial reader in background thread
-        serial_thread = threading.Thread(target=self._serial_reader_loop, daemon=True)
-        serial_thread.start()
+        # Serial/TCP/UDP ingestion in background thread
+        ingest_thread = threading.Thread(target=self._ingest_thread, daemon=True)
+        ingest_thread.start()
 
         # Matrix + async event loop in main thread
         loop = asyncio.new_event_loop()
@@ -788,12 +1603,11 @@ class BioLedger:
             logger.info("Shutting down on keyboard interrupt.")
         finally:
             self._running = False
-            if self._serial_port and self._serial_port.is_open:
-                self._serial_port.close()
+            self._ingest.stop()
             if _matrix_client:
                 loop.run_until_complete(_matrix_client.close())
             loop.close()
-            self.conn.close()
+            self._writer.close()
             logger.info("Bio-Ledger stopped.")
 
     async def _keepalive_loop(self) -> None:
@@ -810,6 +1624,17 @@ class BioLedger:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Ierahkwa Bio-Ledger")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("run", help="Run ingestion and the REST API (default)")
+    p_bench = sub.add_parser("benchmark", help="Replay stored readings through the anomaly detector")
+    p_bench.add_argument("--limit", type=int, default=100000, help="Readings to replay")
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        print(json.dumps(replay_anomaly_benchmark(BIO_DB_PATH, args.limit), indent=2))
+        return
+
     ledger = BioLedger()
     ledger.start()
 
@@ -16,6 +16,7 @@ NTFY_TOPIC          ntfy topic for drill alerts (default: ierahkwa-drill)
 NTFY_AUTH_TOKEN     Optional bearer token
 RESPONSE_TIMEOUT    Seconds to wait for guardian responses (default: 1800 = 30 min)
 GUARDIAN_LIST_PATH  Path to guardian list JSON (optional)
+DRILL_REGION        Region code to drill, e.g. MX or MX-OAX (default: all guardians)
 RESPONSE_LOG_PATH   Path to response log file (default: logs/drill_responses.jsonl)
 SIGNING_KEY         Hex-encoded HMAC-SHA256 key (optional)
 """
@@ -48,6 +49,7 @@ NTFY_TOPIC = os.environ.get("NTFY_TOPIC", "ierahkwa-drill")
 NTFY_AUTH_TOKEN = os.environ.get("NTFY_AUTH_TOKEN", "")
 RESPONSE_TIMEOUT = int(os.environ.get("RESPONSE_TIMEOUT", "1800"))
 GUARDIAN_LIST_PATH = os.environ.get("GUARDIAN_LIST_PATH", "")
+DRILL_REGION = os.environ.get("DRILL_REGION", "").strip()
 RESPONSE_LOG_PATH = Path(os.environ.get("RESPONSE_LOG_PATH", "logs/drill_responses.jsonl"))
 SIGNING_KEY = os.environ.get("SIGNING_KEY", "")
 
@@ -157,18 +159,42 @@ def send_drill_notification(drill_id: str, message: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def load_guardians() -> list[dict]:
-    """Load guardian list if available."""
+def load_guardians(region: str = DRILL_REGION) -> list[dict]:
+    """Load guardian list if available, limited to ``region`` when given.
+
+    Uses the cached registry shared with notify_guardians when importable,
+    so repeated lookups don't re-parse the file and regional drills use its
+    hierarchical region index (``MX`` matches ``MX-OAX``).
+    """
     if not GUARDIAN_LIST_PATH:
         return []
+    try:
+        from scripts.protocols.notify_guardians import get_registry
+    except ImportError:
+        try:
+            from notify_guardians import get_registry
+        except ImportError:
+            get_registry = None
+    if get_registry is not None:
+        registry = get_registry(GUARDIAN_LIST_PATH)
+        return registry.in_region(region) if region else registry.all()
+
     path = Path(GUARDIAN_LIST_PATH)
     if not path.exists():
         return []
     try:
         with open(path, "r", encoding="utf-8") as fh:
-            return json.load(fh)
+            guardians = json.load(fh)
     except (json.JSONDecodeError, OSError):
         return []
+    if not region:
+        return guardians
+    region = region.upper()
+    return [
+        g for g in guardians
+        if (g.get("region") or "").upper() == region
+        or (g.get("region") or "").upper().startswith(region + "-")
+    ]
 
 
 def collect_responses(drill_id: str, start_time: float) -> list[dict]:
@@ -224,6 +250,7 @@ def generate_report(drill_id: str, start_time: float, responses: list[dict]) ->
         "",
         f"Drill triggered at: {datetime.fromtimestamp(start_time, tz=timezone.utc).isoformat()}",
         f"Report generated at: {datetime.now(timezone.utc).isoformat()}",
+        f"Region: {DRILL_REGION or 'all'}",
         f"Total guardians: {total_guardians}",
         f"Responses received: {responded}",
         "",
@@ -286,6 +313,7 @@ def execute_drill() -> None:
 
     message = (
         f"[SIMULACRO] Drill ID: {drill_id}\n"
+        f"Region: {DRILL_REGION or 'all'}\n"
         f"Fecha: {today.isoformat()}\n"
         f"Hora UTC: {datetime.now(timezone.utc).strftime('%H:%M:%S')}\n\n"
         "ESTO ES UN SIMULACRO. Responda con su codigo de guardian "
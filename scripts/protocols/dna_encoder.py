@@ -35,8 +35,11 @@ Usage
     python3 dna_encoder.py decode   --input encoded.dna --output decoded.txt
     python3 dna_encoder.py encode-file --input document.pdf --output archive.dna
     python3 dna_encoder.py decode-file --input archive.dna --output document.pdf
-    python3 dna_encoder.py repository --output repo_archive/
+    python3 dna_encoder.py encode-file --stream --input backup.tar --output backup.dna
+    python3 dna_encoder.py decode-file --stream --input backup.dna --output backup.tar
+    python3 dna_encoder.py repository --output repo_archive/ --jobs 4
     python3 dna_encoder.py stats    --input encoded.dna
+    python3 dna_encoder.py benchmark --size-mb 4
 """
 
 import argparse
@@ -46,8 +49,10 @@ import logging
 import os
 import struct
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     from reedsolo import RSCodec
@@ -91,6 +96,21 @@ _rs_codec = RSCodec(DNA_RS_NSYM)
 # ---------------------------------------------------------------------------
 
 
+# Table-driven codec: every hex digit of a byte is exactly two nucleotides, so
+# encoding translates ``bytes.hex()`` once for the high pair and once for the
+# low pair and interleaves them with extended slices. Decoding validates with
+# a single delete-translate, maps ACGT to base-4 digits and lets ``int``
+# (linear time for power-of-two bases) rebuild the byte string.
+_HEX_DIGITS = b"0123456789abcdef"
+HEX_TO_NUC_HIGH = bytes.maketrans(
+    _HEX_DIGITS, bytes(ord(BITS_TO_NUC[value >> 2]) for value in range(16))
+)
+HEX_TO_NUC_LOW = bytes.maketrans(
+    _HEX_DIGITS, bytes(ord(BITS_TO_NUC[value & 0b11]) for value in range(16))
+)
+NUC_TO_BASE4 = bytes.maketrans(b"ACGT", b"0123")
+
+
 def encode_to_dna(data: bytes) -> str:
     """Convert bytes to a DNA nucleotide sequence (ACGT).
 
@@ -102,14 +122,11 @@ def encode_to_dna(data: bytes) -> str:
     Returns:
         String of A, C, G, T characters.
     """
-    nucleotides = []
-    for byte in data:
-        # Extract 4 pairs of 2 bits, MSB first
-        nucleotides.append(BITS_TO_NUC[(byte >> 6) & 0b11])
-        nucleotides.append(BITS_TO_NUC[(byte >> 4) & 0b11])
-        nucleotides.append(BITS_TO_NUC[(byte >> 2) & 0b11])
-        nucleotides.append(BITS_TO_NUC[byte & 0b11])
-    return "".join(nucleotides)
+    hex_digits = bytes(data).hex().encode("ascii")
+    nucleotides = bytearray(2 * len(hex_digits))
+    nucleotides[0::2] = hex_digits.translate(HEX_TO_NUC_HIGH)
+    nucleotides[1::2] = hex_digits.translate(HEX_TO_NUC_LOW)
+    return nucleotides.decode("ascii")
 
 
 def decode_from_dna(sequence: str) -> bytes:
@@ -134,21 +151,85 @@ def decode_from_dna(sequence: str) -> bytes:
             f"Cannot decode to whole bytes."
         )
 
+    # Non-ASCII code points become "?" one-for-one, so positions are preserved
+    raw = sequence.encode("ascii", "replace")
+    stray = raw.translate(None, b"ACGT")
+    if stray:
+        position = raw.index(stray[:1])
+        raise ValueError(
+            f"Invalid nucleotide '{sequence[position]}' at position {position}. "
+            f"Expected A, C, G, or T."
+        )
+
+    if not raw:
+        return b""
+    return int(raw.translate(NUC_TO_BASE4), 4).to_bytes(len(raw) // 4, "big")
+
+
+def _encode_to_dna_reference(data: bytes) -> str:
+    """Per-byte reference encoder, kept for benchmarking the table codec."""
+    nucleotides = []
+    for byte in data:
+        nucleotides.append(BITS_TO_NUC[(byte >> 6) & 0b11])
+        nucleotides.append(BITS_TO_NUC[(byte >> 4) & 0b11])
+        nucleotides.append(BITS_TO_NUC[(byte >> 2) & 0b11])
+        nucleotides.append(BITS_TO_NUC[byte & 0b11])
+    return "".join(nucleotides)
+
+
+def _decode_from_dna_reference(sequence: str) -> bytes:
+    """Per-nucleotide reference decoder, kept for benchmarking the table codec."""
     result = bytearray()
     for i in range(0, len(sequence), 4):
-        quad = sequence[i : i + 4]
         byte = 0
-        for j, nuc in enumerate(quad):
-            if nuc not in NUC_TO_BITS:
-                raise ValueError(
-                    f"Invalid nucleotide '{nuc}' at position {i + j}. "
-                    f"Expected A, C, G, or T."
-                )
+        for nuc in sequence[i : i + 4]:
             byte = (byte << 2) | NUC_TO_BITS[nuc]
         result.append(byte)
     return bytes(result)
 
 
+def benchmark_codec(size_mb: float = 4.0, rounds: int = 3) -> dict:
+    """Measure table-driven vs reference codec throughput on random data.
+
+    Args:
+        size_mb: Payload size in megabytes.
+        rounds: Timed rounds per codec; the best round is reported.
+
+    Returns:
+        Dict with MB/s for each codec direction and the speedup factors.
+    """
+    data = os.urandom(int(size_mb * 1024 * 1024))
+    sequence = encode_to_dna(data)
+    if _encode_to_dna_reference(data) != sequence:
+        raise AssertionError("Table codec output differs from reference encoder")
+    if decode_from_dna(sequence) != data:
+        raise AssertionError("Table codec failed to round-trip")
+
+    def best_of(func, arg) -> float:
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func(arg)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    mb = len(data) / (1024 * 1024)
+    timings = {
+        "encode_table": best_of(encode_to_dna, data),
+        "encode_reference": best_of(_encode_to_dna_reference, data),
+        "decode_table": best_of(decode_from_dna, sequence),
+        "decode_reference": best_of(_decode_from_dna_reference, sequence),
+    }
+    result = {
+        "size_mb": round(mb, 2),
+        **{f"{name}_mb_s": round(mb / secs, 2) for name, secs in timings.items()},
+        "encode_speedup": round(timings["encode_reference"] / timings["encode_table"], 1),
+        "decode_speedup": round(timings["decode_reference"] / timings["decode_table"], 1),
+    }
+    logger.info("Codec benchmark: %s", result)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Error correction (Reed-Solomon)
 # ---------------------------------------------------------------------------
@@ -206,7 +287,8 @@ FILE_MAGIC = b"\x44\x4e\x41\x31"  # "DNA1"
 HEADER_FIXED_SIZE = 4 + 4 + 32 + 2  # 42 bytes
 
 
-def encode_file(filepath: str, use_ecc: bool = True) -> str:
+def encode_file(filepath: str, use_ecc: bool = True,
+                checksum: Optional[bytes] = None) -> str:
     """Encode an entire file with header into a DNA sequence.
 
     The header contains magic number, file size, SHA-256 checksum,
@@ -215,6 +297,7 @@ def encode_file(filepath: str, use_ecc: bool = True) -> str:
     Args:
         filepath: Path to the file to encode.
         use_ecc: Whether to apply Reed-Solomon error correction.
+        checksum: SHA-256 digest of the file if the caller already has it.
 
     Returns:
         DNA nucleotide sequence string.
@@ -226,7 +309,8 @@ def encode_file(filepath: str, use_ecc: bool = True) -> str:
     file_data = path.read_bytes()
     filename = path.name.encode("utf-8")
 
-    checksum = hashlib.sha256(file_data).digest()
+    if checksum is None:
+        checksum = hashlib.sha256(file_data).digest()
 
     # Build header
     header = bytearray()
@@ -321,6 +405,299 @@ def decode_file(dna_sequence: str, output_path: str, use_ecc: bool = True) -> di
     return result
 
 
+# ---------------------------------------------------------------------------
+# Streaming file encoding / decoding
+# ---------------------------------------------------------------------------
+
+# Streaming archives are written as one FASTA record per fragment so that
+# multi-GB files never have to be held in memory. Every fragment is framed
+# and Reed-Solomon protected on its own, so a damaged fragment only loses
+# its own slice of the file.
+#
+# Fragment frame (before ECC):
+# - 4 bytes: fragment index (uint32 big-endian, 0 = stream header)
+# - 2 bytes: payload length (uint16 big-endian)
+# - payload bytes
+#
+# The stream header is written as STREAM_HEADER_COPIES leading records with
+# index 0, so a single damaged record cannot make the whole archive
+# unreadable; the decoder uses the first copy that survives.
+#
+# Stream header payload (fragment 0):
+# - 4 bytes: magic number (0x444E5331 = "DNS1")
+# - 8 bytes: original file size (uint64 big-endian)
+# - 4 bytes: number of data fragments (uint32 big-endian)
+# - 2 bytes: payload bytes per data fragment (uint16 big-endian)
+# - 32 bytes: SHA-256 checksum
+# - 2 bytes: filename length (uint16 big-endian)
+# - N bytes: filename (UTF-8, truncated to fit one fragment)
+
+STREAM_MAGIC = b"\x44\x4e\x53\x31"  # "DNS1"
+FRAGMENT_HEADER = struct.Struct(">IH")
+STREAM_HEADER = struct.Struct(">4sQIH32sH")
+STREAM_HEADER_COPIES = 3
+MAX_REPORTED_MISSING = 100
+RS_BLOCK_SIZE = 255  # reedsolo codeword length; longer frames are chunked
+
+
+def fragment_capacity(use_ecc: bool = True) -> int:
+    """Return the file bytes carried by one DNA_FRAGMENT_SIZE fragment.
+
+    With ECC, reedsolo splits a frame into codewords of RS_BLOCK_SIZE
+    bytes, each carrying DNA_RS_NSYM parity symbols, so every started
+    codeword costs its own parity.
+
+    Raises:
+        ValueError: If DNA_FRAGMENT_SIZE is too small for the frame and ECC.
+    """
+    frame_bytes = DNA_FRAGMENT_SIZE // 4
+    if use_ecc:
+        blocks, rest = divmod(frame_bytes, RS_BLOCK_SIZE)
+        frame_bytes = blocks * (RS_BLOCK_SIZE - DNA_RS_NSYM) + max(rest - DNA_RS_NSYM, 0)
+    capacity = frame_bytes - FRAGMENT_HEADER.size
+    if capacity <= 0:
+        raise ValueError(
+            f"DNA_FRAGMENT_SIZE={DNA_FRAGMENT_SIZE} leaves no room for payload "
+            f"(ECC: {'yes' if use_ecc else 'no'})"
+        )
+    return min(capacity, 0xFFFF)
+
+
+def _encode_fragment(index: int, payload: bytes, use_ecc: bool) -> str:
+    """Frame, protect and encode a single fragment."""
+    frame = FRAGMENT_HEADER.pack(index, len(payload)) + payload
+    if use_ecc:
+        frame = encode_with_ecc(frame)
+    return encode_to_dna(frame)
+
+
+def _decode_fragment(sequence: str, use_ecc: bool) -> tuple:
+    """Decode a single fragment into ``(index, payload)``."""
+    frame = decode_from_dna(sequence)
+    if use_ecc:
+        frame = decode_with_ecc(frame)
+    if len(frame) < FRAGMENT_HEADER.size:
+        raise ValueError("Fragment too short to contain a frame header")
+    index, length = FRAGMENT_HEADER.unpack_from(frame)
+    payload = frame[FRAGMENT_HEADER.size : FRAGMENT_HEADER.size + length]
+    if len(payload) != length:
+        raise ValueError(f"Fragment {index} truncated: {len(payload)}/{length} bytes")
+    return index, payload
+
+
+def _write_fasta_record(handle, name: str, index: int, sequence: str) -> None:
+    """Write one fragment as a FASTA record wrapped at 80 columns."""
+    handle.write(f">IERAHKWA|{name}|F{index:06d}|{len(sequence)}nt\n")
+    for i in range(0, len(sequence), 80):
+        handle.write(sequence[i : i + 80] + "\n")
+
+
+def _iter_fasta_records(filepath: str) -> Iterator[str]:
+    """Yield the sequence of each FASTA record, one record in memory at a time."""
+    lines = []
+    with open(filepath) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(">"):
+                if lines:
+                    yield "".join(lines)
+                lines = []
+            else:
+                lines.append(line)
+    if lines:
+        yield "".join(lines)
+
+
+def _sha256_file(path: Path, block_size: int = 1 << 20) -> bytes:
+    """SHA-256 a file in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def encode_file_stream(filepath: str, output_path: str, use_ecc: bool = True) -> dict:
+    """Encode a file into a fragmented FASTA archive with bounded memory.
+
+    The input is read once to compute its checksum and once more in
+    fragment-sized blocks; each block is framed, Reed-Solomon encoded
+    and written as its own FASTA record.
+
+    Args:
+        filepath: Path to the file to encode.
+        output_path: Where to write the FASTA archive.
+        use_ecc: Whether to apply Reed-Solomon error correction per fragment.
+
+    Returns:
+        Dict with filename, size, fragment count, nucleotides and checksum.
+    """
+    path = Path(filepath)
+    if not path.is_file():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    capacity = fragment_capacity(use_ecc)
+    if capacity < STREAM_HEADER.size:
+        raise ValueError(
+            f"DNA_FRAGMENT_SIZE={DNA_FRAGMENT_SIZE} is too small for the stream header"
+        )
+    file_size = path.stat().st_size
+    fragment_count = -(-file_size // capacity)
+    checksum = _sha256_file(path)
+    # Keep the header within one fragment
+    filename = path.name.encode("utf-8")[: capacity - STREAM_HEADER.size]
+    filename = filename.decode("utf-8", errors="ignore").encode("utf-8")
+
+    header = STREAM_HEADER.pack(
+        STREAM_MAGIC, file_size, fragment_count, capacity, checksum, len(filename)
+    ) + filename
+
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    nucleotides = 0
+
+    with open(path, "rb") as src, open(out, "w") as dst:
+        sequence = _encode_fragment(0, header, use_ecc)
+        for _ in range(STREAM_HEADER_COPIES):
+            _write_fasta_record(dst, path.name, 0, sequence)
+            nucleotides += len(sequence)
+
+        for index in range(1, fragment_count + 1):
+            block = src.read(capacity)
+            if not block:
+                raise ValueError(f"File '{path.name}' shrank while being encoded")
+            sequence = _encode_fragment(index, block, use_ecc)
+            _write_fasta_record(dst, path.name, index, sequence)
+            nucleotides += len(sequence)
+
+    logger.info(
+        "Stream-encoded file '%s': %d bytes -> %d fragments, %d nucleotides (ECC: %s)",
+        path.name,
+        file_size,
+        fragment_count,
+        nucleotides,
+        "yes" if use_ecc else "no",
+    )
+
+    return {
+        "filename": path.name,
+        "size": file_size,
+        "fragments": fragment_count,
+        "nucleotides": nucleotides,
+        "checksum_sha256": checksum.hex(),
+    }
+
+
+def decode_file_stream(input_path: str, output_path: str, use_ecc: bool = True) -> dict:
+    """Reconstruct a file from a fragmented FASTA archive with bounded memory.
+
+    Fragments are written at their own offsets, so records may arrive in
+    any order after the stream header. The first stream header copy that
+    decodes is used; further copies are ignored. Unrecoverable fragments
+    are skipped and reported instead of aborting the whole restore.
+
+    Args:
+        input_path: FASTA archive written by ``encode_file_stream``.
+        output_path: Where to write the decoded file.
+        use_ecc: Whether Reed-Solomon was applied during encoding.
+
+    Returns:
+        Dict with filename, size, checksum, verification status and the
+        indices of missing or damaged fragments.
+    """
+    records = _iter_fasta_records(input_path)
+    header = None
+    damaged_records = 0
+    for position, sequence in enumerate(records, start=1):
+        try:
+            index, payload = _decode_fragment(sequence, use_ecc)
+        except Exception as exc:
+            logger.warning("Record %d unrecoverable, skipping: %s", position, exc)
+            damaged_records += 1
+            continue
+        if index != 0 or len(payload) < STREAM_HEADER.size:
+            raise ValueError(f"Record {position} is not a stream header")
+        header = payload
+        break
+    if header is None:
+        raise ValueError(f"No readable stream header in {input_path}")
+
+    magic, file_size, fragment_count, capacity, stored_checksum, filename_len = (
+        STREAM_HEADER.unpack_from(header)
+    )
+    if magic != STREAM_MAGIC:
+        raise ValueError(
+            f"Invalid magic number: {magic.hex()} (expected {STREAM_MAGIC.hex()})"
+        )
+    filename = header[STREAM_HEADER.size : STREAM_HEADER.size + filename_len].decode(
+        "utf-8"
+    )
+
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    received = bytearray(fragment_count)
+
+    with open(out, "wb") as dst:
+        dst.truncate(file_size)
+        for position, sequence in enumerate(records, start=position + 1):
+            try:
+                index, payload = _decode_fragment(sequence, use_ecc)
+            except Exception as exc:
+                logger.warning("Record %d unrecoverable, skipping: %s", position, exc)
+                damaged_records += 1
+                continue
+            if index == 0:
+                continue  # Redundant stream header copy
+            if not 1 <= index <= fragment_count:
+                logger.warning("Record %d has out-of-range index %d", position, index)
+                damaged_records += 1
+                continue
+            dst.seek((index - 1) * capacity)
+            dst.write(payload)
+            received[index - 1] = 1
+
+    missing = []
+    missing_count = received.count(0)
+    pos = received.find(0)
+    while pos != -1 and len(missing) < MAX_REPORTED_MISSING:
+        missing.append(pos + 1)
+        pos = received.find(0, pos + 1)
+
+    computed_checksum = _sha256_file(out)
+    checksum_ok = computed_checksum == stored_checksum
+
+    result = {
+        "filename": filename,
+        "size": out.stat().st_size,
+        "expected_size": file_size,
+        "fragments": fragment_count,
+        "damaged_records": damaged_records,
+        "missing_fragments": missing,
+        "missing_fragment_count": missing_count,
+        "checksum_sha256": computed_checksum.hex(),
+        "checksum_verified": checksum_ok,
+    }
+
+    if checksum_ok:
+        logger.info(
+            "Stream-decoded file '%s': %d bytes, %d fragments, checksum OK",
+            filename,
+            file_size,
+            fragment_count,
+        )
+    else:
+        logger.warning(
+            "Stream-decoded file '%s': CHECKSUM MISMATCH (%d of %d fragments missing)",
+            filename,
+            missing_count,
+            fragment_count,
+        )
+
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Repository encoding
 # ---------------------------------------------------------------------------
@@ -337,15 +714,98 @@ CRITICAL_FILES = [
 ]
 
 
-def encode_repository(base_dir: str = ".", output_dir: str = None) -> dict:
+# Bump whenever encode_file output changes for the same input and settings,
+# so manifests written by older encoders stop matching.
+DNA_ENCODER_VERSION = 1
+
+
+def _manifest_header() -> dict:
+    """Manifest fields describing how the DNA files were produced."""
+    return {
+        "version": "1.0",
+        "encoder": "ierahkwa-dna-encoder",
+        "encoder_version": DNA_ENCODER_VERSION,
+        "encoding": "2bit-ACGT",
+        "ecc": f"Reed-Solomon (nsym={DNA_RS_NSYM})",
+        "fragment_size": DNA_FRAGMENT_SIZE,
+    }
+
+
+def _load_manifest_index(manifest_path: Path) -> dict:
+    """Map source path -> manifest entry from a previous repository run.
+
+    Returns an empty index when the previous manifest was written with a
+    different encoder version or encoding settings, since its DNA files
+    would not match what this run produces.
+    """
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path) as f:
+            previous = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable manifest %s: %s", manifest_path, exc)
+        return {}
+    header = _manifest_header()
+    if any(previous.get(key) != value for key, value in header.items()):
+        logger.info("Manifest %s was written with different settings; re-encoding all files",
+                    manifest_path)
+        return {}
+    return {entry["source"]: entry for entry in previous.get("files", [])}
+
+
+def _encode_repository_file(rel_path: str, filepath: str, out_dir: str,
+                            checksum: str) -> tuple:
+    """Encode one repository file to FASTA; runs inside pool workers.
+
+    Returns:
+        Tuple of (result dict, manifest entry).
+    """
+    path = Path(filepath)
+    dna_seq = encode_file(filepath, use_ecc=True, checksum=bytes.fromhex(checksum))
+    stats = compute_statistics(dna_seq)
+
+    dna_filename = path.stem + ".dna"
+    dna_path = Path(out_dir) / dna_filename
+
+    # Write in FASTA-like format
+    with open(dna_path, "w") as f:
+        f.write(f">IERAHKWA|{path.name}|{stats['length_nt']}nt\n")
+        # Write in lines of 80 characters
+        for i in range(0, len(dna_seq), 80):
+            f.write(dna_seq[i : i + 80] + "\n")
+
+    result = {
+        "status": "encoded",
+        "output": str(dna_path),
+        "nucleotides": stats["length_nt"],
+        "gc_content": stats["gc_content_pct"],
+        "max_homopolymer": stats["max_homopolymer"],
+    }
+    entry = {
+        "source": rel_path,
+        "dna_file": dna_filename,
+        "nucleotides": stats["length_nt"],
+        "bytes": stats["length_bytes"],
+        "checksum_sha256": checksum,
+    }
+    return result, entry
+
+
+def encode_repository(base_dir: str = ".", output_dir: str = None,
+                      jobs: int = 1, force: bool = False) -> dict:
     """Encode all critical Ierahkwa repository files into DNA sequences.
 
     Each file is encoded separately with its own header and ECC.
-    A manifest JSON file is also generated.
+    A manifest JSON file is also generated. Files whose SHA-256 matches
+    the previous manifest and whose DNA file still exists are skipped,
+    so repeated runs only re-encode new or modified files.
 
     Args:
         base_dir: Root directory of the repository.
         output_dir: Directory to write DNA files (default: DNA_OUTPUT_DIR).
+        jobs: Number of worker processes (1 = encode in-process).
+        force: Re-encode every file even if unchanged.
 
     Returns:
         Dict with encoding results for each file.
@@ -354,14 +814,12 @@ def encode_repository(base_dir: str = ".", output_dir: str = None) -> dict:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     base = Path(base_dir)
+    manifest_path = out_dir / "manifest.json"
+    previous = {} if force else _load_manifest_index(manifest_path)
     results = {}
-    manifest = {
-        "version": "1.0",
-        "encoder": "ierahkwa-dna-encoder",
-        "encoding": "2bit-ACGT",
-        "ecc": f"Reed-Solomon (nsym={DNA_RS_NSYM})",
-        "files": [],
-    }
+    entries = {}
+    pending = []
+    manifest = {**_manifest_header(), "files": []}
 
     for rel_path in CRITICAL_FILES:
         filepath = base / rel_path
@@ -370,57 +828,69 @@ def encode_repository(base_dir: str = ".", output_dir: str = None) -> dict:
             results[rel_path] = {"status": "not_found"}
             continue
 
-        try:
-            dna_seq = encode_file(str(filepath), use_ecc=True)
-            stats = compute_statistics(dna_seq)
-
-            # Write DNA sequence to file
-            dna_filename = filepath.stem + ".dna"
-            dna_path = out_dir / dna_filename
-
-            # Write in FASTA-like format
-            with open(dna_path, "w") as f:
-                f.write(f">IERAHKWA|{filepath.name}|{stats['length_nt']}nt\n")
-                # Write in lines of 80 characters
-                for i in range(0, len(dna_seq), 80):
-                    f.write(dna_seq[i : i + 80] + "\n")
-
+        checksum = _sha256_file(filepath).hex()
+        cached = previous.get(rel_path)
+        if (
+            cached
+            and cached.get("checksum_sha256") == checksum
+            and (out_dir / cached["dna_file"]).is_file()
+        ):
             results[rel_path] = {
-                "status": "encoded",
-                "output": str(dna_path),
-                "nucleotides": stats["length_nt"],
-                "gc_content": stats["gc_content_pct"],
-                "max_homopolymer": stats["max_homopolymer"],
+                "status": "unchanged",
+                "output": str(out_dir / cached["dna_file"]),
+                "nucleotides": cached["nucleotides"],
             }
+            entries[rel_path] = cached
+            continue
 
-            manifest["files"].append(
-                {
-                    "source": rel_path,
-                    "dna_file": dna_filename,
-                    "nucleotides": stats["length_nt"],
-                    "bytes": stats["length_bytes"],
-                    "checksum_sha256": hashlib.sha256(
-                        filepath.read_bytes()
-                    ).hexdigest(),
-                }
-            )
-
-            logger.info(
-                "Repository encode: %s -> %s (%d nt)",
-                rel_path,
-                dna_filename,
-                stats["length_nt"],
-            )
+        pending.append((rel_path, str(filepath), str(out_dir), checksum))
+
+    def record(rel_path: str, outcome) -> None:
+        result, entry = outcome
+        results[rel_path] = result
+        entries[rel_path] = entry
+        logger.info(
+            "Repository encode: %s -> %s (%d nt)",
+            rel_path,
+            entry["dna_file"],
+            entry["nucleotides"],
+        )
 
-        except Exception as exc:
-            logger.error("Failed to encode %s: %s", rel_path, exc)
-            results[rel_path] = {"status": "error", "error": str(exc)}
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+            futures = {
+                pool.submit(_encode_repository_file, *task): task[0]
+                for task in pending
+            }
+            for future in as_completed(futures):
+                rel_path = futures[future]
+                try:
+                    record(rel_path, future.result())
+                except Exception as exc:
+                    logger.error("Failed to encode %s: %s", rel_path, exc)
+                    results[rel_path] = {"status": "error", "error": str(exc)}
+    else:
+        for task in pending:
+            try:
+                record(task[0], _encode_repository_file(*task))
+            except Exception as exc:
+                logger.error("Failed to encode %s: %s", task[0], exc)
+                results[task[0]] = {"status": "error", "error": str(exc)}
+
+    # Keep manifest and results in CRITICAL_FILES order regardless of completion order
+    manifest["files"] = [entries[p] for p in CRITICAL_FILES if p in entries]
+    results = {p: results[p] for p in CRITICAL_FILES}
 
     # Write manifest
-    manifest_path = out_dir / "manifest.json"
     with open(manifest_path, "w") as f:
         json.dump(manifest, f, indent=2)
-    logger.info("Repository manifest written to %s", manifest_path)
+    statuses = [r["status"] for r in results.values()]
+    logger.info(
+        "Repository manifest written to %s (%d encoded, %d unchanged)",
+        manifest_path,
+        statuses.count("encoded"),
+        statuses.count("unchanged"),
+    )
 
     return results
 
@@ -636,12 +1106,20 @@ def build_parser() -> argparse.ArgumentParser:
         default="raw",
         help="Output format (default: raw)",
     )
+    p_ef.add_argument(
+        "--stream",
+        action="store_true",
+        help="Fragment-by-fragment encoding with bounded memory (raw format only)",
+    )
 
     # decode-file
     p_df = subparsers.add_parser("decode-file", help="Reconstruct a file from DNA sequence")
     p_df.add_argument("--input", "-i", required=True, help="Input DNA file (.dna)")
     p_df.add_argument("--output", "-o", required=True, help="Output reconstructed file")
     p_df.add_argument("--no-ecc", action="store_true", help="Disable Reed-Solomon ECC")
+    p_df.add_argument(
+        "--stream", action="store_true", help="Decode a fragmented stream archive"
+    )
 
     # repository
     p_repo = subparsers.add_parser(
@@ -653,11 +1131,28 @@ def build_parser() -> argparse.ArgumentParser:
     p_repo.add_argument(
         "--output", "-o", default=None, help="Output directory for DNA files"
     )
+    p_repo.add_argument(
+        "--jobs", "-j", type=int, default=1, help="Parallel worker processes (default: 1)"
+    )
+    p_repo.add_argument(
+        "--force", action="store_true", help="Re-encode files even if unchanged"
+    )
 
     # stats
     p_stats = subparsers.add_parser("stats", help="Show statistics for a DNA file")
     p_stats.add_argument("--input", "-i", required=True, help="Input DNA file (.dna)")
 
+    # benchmark
+    p_bench = subparsers.add_parser(
+        "benchmark", help="Compare codec throughput against the reference loop"
+    )
+    p_bench.add_argument(
+        "--size-mb", type=float, default=4.0, help="Payload size in MB (default: 4)"
+    )
+    p_bench.add_argument(
+        "--rounds", type=int, default=3, help="Timed rounds per codec (default: 3)"
+    )
+
     return parser
 
 
@@ -699,6 +1194,16 @@ def main():
         Path(args.output).write_bytes(raw)
         logger.info("Decoded %d nucleotides -> %d bytes", len(dna_seq), len(raw))
 
+    elif args.command == "encode-file" and args.stream:
+        if args.format != "raw":
+            parser.error("--stream only supports the raw output format")
+        result = encode_file_stream(args.input, args.output, use_ecc=not args.no_ecc)
+        print(f"\nStream-encoded file: {result['filename']}")
+        print(f"  Size: {result['size']:,} bytes")
+        print(f"  Fragments: {result['fragments']:,}")
+        print(f"  Nucleotides: {result['nucleotides']:,}")
+        print(f"  SHA-256: {result['checksum_sha256']}")
+
     elif args.command == "encode-file":
         dna_seq = encode_file(args.input, use_ecc=not args.no_ecc)
 
@@ -716,6 +1221,15 @@ def main():
         stats = compute_statistics(dna_seq)
         print_statistics(stats)
 
+    elif args.command == "decode-file" and args.stream:
+        result = decode_file_stream(args.input, args.output, use_ecc=not args.no_ecc)
+        print(f"\nDecoded file: {result['filename']}")
+        print(f"  Size: {result['size']:,} bytes")
+        print(f"  Fragments: {result['fragments']:,} "
+              f"({result['missing_fragment_count']:,} missing or damaged)")
+        print(f"  SHA-256: {result['checksum_sha256']}")
+        print(f"  Checksum verified: {result['checksum_verified']}")
+
     elif args.command == "decode-file":
         dna_seq = read_dna_file(args.input)
         result = decode_file(dna_seq, args.output, use_ecc=not args.no_ecc)
@@ -725,7 +1239,9 @@ def main():
         print(f"  Checksum verified: {result['checksum_verified']}")
 
     elif args.command == "repository":
-        results = encode_repository(args.base_dir, args.output)
+        results = encode_repository(
+            args.base_dir, args.output, jobs=args.jobs, force=args.force
+        )
         print("\n=== Repository Encoding Results ===")
         for path, info in results.items():
             status = info.get("status", "unknown")
@@ -734,6 +1250,8 @@ def main():
                     f"  [OK]   {path} -> {info['nucleotides']:,} nt "
                     f"(GC: {info['gc_content']:.1f}%)"
                 )
+            elif status == "unchanged":
+                print(f"  [SAME] {path} -> {info['nucleotides']:,} nt (unchanged)")
             elif status == "not_found":
                 print(f"  [SKIP] {path} (file not found)")
             else:
@@ -744,6 +1262,17 @@ def main():
         stats = compute_statistics(dna_seq)
         print_statistics(stats)
 
+    elif args.command == "benchmark":
+        result = benchmark_codec(args.size_mb, args.rounds)
+        print(f"\n=== DNA Codec Benchmark ({result['size_mb']} MB) ===")
+        print(f"  Encode (table):     {result['encode_table_mb_s']:>10.2f} MB/s")
+        print(f"  Encode (reference): {result['encode_reference_mb_s']:>10.2f} MB/s")
+        print(f"  Decode (table):     {result['decode_table_mb_s']:>10.2f} MB/s")
+        print(f"  Decode (reference): {result['decode_reference_mb_s']:>10.2f} MB/s")
+        print(f"  Speedup:            encode x{result['encode_speedup']}, "
+              f"decode x{result['decode_speedup']}")
+        print()
+
     else:
         parser.print_help()
         sys.exit(1)
@@ -23,6 +23,19 @@ SENTINEL_LOG_PATH       JSON report path           (default: /var/log/ierahkwa/s
 LORA_SERIAL_PORT        LoRa device port           (default: /dev/ttyUSB0)
 BIO_SERIAL_PORT         Bio sensor port            (default: /dev/ttyUSB1)
 RESOURCE_WARN_PCT       Resource warning threshold (default: 80)
+SENTINEL_CHECK_TIMEOUT  Per-check deadline, seconds (default: 20)
+SENTINEL_BUDGET_S       Overall check budget, secs (default: 30)
+SENTINEL_DB_PATH        Time-series SQLite store   (default: SENTINEL_LOG_PATH with .db)
+SENTINEL_RAW_DAYS       Keep per-run samples, days (default: 14)
+SENTINEL_HOURLY_DAYS    Keep hourly rollups, days  (default: 365)
+SENTINEL_TREND_DAYS     Trend/percentile window    (default: 7)
+SENTINEL_FORECAST_DAYS  Warn if full within N days (default: 30)
+SENTINEL_FORECAST_MIN_HOURS
+                        History needed for a forecast (default: 48)
+SENTINEL_FORECAST_MIN_R2
+                        Fit quality (R^2) needed for a forecast (default: 0.8)
+SENTINEL_FLAP_FLIPS     OK/FAIL flips in the window
+                        that mark a check flapping (default: 4)
 """
 
 import asyncio
@@ -30,8 +43,10 @@ import json
 import logging
 import os
 import socket
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -62,6 +77,11 @@ try:
 except ImportError:
     sys.exit("requests is required: pip install requests")
 
+try:
+    from scripts.protocols.alert_limiter import GLOBAL_REGION, get_limiter
+except ImportError:
+    from alert_limiter import GLOBAL_REGION, get_limiter
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -84,6 +104,21 @@ SENTINEL_LOG_PATH = Path(
 LORA_SERIAL_PORT = os.environ.get("LORA_SERIAL_PORT", "/dev/ttyUSB0")
 BIO_SERIAL_PORT = os.environ.get("BIO_SERIAL_PORT", "/dev/ttyUSB1")
 RESOURCE_WARN_PCT = int(os.environ.get("RESOURCE_WARN_PCT", "80"))
+SENTINEL_CHECK_TIMEOUT = float(os.environ.get("SENTINEL_CHECK_TIMEOUT", "20"))
+SENTINEL_BUDGET_S = float(os.environ.get("SENTINEL_BUDGET_S", "30"))
+# Per-call timeout for the blocking I/O inside a check (RPC, HTTP,
+# subprocess), so a check abandoned at its deadline also ends soon after
+CHECK_IO_TIMEOUT = min(15.0, SENTINEL_CHECK_TIMEOUT, SENTINEL_BUDGET_S)
+SENTINEL_DB_PATH = Path(
+    os.environ.get("SENTINEL_DB_PATH", str(SENTINEL_LOG_PATH.with_suffix(".db")))
+)
+SENTINEL_RAW_DAYS = float(os.environ.get("SENTINEL_RAW_DAYS", "14"))
+SENTINEL_HOURLY_DAYS = float(os.environ.get("SENTINEL_HOURLY_DAYS", "365"))
+SENTINEL_TREND_DAYS = float(os.environ.get("SENTINEL_TREND_DAYS", "7"))
+SENTINEL_FORECAST_DAYS = float(os.environ.get("SENTINEL_FORECAST_DAYS", "30"))
+SENTINEL_FORECAST_MIN_HOURS = float(os.environ.get("SENTINEL_FORECAST_MIN_HOURS", "48"))
+SENTINEL_FORECAST_MIN_R2 = float(os.environ.get("SENTINEL_FORECAST_MIN_R2", "0.8"))
+SENTINEL_FLAP_FLIPS = int(os.environ.get("SENTINEL_FLAP_FLIPS", "4"))
 
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 SENTINEL_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -153,6 +188,24 @@ def check_tcp_service(host: str, port: int, timeout: float = 3.0) -> dict:
         return {"status": STATUS_FAIL, "detail": str(exc)}
 
 
+async def check_tcp_service_async(host: str, port: int, timeout: float = 3.0) -> dict:
+    """Non-blocking variant of check_tcp_service for the parallel runner."""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return {"status": STATUS_OK, "detail": f"Port {port} open"}
+    except asyncio.TimeoutError:
+        return {"status": STATUS_FAIL, "detail": f"Port {port} timeout"}
+    except ConnectionRefusedError:
+        return {"status": STATUS_FAIL, "detail": f"Port {port} refused"}
+    except Exception as exc:
+        return {"status": STATUS_FAIL, "detail": str(exc)}
+
+
 def check_serial_device(path: str) -> dict:
     """Check if a serial device file exists."""
     if Path(path).exists():
@@ -167,7 +220,7 @@ def check_meshtastic_gateway() -> dict:
             ["meshtastic", "--info"],
             capture_output=True,
             text=True,
-            timeout=15,
+            timeout=CHECK_IO_TIMEOUT,
         )
         if result.returncode == 0:
             return {"status": STATUS_OK, "detail": "Meshtastic gateway responsive"}
@@ -225,7 +278,8 @@ def check_blockchain_health() -> dict:
         return {"status": STATUS_SKIP, "detail": "web3.py not installed"}
 
     try:
-        w3 = Web3(Web3.HTTPProvider(MAMEYNODE_RPC))
+        w3 = Web3(Web3.HTTPProvider(MAMEYNODE_RPC,
+                                    request_kwargs={"timeout": CHECK_IO_TIMEOUT}))
         if not w3.is_connected():
             return {"status": STATUS_FAIL, "detail": "MameyNode not connected"}
 
@@ -321,7 +375,8 @@ def check_guardian_count() -> dict:
         return {"status": STATUS_SKIP, "detail": "web3.py not installed"}
 
     try:
-        w3 = Web3(Web3.HTTPProvider(MAMEYNODE_RPC))
+        w3 = Web3(Web3.HTTPProvider(MAMEYNODE_RPC,
+                                    request_kwargs={"timeout": CHECK_IO_TIMEOUT}))
         if not w3.is_connected():
             return {"status": STATUS_FAIL, "detail": "MameyNode not connected"}
 
@@ -354,7 +409,7 @@ def check_ipfs_storage() -> dict:
         resp = http_requests.post(
             f"{IPFS_API_URL}/api/v0/pin/ls",
             params={"type": "recursive"},
-            timeout=15,
+            timeout=CHECK_IO_TIMEOUT,
         )
         if resp.status_code != 200:
             return {"status": STATUS_FAIL, "detail": f"IPFS pin/ls returned {resp.status_code}"}
@@ -363,10 +418,14 @@ def check_ipfs_storage() -> dict:
         pin_count = len(keys)
 
         # Repo stat
-        resp = http_requests.post(f"{IPFS_API_URL}/api/v0/repo/stat", timeout=15)
+        resp = http_requests.post(f"{IPFS_API_URL}/api/v0/repo/stat",
+                                  timeout=CHECK_IO_TIMEOUT)
         repo_size = 0
+        storage_max = 0
         if resp.status_code == 200:
-            repo_size = resp.json().get("RepoSize", 0)
+            stat = resp.json()
+            repo_size = stat.get("RepoSize", 0)
+            storage_max = stat.get("StorageMax", 0)
 
         # Human-readable
         size_human = _human_bytes(repo_size)
@@ -377,6 +436,7 @@ def check_ipfs_storage() -> dict:
             "pin_count": pin_count,
             "repo_size_bytes": repo_size,
             "repo_size_human": size_human,
+            "storage_max_bytes": storage_max,
         }
 
     except Exception as exc:
@@ -396,8 +456,65 @@ def _human_bytes(n: int) -> str:
 # ---------------------------------------------------------------------------
 
 
-def run_all_checks() -> dict:
-    """Execute all health checks and return structured results."""
+def _in_daemon_thread(loop: asyncio.AbstractEventLoop, func, *args) -> asyncio.Future:
+    """Run a blocking check on its own daemon thread.
+
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined at
+    interpreter exit, so a check abandoned at its deadline cannot keep the
+    sentinel process alive past the budget.
+    """
+    future = loop.create_future()
+
+    def deliver(ok: bool, value) -> None:
+        if not future.done():
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def target() -> None:
+        try:
+            outcome = (True, func(*args))
+        except Exception as exc:
+            outcome = (False, exc)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            pass  # loop already closed: the check was abandoned
+
+    threading.Thread(target=target, name=f"sentinel-{func.__name__}", daemon=True).start()
+    return future
+
+
+async def _timed_check(check, deadline: float) -> dict:
+    """Run one check (coroutine, or sync callable in a worker thread).
+
+    The result gets a ``duration_ms`` field.  A check that overruns its
+    deadline is reported as FAIL; its worker thread is abandoned.
+    """
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(check, timeout=deadline)
+    except asyncio.TimeoutError:
+        result = {"status": STATUS_FAIL, "detail": f"Check timed out after {deadline:g}s"}
+    except Exception as exc:
+        result = {"status": STATUS_FAIL, "detail": str(exc)}
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+async def run_all_checks_async(
+    check_timeout: float = SENTINEL_CHECK_TIMEOUT, budget: float = SENTINEL_BUDGET_S,
+) -> dict:
+    """Execute all health checks concurrently and return structured results.
+
+    TCP probes use asyncio sockets; the blocking checks (subprocess, web3,
+    IPFS HTTP, psutil) each run on a daemon thread with their own I/O
+    timeouts (CHECK_IO_TIMEOUT).  Every check is bounded by
+    ``min(check_timeout, budget)``, so wall time is that of the slowest
+    check and never exceeds the overall budget, and abandoned checks do
+    not delay process exit.
+    """
     timestamp = datetime.now(timezone.utc).isoformat()
     results = {
         "timestamp": timestamp,
@@ -410,30 +527,37 @@ def run_all_checks() -> dict:
         "ipfs": {},
     }
 
-    # TCP services
-    for svc in TCP_SERVICES:
-        check = check_tcp_service(svc["host"], svc["port"])
-        results["services"][svc["name"]] = check
-
-    # Serial devices
-    for dev in SERIAL_DEVICES:
-        check = check_serial_device(dev["path"])
-        results["serial_devices"][dev["name"]] = check
-
-    # Meshtastic gateway
-    results["meshtastic"] = check_meshtastic_gateway()
-
-    # System resources
-    results["resources"] = check_system_resources()
+    loop = asyncio.get_running_loop()
+    deadline = min(check_timeout, budget)
 
-    # Blockchain health
-    results["blockchain"] = check_blockchain_health()
+    def in_thread(func, *args):
+        return _in_daemon_thread(loop, func, *args)
 
-    # Guardian count
-    results["guardians"] = check_guardian_count()
+    # (result slot, awaitable); slot is (category, name) or (category, None)
+    checks = []
+    for svc in TCP_SERVICES:
+        checks.append((("services", svc["name"]),
+                       check_tcp_service_async(svc["host"], svc["port"])))
+    for dev in SERIAL_DEVICES:
+        checks.append((("serial_devices", dev["name"]),
+                       in_thread(check_serial_device, dev["path"])))
+    checks.append((("meshtastic", None), in_thread(check_meshtastic_gateway)))
+    checks.append((("resources", None), in_thread(check_system_resources)))
+    checks.append((("blockchain", None), in_thread(check_blockchain_health)))
+    checks.append((("guardians", None), in_thread(check_guardian_count)))
+    checks.append((("ipfs", None), in_thread(check_ipfs_storage)))
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(_timed_check(check, deadline) for _, check in checks)
+    )
+    wall_ms = round((time.perf_counter() - start) * 1000, 1)
 
-    # IPFS storage
-    results["ipfs"] = check_ipfs_storage()
+    for ((category, name), _), outcome in zip(checks, outcomes):
+        if name is None:
+            results[category] = outcome
+        else:
+            results[category][name] = outcome
 
     # Compute overall status
     all_statuses = []
@@ -453,9 +577,25 @@ def run_all_checks() -> dict:
     else:
         results["overall"] = "HEALTHY"
 
+    slowest = max(range(len(checks)), key=lambda i: outcomes[i]["duration_ms"])
+    category, name = checks[slowest][0]
+    results["timing"] = {
+        "wall_ms": wall_ms,
+        "sum_ms": round(sum(o["duration_ms"] for o in outcomes), 1),
+        "deadline_s": deadline,
+        "slowest": name or category,
+    }
+    logger.info("Checks finished in %.0f ms (sequential sum %.0f ms)",
+                wall_ms, results["timing"]["sum_ms"])
+
     return results
 
 
+def run_all_checks() -> dict:
+    """Synchronous wrapper around run_all_checks_async."""
+    return asyncio.run(run_all_checks_async())
+
+
 def generate_markdown_report(results: dict) -> str:
     """Generate a Markdown-formatted health report."""
     overall = results.get("overall", "UNKNOWN")
@@ -567,6 +707,37 @@ def generate_markdown_report(results: dict) -> str:
     if ipfs.get("repo_size_human"):
         lines.append(f"- **Repo size:** {ipfs['repo_size_human']}")
 
+    # Trends from the time-series store
+    trends = results.get("trends", {})
+    if trends:
+        lines.extend([
+            "",
+            f"## Trends ({trends.get('window_days', 0):g}d, {trends.get('runs', 0)} runs)",
+            "",
+        ])
+        for warning in trends.get("warnings", []):
+            lines.append(f"- [!!] {warning}")
+        for note in trends.get("flapping", []):
+            lines.append(f"- [~] {note}")
+        for name, growth in trends.get("growth", {}).items():
+            eta = growth.get("days_to_full")
+            eta_txt = f", full in ~{eta:.0f}d" if eta is not None else ""
+            lines.append(
+                f"- **{name}:** {growth['per_day_human']}/day{eta_txt}"
+            )
+        latency = trends.get("latency", {})
+        if latency:
+            lines.extend([
+                "",
+                "| Check | p50 ms | p95 ms | Fail % | Flips |",
+                "|-------|--------|--------|--------|-------|",
+            ])
+            for name, stat in latency.items():
+                lines.append(
+                    f"| {name} | {stat['p50_ms']} | {stat['p95_ms']} | {stat['fail_pct']} "
+                    f"| {stat['flips']} |"
+                )
+
     lines.extend(["", "---", "", "*Ierahkwa Sentinel -- Red Soberana*"])
 
     return "\n".join(lines)
@@ -628,6 +799,12 @@ def send_ntfy_alert(overall: str, summary: str) -> bool:
     priority = "5" if overall == "CRITICAL" else "4"
     title = f"[SENTINEL] Ierahkwa: {overall}"
 
+    # Shared with the other alert senders so manual re-runs don't spam
+    limiter = get_limiter()
+    if not limiter.acquire_guardian(int(priority), GLOBAL_REGION, scope="sentinel"):
+        logger.info("ntfy alert suppressed (rate limit): %s", overall)
+        return False
+
     try:
         resp = http_requests.post(
             f"{NTFY_URL}/{NTFY_TOPIC}",
@@ -644,6 +821,7 @@ def send_ntfy_alert(overall: str, summary: str) -> bool:
         return True
     except Exception as exc:
         logger.error("ntfy alert failed: %s", exc)
+        limiter.refund_guardian(int(priority), GLOBAL_REGION, scope="sentinel")
         return False
 
 
@@ -657,6 +835,287 @@ def save_json_log(results: dict) -> None:
         logger.error("Failed to write sentinel JSON log: %s", exc)
 
 
+# ---------------------------------------------------------------------------
+# Time-series store (SQLite)
+# ---------------------------------------------------------------------------
+#
+# Every run appends one row per check and per gauge to ``samples``.  Rows
+# older than SENTINEL_RAW_DAYS are folded into ``hourly`` (count, mean,
+# min, max, mean duration, failures) and deleted; hourly rows are kept
+# for SENTINEL_HOURLY_DAYS.  Trends read raw rows inside the window and
+# fall back to hourly rollups beyond it.
+
+# Gauges extracted from each run: metric -> (category, key)
+GAUGES = {
+    "cpu_pct": ("resources", "cpu_pct"),
+    "memory_pct": ("resources", "memory_pct"),
+    "disk_pct": ("resources", "disk_pct"),
+    "disk_used_gb": ("resources", "disk_used_gb"),
+    "ipfs_repo_bytes": ("ipfs", "repo_size_bytes"),
+    "ipfs_pin_count": ("ipfs", "pin_count"),
+    "block_age_seconds": ("blockchain", "block_age_seconds"),
+    "active_guardians": ("guardians", "active_guardians"),
+}
+
+# Growth trends: metric -> (label, capacity resolver, unit formatter).
+# Only accumulating metrics get a capacity; gauges that rise and fall, like
+# memory, are reported as growth but never forecast to fill up.
+GROWTH = {
+    "disk_pct": ("Disk usage", lambda r: 100.0, lambda v: f"{v:+.2f}%"),
+    "ipfs_repo_bytes": (
+        "IPFS repo",
+        lambda r: r.get("ipfs", {}).get("storage_max_bytes") or None,
+        lambda v: ("+" if v >= 0 else "-") + _human_bytes(abs(v)),
+    ),
+    "memory_pct": ("Memory usage", lambda r: None, lambda v: f"{v:+.2f}%"),
+}
+
+
+class SentinelStore:
+    """Compact SQLite time series of sentinel runs."""
+
+    def __init__(self, db_path: Path = SENTINEL_DB_PATH):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS samples (
+                metric      TEXT    NOT NULL,
+                ts          INTEGER NOT NULL,
+                status      TEXT,
+                value       REAL,
+                duration_ms REAL,
+                PRIMARY KEY (metric, ts)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS hourly (
+                metric      TEXT    NOT NULL,
+                hour        INTEGER NOT NULL,
+                n           INTEGER NOT NULL,
+                value_avg   REAL,
+                value_min   REAL,
+                value_max   REAL,
+                duration_avg REAL,
+                failures    INTEGER NOT NULL,
+                PRIMARY KEY (metric, hour)
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -- writes ------------------------------------------------------------
+
+    @staticmethod
+    def _rows(results: dict, ts: int) -> list[tuple]:
+        rows = []
+        for category, block in results.items():
+            if not isinstance(block, dict) or category in ("timing", "trends"):
+                continue
+            if "status" in block:
+                rows.append((f"check:{category}", ts, block["status"], None,
+                             block.get("duration_ms")))
+                continue
+            for name, check in block.items():
+                if isinstance(check, dict) and "status" in check:
+                    rows.append((f"check:{category}/{name}", ts, check["status"], None,
+                                 check.get("duration_ms")))
+        for metric, (category, key) in GAUGES.items():
+            value = results.get(category, {}).get(key)
+            if isinstance(value, (int, float)):
+                rows.append((metric, ts, None, float(value), None))
+        return rows
+
+    def record(self, results: dict, ts: Optional[int] = None) -> int:
+        """Append one run. Returns the number of samples written."""
+        if ts is None:
+            ts = int(datetime.fromisoformat(results["timestamp"]).timestamp())
+        rows = self._rows(results, ts)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def compact(self, now: Optional[int] = None) -> dict:
+        """Roll old raw samples into hourly rows and apply retention."""
+        now = int(time.time()) if now is None else now
+        raw_cutoff = now - int(SENTINEL_RAW_DAYS * 86400)
+        raw_cutoff -= raw_cutoff % 3600  # only fold whole hours
+        hourly_cutoff = now - int(SENTINEL_HOURLY_DAYS * 86400)
+        with self.conn:
+            # Merge with an existing partial hour, weighting by count
+            self.conn.execute("""
+                INSERT INTO hourly
+                SELECT metric, ts - ts % 3600, COUNT(*), AVG(value), MIN(value),
+                       MAX(value), AVG(duration_ms), SUM(status IS 'FAIL')
+                FROM samples WHERE ts < ?
+                GROUP BY metric, ts - ts % 3600
+                ON CONFLICT (metric, hour) DO UPDATE SET
+                    value_avg = (value_avg * n + excluded.value_avg * excluded.n)
+                                / (n + excluded.n),
+                    value_min = MIN(value_min, excluded.value_min),
+                    value_max = MAX(value_max, excluded.value_max),
+                    duration_avg = (duration_avg * n + excluded.duration_avg * excluded.n)
+                                   / (n + excluded.n),
+                    failures = failures + excluded.failures,
+                    n = n + excluded.n
+            """, (raw_cutoff,))
+            folded = self.conn.execute(
+                "DELETE FROM samples WHERE ts < ?", (raw_cutoff,)
+            ).rowcount
+            expired = self.conn.execute(
+                "DELETE FROM hourly WHERE hour < ?", (hourly_cutoff,)
+            ).rowcount
+        return {"folded": folded, "expired": expired}
+
+    # -- reads -------------------------------------------------------------
+
+    def series(self, metric: str, since: int) -> list[tuple[int, float]]:
+        """(ts, value) points since ``since``: hourly means, then raw."""
+        return self.conn.execute("""
+            SELECT hour + 1800, value_avg FROM hourly
+             WHERE metric = ? AND hour >= ? AND value_avg IS NOT NULL
+            UNION ALL
+            SELECT ts, value FROM samples
+             WHERE metric = ? AND ts >= ? AND value IS NOT NULL
+            ORDER BY 1
+        """, (metric, since, metric, since)).fetchall()
+
+    def latency(self, since: int) -> dict:
+        """Per-check p50/p95 duration, failure rate and OK<->FAIL flips.
+
+        ``flips`` counts runs whose FAIL-ness differs from the previous run,
+        so a check that failed once for a long stretch scores 2 while one
+        that keeps bouncing scores high.  Only the SENTINEL_RAW_DAYS of raw
+        history is consulted.
+        """
+        out = {}
+        cursor = self.conn.execute("""
+            SELECT metric, duration_ms, status FROM samples
+             WHERE metric LIKE 'check:%' AND ts >= ?
+             ORDER BY metric, ts
+        """, (since,))
+        current, durations, fails, total, flips, prev = None, [], 0, 0, 0, None
+
+        def flush():
+            if current is None or not total:
+                return
+            stat = {"fail_pct": round(100.0 * fails / total, 1), "runs": total,
+                    "flips": flips, "p50_ms": None, "p95_ms": None}
+            if durations:
+                durations.sort()
+                stat["p50_ms"] = round(durations[int(0.50 * (len(durations) - 1))], 1)
+                stat["p95_ms"] = round(durations[int(0.95 * (len(durations) - 1))], 1)
+            out[current[len("check:"):]] = stat
+
+        for metric, duration, status in cursor:
+            if metric != current:
+                flush()
+                current, durations, fails, total, flips, prev = metric, [], 0, 0, 0, None
+            failed = status == STATUS_FAIL
+            total += 1
+            fails += failed
+            flips += prev is not None and failed != prev
+            prev = failed
+            if duration is not None:
+                durations.append(duration)
+        flush()
+        return out
+
+    @staticmethod
+    def linear_fit(points: list[tuple[int, float]]) -> Optional[tuple[float, float]]:
+        """Least-squares (slope in units/day, R^2), or None if the data is too thin."""
+        if len(points) < 3 or points[-1][0] - points[0][0] < 6 * 3600:
+            return None
+        n = len(points)
+        t0 = points[0][0]
+        mean_t = sum(t - t0 for t, _ in points) / n
+        mean_v = sum(v for _, v in points) / n
+        var = sum((t - t0 - mean_t) ** 2 for t, _ in points)
+        if var == 0:
+            return None
+        cov = sum((t - t0 - mean_t) * (v - mean_v) for t, v in points)
+        var_v = sum((v - mean_v) ** 2 for _, v in points)
+        r2 = cov * cov / (var * var_v) if var_v else 0.0
+        return cov / var * 86400, r2
+
+    def trends(self, results: dict, now: Optional[int] = None,
+               window_days: float = SENTINEL_TREND_DAYS) -> dict:
+        """Latency percentiles, growth rates and capacity forecasts.
+
+        ``warnings`` holds capacity forecasts, which justify raising the
+        overall status.  A forecast needs SENTINEL_FORECAST_MIN_HOURS of
+        history and a fit with R^2 >= SENTINEL_FORECAST_MIN_R2, so noise on
+        a flat metric does not extrapolate to a full disk.  ``flapping`` lists checks that are passing now but
+        flipped OK<->FAIL at least SENTINEL_FLAP_FLIPS times in the window;
+        those are reported only and never change the overall status.
+        """
+        now = int(time.time()) if now is None else now
+        since = now - int(window_days * 86400)
+        runs = self.conn.execute(
+            "SELECT COUNT(DISTINCT ts) FROM samples WHERE ts >= ?", (since,)
+        ).fetchone()[0]
+        trend = {"window_days": window_days, "runs": runs, "growth": {},
+                 "latency": self.latency(since), "warnings": [], "flapping": []}
+
+        for metric, (label, capacity_of, fmt) in GROWTH.items():
+            points = self.series(metric, since)
+            fit = self.linear_fit(points)
+            if fit is None:
+                continue
+            slope, r2 = fit
+            growth = {"per_day": round(slope, 4), "per_day_human": fmt(slope),
+                      "r2": round(r2, 3), "days_to_full": None}
+            capacity = capacity_of(results)
+            span_hours = (points[-1][0] - points[0][0]) / 3600
+            if (capacity and slope > 0 and r2 >= SENTINEL_FORECAST_MIN_R2
+                    and span_hours >= SENTINEL_FORECAST_MIN_HOURS):
+                days = (capacity - points[-1][1]) / slope
+                growth["days_to_full"] = round(max(days, 0.0), 1)
+                if days < SENTINEL_FORECAST_DAYS:
+                    trend["warnings"].append(f"{label} full in ~{days:.0f} days")
+            trend["growth"][label] = growth
+
+        for name, stat in trend["latency"].items():
+            if stat["flips"] >= SENTINEL_FLAP_FLIPS:
+                current = _lookup_check(results, name)
+                if current.get("status") != STATUS_FAIL:
+                    trend["flapping"].append(
+                        f"{name} flapping: {stat['flips']} OK/FAIL flips "
+                        f"in {window_days:g}d ({stat['fail_pct']}% failed)"
+                    )
+        return trend
+
+
+def _lookup_check(results: dict, name: str) -> dict:
+    category, _, sub = name.partition("/")
+    block = results.get(category, {})
+    return block.get(sub, {}) if sub else block
+
+
+def record_and_analyze(results: dict, db_path: Path = SENTINEL_DB_PATH) -> dict:
+    """Store this run, compact the history and return trend analysis.
+
+    Failures here never break the sentinel: an empty dict is returned.
+    """
+    try:
+        store = SentinelStore(db_path)
+    except sqlite3.Error as exc:
+        logger.error("Cannot open sentinel store %s: %s", db_path, exc)
+        return {}
+    try:
+        store.record(results)
+        store.compact()
+        return store.trends(results)
+    except sqlite3.Error as exc:
+        logger.error("Sentinel store update failed: %s", exc)
+        return {}
+    finally:
+        store.close()
+
+
 def build_ntfy_summary(results: dict) -> str:
     """Build a short text summary for ntfy notifications."""
     lines = [f"Estado: {results.get('overall', 'UNKNOWN')}"]
@@ -681,6 +1140,11 @@ def build_ntfy_summary(results: dict) -> str:
     if gc.get("status") in (STATUS_WARN, STATUS_FAIL):
         lines.append(f"Guardianes: {gc.get('detail', '')}")
 
+    for warning in results.get("trends", {}).get("warnings", []):
+        lines.append(f"Tendencia: {warning}")
+    for note in results.get("trends", {}).get("flapping", []):
+        lines.append(f"Inestable: {note}")
+
     return "\n".join(lines)
 
 
@@ -695,7 +1159,13 @@ async def async_main() -> int:
     logger.info("  Ierahkwa Health Sentinel starting diagnostic")
     logger.info("=" * 60)
 
-    results = run_all_checks()
+    results = await run_all_checks_async()
+
+    # History and trend-based early warnings; only capacity forecasts
+    # (not flapping) may raise the overall status
+    results["trends"] = record_and_analyze(results)
+    if results["trends"].get("warnings") and results["overall"] == "HEALTHY":
+        results["overall"] = "DEGRADED"
     overall = results["overall"]
 
     # Generate Markdown report
@@ -709,8 +1179,8 @@ async def async_main() -> int:
     summary = build_ntfy_summary(results)
     send_ntfy_alert(overall, summary)
 
-    # Save JSON log
-    save_json_log(results)
+    # Save JSON log (per-run results only; trends are derived from the store)
+    save_json_log({k: v for k, v in results.items() if k != "trends"})
 
     # Print report to stdout
     print(report)
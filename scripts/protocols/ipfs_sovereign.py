@@ -14,6 +14,14 @@ WEB3_STORAGE_TOKEN      web3.storage API token for Filecoin replication
 PROJECT_ROOT            Path to Soberano-Organizado root (default: auto-detect)
 LOG_DIR                 Logging directory                (default: logs/)
 MANIFEST_DIR            Where to store archive manifests (default: data/ipfs_manifests)
+IPFS_INDEX_PATH         Content-hash index (path -> CID) (default: MANIFEST_DIR/content_index.json)
+IPFS_BATCH_FILES        Max files (open handles) per add (default: 64)
+IPFS_BATCH_MB           Max megabytes per add request    (default: 32)
+IPFS_MAX_INFLIGHT       Concurrent API requests / pooled
+                        connections                      (default: 8)
+IPFS_RETRIES            Retries per request on connection
+                        errors and 429/502/503/504       (default: 3)
+IPFS_BACKOFF            Retry backoff factor, seconds    (default: 0.5)
 """
 
 import argparse
@@ -22,13 +30,20 @@ import json
 import logging
 import os
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote
 
 try:
     import requests as http_requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     sys.exit("requests is required: pip install requests")
 
@@ -55,6 +70,13 @@ PROJECT_ROOT = Path(os.environ.get("PROJECT_ROOT", str(_default_root)))
 LOG_DIR = Path(os.environ.get("LOG_DIR", "logs"))
 MANIFEST_DIR = Path(os.environ.get("MANIFEST_DIR", "data/ipfs_manifests"))
 
+IPFS_INDEX_PATH = Path(os.environ.get("IPFS_INDEX_PATH", str(MANIFEST_DIR / "content_index.json")))
+IPFS_BATCH_FILES = int(os.environ.get("IPFS_BATCH_FILES", "64"))
+IPFS_BATCH_MB = float(os.environ.get("IPFS_BATCH_MB", "32"))
+IPFS_MAX_INFLIGHT = int(os.environ.get("IPFS_MAX_INFLIGHT", "8"))
+IPFS_RETRIES = int(os.environ.get("IPFS_RETRIES", "3"))
+IPFS_BACKOFF = float(os.environ.get("IPFS_BACKOFF", "0.5"))
+
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 MANIFEST_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -68,6 +90,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ierahkwa.ipfs_sovereign")
 
+# ---------------------------------------------------------------------------
+# Pooled HTTP session and API stats
+# ---------------------------------------------------------------------------
+
+
+class ApiStats:
+    """Thread-safe per-endpoint request counters and latency samples."""
+
+    SAMPLES = 1024
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._endpoints: dict[str, dict] = {}
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            ep = self._endpoints.get(endpoint)
+            if ep is None:
+                ep = {"count": 0, "errors": 0, "total_s": 0.0,
+                      "samples": deque(maxlen=self.SAMPLES)}
+                self._endpoints[endpoint] = ep
+            ep["count"] += 1
+            ep["errors"] += 0 if ok else 1
+            ep["total_s"] += seconds
+            ep["samples"].append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            uptime = max(time.monotonic() - self._started, 1e-9)
+            out = {}
+            for name, ep in self._endpoints.items():
+                samples = sorted(ep["samples"])
+
+                def pct(q: float) -> float:
+                    return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 1)
+
+                out[name] = {
+                    "count": ep["count"],
+                    "errors": ep["errors"],
+                    "per_s": round(ep["count"] / uptime, 3),
+                    "mean_ms": round(ep["total_s"] / ep["count"] * 1000, 1),
+                    "p50_ms": pct(0.50),
+                    "p95_ms": pct(0.95),
+                    "max_ms": round(samples[-1] * 1000, 1),
+                }
+            return out
+
+
+api_stats = ApiStats()
+_session: Optional[http_requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> http_requests.Session:
+    """Shared keep-alive session sized for IPFS_MAX_INFLIGHT connections.
+
+    Retries connection errors and 429/502/503/504 responses with
+    exponential backoff; all IPFS API calls are POSTs, so POST is retried
+    too.  Those failures mean the daemon never handled the request.  A
+    500 or a read error after the body was sent may mean it did, so
+    neither is retried: that would re-send (and re-add) a whole upload.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=IPFS_RETRIES,
+                read=0,
+                backoff_factor=IPFS_BACKOFF,
+                status_forcelist=(429, 502, 503, 504),
+                allowed_methods=None,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=IPFS_MAX_INFLIGHT, max_retries=retry,
+            )
+            session = http_requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _post(url: str, **kwargs) -> http_requests.Response:
+    """POST through the pooled session, recording latency per endpoint."""
+    endpoint = url.split("/api/v0/", 1)[1] if "/api/v0/" in url else url.split("://", 1)[-1]
+    start = time.perf_counter()
+    ok = False
+    try:
+        resp = get_session().post(url, **kwargs)
+        ok = resp.status_code < 400
+        return resp
+    finally:
+        api_stats.record(endpoint, time.perf_counter() - start, ok)
+
+
+def run_pool(func, items: list, max_inflight: int = IPFS_MAX_INFLIGHT) -> list:
+    """Apply ``func`` to ``items`` with at most ``max_inflight`` concurrent calls.
+
+    Results come back in input order.
+    """
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_inflight, len(items))),
+                            thread_name_prefix="ipfs") as pool:
+        return list(pool.map(func, items))
+
+
 # ---------------------------------------------------------------------------
 # IPFS API helpers
 # ---------------------------------------------------------------------------
@@ -76,7 +207,7 @@ logger = logging.getLogger("ierahkwa.ipfs_sovereign")
 def ipfs_is_alive() -> bool:
     """Check if the local IPFS daemon is responding."""
     try:
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/id", timeout=10
         )
         return resp.status_code == 200
@@ -96,7 +227,7 @@ def pin_file(path: str) -> str:
 
     try:
         with open(file_path, "rb") as fh:
-            resp = http_requests.post(
+            resp = _post(
                 f"{IPFS_API_URL}/api/v0/add",
                 files={"file": (file_path.name, fh)},
                 timeout=120,
@@ -115,6 +246,10 @@ def pin_file(path: str) -> str:
 def pin_directory(path: str) -> dict:
     """Pin an entire directory recursively to IPFS.
 
+    The tree is walked lazily and streamed to the daemon as a chunked
+    multipart body with one file open at a time, and the NDJSON response
+    is parsed line by line, so memory stays flat regardless of tree size.
+
     Returns a dict mapping relative paths to CIDs, plus a 'root' key
     with the directory CID.
     """
@@ -123,36 +258,17 @@ def pin_directory(path: str) -> dict:
         logger.error("Not a directory: %s", path)
         return {}
 
-    files = []
-    for file_path in sorted(dir_path.rglob("*")):
-        if file_path.is_file():
-            rel = file_path.relative_to(dir_path)
-            files.append((str(rel), file_path))
-
-    if not files:
+    files = iter_tree(dir_path)
+    first = next(files, None)
+    if first is None:
         logger.warning("Directory is empty: %s", path)
         return {}
 
     try:
-        multipart = []
-        for rel_name, abs_path in files:
-            multipart.append(
-                ("file", (rel_name, open(abs_path, "rb")))
-            )
-
-        resp = http_requests.post(
-            f"{IPFS_API_URL}/api/v0/add",
-            params={"recursive": "true", "wrap-with-directory": "true"},
-            files=multipart,
-            timeout=300,
-        )
-        resp.raise_for_status()
-
-        # IPFS returns one JSON object per line
         mapping = {}
         root_cid = ""
-        for line in resp.text.strip().split("\n"):
-            entry = json.loads(line)
+        body = MultipartStream(_chain_first(first, files))
+        for entry in stream_add(body, {"recursive": "true", "wrap-with-directory": "true"}):
             name = entry.get("Name", "")
             cid = entry.get("Hash", "")
             if name == "":
@@ -160,13 +276,9 @@ def pin_directory(path: str) -> dict:
             else:
                 mapping[name] = cid
 
-        # Close file handles
-        for _, (_, fh) in multipart:
-            fh.close()
-
         mapping["_root"] = root_cid
-        logger.info("Pinned directory: %s -> root %s (%d files)",
-                     dir_path.name, root_cid, len(files))
+        logger.info("Pinned directory: %s -> root %s (%d files, %d bytes)",
+                     dir_path.name, root_cid, body.files_sent, body.bytes_sent)
         return mapping
 
     except Exception as exc:
@@ -174,6 +286,323 @@ def pin_directory(path: str) -> dict:
         return {}
 
 
+# ---------------------------------------------------------------------------
+# Streaming multipart upload
+# ---------------------------------------------------------------------------
+
+STREAM_CHUNK = 256 * 1024
+
+
+def iter_tree(root: Path):
+    """Yield (relative_name, path) for every file under ``root``, sorted.
+
+    Walks one directory at a time instead of materialising the whole tree.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            abs_path = Path(dirpath) / name
+            if abs_path.is_file():
+                yield abs_path.relative_to(root).as_posix(), abs_path
+
+
+def _chain_first(first, rest):
+    yield first
+    yield from rest
+
+
+class MultipartStream:
+    """Re-iterable multipart/form-data body generated from (name, path) pairs.
+
+    Passing this as ``data=`` makes requests send it with chunked transfer
+    encoding.  Each file is opened only while its part is being sent and
+    read in STREAM_CHUNK pieces.  Iterating again restarts from the
+    beginning, so connection-level retries resend a complete body; a
+    one-shot generator of files is materialised lazily on first pass and
+    replayed from the recorded (name, path) list on retries.
+    """
+
+    def __init__(self, files, field: str = "file", chunk_size: int = STREAM_CHUNK):
+        self._source = iter(files)
+        self._seen: list[tuple[str, Path]] = []
+        self._exhausted = False
+        self.field = field
+        self.chunk_size = chunk_size
+        self.boundary = os.urandom(16).hex()
+        self.files_sent = 0
+        self.bytes_sent = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _files(self):
+        yield from self._seen
+        while not self._exhausted:
+            item = next(self._source, None)
+            if item is None:
+                self._exhausted = True
+                return
+            self._seen.append(item)
+            yield item
+
+    def __iter__(self):
+        self.files_sent = 0
+        self.bytes_sent = 0
+        boundary = self.boundary.encode("ascii")
+        for name, file_path in self._files():
+            header = (
+                b"--" + boundary + b"\r\n"
+                + b'Content-Disposition: form-data; name="' + self.field.encode("ascii")
+                + b'"; filename="' + quote(name, safe="").encode("ascii") + b'"\r\n'
+                + b"Content-Type: application/octet-stream\r\n\r\n"
+            )
+            yield header
+            with open(file_path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(self.chunk_size), b""):
+                    self.bytes_sent += len(chunk)
+                    yield chunk
+            yield b"\r\n"
+            self.files_sent += 1
+        yield b"--" + boundary + b"--\r\n"
+
+
+def stream_add(body: MultipartStream, params: dict, timeout: int = 300):
+    """POST a MultipartStream to /api/v0/add and yield each NDJSON entry.
+
+    Progress lines (no Hash) are skipped; an error object from the daemon
+    raises RuntimeError.
+    """
+    resp = _post(
+        f"{IPFS_API_URL}/api/v0/add",
+        params=params,
+        data=body,
+        headers={"Content-Type": body.content_type},
+        stream=True,
+        timeout=timeout,
+    )
+    with resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            if "Hash" in entry:
+                yield entry
+            elif entry.get("Type") == "error" or "Message" in entry:
+                raise RuntimeError(entry.get("Message", "add failed"))
+
+
+def add_files_batched(paths: list[Path], max_files: int = IPFS_BATCH_FILES,
+                      max_bytes: int = int(IPFS_BATCH_MB * 1024 * 1024)) -> dict:
+    """Add many files through a few multipart /api/v0/add calls.
+
+    Files are grouped so that no request holds more than ``max_files`` open
+    handles or ``max_bytes`` of content (a larger file goes alone).  Parts
+    are named by index, so results map back to paths regardless of file
+    names.  Up to IPFS_MAX_INFLIGHT batches are uploaded concurrently.
+
+    Returns {"cids": {path: cid}, "bytes": uploaded, "requests": n, "errors": [...]}.
+    """
+    result = {"cids": {}, "bytes": 0, "requests": 0, "errors": []}
+    batches: list[list[tuple[Path, int]]] = []
+    batch: list[tuple[Path, int]] = []
+    batch_bytes = 0
+    for path in paths:
+        size = path.stat().st_size
+        if batch and (len(batch) >= max_files or batch_bytes + size > max_bytes):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append((path, size))
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+
+    def add_batch(batch: list[tuple[Path, int]]) -> tuple[dict, int, bool]:
+        cids = {}
+        try:
+            with ExitStack() as stack:
+                multipart = [
+                    ("file", (str(i), stack.enter_context(open(path, "rb"))))
+                    for i, (path, _) in enumerate(batch)
+                ]
+                resp = _post(
+                    f"{IPFS_API_URL}/api/v0/add",
+                    params={"pin": "true", "cid-version": "0"},
+                    files=multipart,
+                    timeout=300,
+                )
+            resp.raise_for_status()
+            for line in resp.text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                name = entry.get("Name", "")
+                if name.isdigit() and int(name) < len(batch):
+                    cids[batch[int(name)][0]] = entry.get("Hash", "")
+            return cids, sum(size for _, size in batch), True
+        except Exception as exc:
+            logger.error("Batch add of %d files failed: %s", len(batch), exc)
+            return cids, 0, False
+
+    for batch, (cids, nbytes, ok) in zip(batches, run_pool(add_batch, batches)):
+        result["requests"] += 1
+        result["cids"].update(cids)
+        result["bytes"] += nbytes
+        if not ok:
+            result["errors"].extend(str(path) for path, _ in batch)
+
+    for path, _ in (item for batch in batches for item in batch):
+        if path not in result["cids"] and str(path) not in result["errors"]:
+            result["errors"].append(str(path))
+    logger.info("Added %d files in %d requests (%d bytes)",
+                len(result["cids"]), result["requests"], result["bytes"])
+    return result
+
+
+def pin_many(paths: list[str], max_inflight: int = IPFS_MAX_INFLIGHT) -> dict:
+    """Pin many files concurrently. Returns {path: cid} ('' on failure)."""
+    return dict(zip(paths, run_pool(pin_file, list(paths), max_inflight)))
+
+
+# ---------------------------------------------------------------------------
+# Content-hash index (path -> mtime/size/sha256 -> CID)
+# ---------------------------------------------------------------------------
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_content_index(index_path: Path = IPFS_INDEX_PATH) -> dict:
+    """Load the content index, or an empty one if missing or unreadable."""
+    if not index_path.is_file():
+        return {"files": {}, "dirs": {}}
+    try:
+        with open(index_path, encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable content index %s: %s", index_path, exc)
+        return {"files": {}, "dirs": {}}
+    index.setdefault("files", {})
+    index.setdefault("dirs", {})
+    return index
+
+
+def save_content_index(index: dict, index_path: Path = IPFS_INDEX_PATH) -> None:
+    """Atomically write the content index."""
+    tmp = index_path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(index, fh, indent=1, sort_keys=True)
+    os.replace(tmp, index_path)
+
+
+def pinned_cids() -> set:
+    """CIDs recursively pinned on the local node, from one ``pin/ls`` call.
+
+    Returns an empty set if the node cannot be asked, so callers fall back
+    to uploading rather than trusting CIDs they cannot confirm.
+    """
+    try:
+        resp = _post(
+            f"{IPFS_API_URL}/api/v0/pin/ls",
+            params={"type": "recursive", "quiet": "true"},
+            timeout=60,
+        )
+        resp.raise_for_status()
+        return set(resp.json().get("Keys", {}))
+    except Exception as exc:
+        logger.warning("Could not list pins, re-pinning indexed content: %s", exc)
+        return set()
+
+
+def pin_files_indexed(paths: list[Path], index: dict, force: bool = False,
+                      pinned: Optional[set] = None) -> dict:
+    """Pin ``paths``, reusing CIDs for content the index has already seen.
+
+    A file is unchanged when its mtime and size match the index entry; if
+    only its mtime moved, or its bytes match another indexed file, the
+    sha256 lets the stored CID be reused without uploading.  Indexed CIDs
+    are only reused if they are still in ``pinned`` (by default one
+    ``pinned_cids`` call), so content garbage-collected or unpinned on the
+    node is uploaded again.  Everything else goes through
+    ``add_files_batched``.  ``index`` is updated in place.
+
+    Returns {"cids": {path: cid}, "stats": {...}, "errors": [...]}.
+    """
+    files = index["files"]
+    if pinned is None:
+        pinned = pinned_cids() if not force and files else set()
+    by_sha = {e["sha256"]: e["cid"] for e in files.values() if e.get("cid") in pinned}
+    cids: dict[Path, str] = {}
+    stats = {"files": len(paths), "unchanged": 0, "deduplicated": 0, "uploaded": 0,
+             "bytes_uploaded": 0, "bytes_skipped": 0, "requests": 0, "unpinned": 0}
+    pending: list[tuple[Path, dict]] = []
+
+    for path in paths:
+        st = path.stat()
+        key = str(path.resolve())
+        entry = files.get(key)
+        if not force and entry and entry.get("cid") and entry["cid"] not in pinned:
+            stats["unpinned"] += 1
+        elif (not force and entry and entry.get("cid")
+                and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size):
+            cids[path] = entry["cid"]
+            stats["unchanged"] += 1
+            stats["bytes_skipped"] += st.st_size
+            continue
+        sha = _sha256_file(path)
+        new_entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha, "cid": ""}
+        if not force and sha in by_sha:
+            new_entry["cid"] = by_sha[sha]
+            files[key] = new_entry
+            cids[path] = new_entry["cid"]
+            stats["deduplicated"] += 1
+            stats["bytes_skipped"] += st.st_size
+            continue
+        pending.append((path, new_entry))
+
+    # Identical new files in one run are uploaded once
+    first_by_sha: dict[str, Path] = {}
+    uploads = []
+    for path, entry in pending:
+        if entry["sha256"] not in first_by_sha:
+            first_by_sha[entry["sha256"]] = path
+            uploads.append(path)
+
+    added = add_files_batched(uploads) if uploads else {"cids": {}, "bytes": 0, "requests": 0, "errors": []}
+    stats["uploaded"] = len(added["cids"])
+    stats["bytes_uploaded"] = added["bytes"]
+    stats["requests"] = added["requests"]
+
+    for path, entry in pending:
+        cid = added["cids"].get(first_by_sha[entry["sha256"]], "")
+        if not cid:
+            continue
+        entry["cid"] = cid
+        files[str(path.resolve())] = entry
+        cids[path] = cid
+        if first_by_sha[entry["sha256"]] != path:
+            stats["deduplicated"] += 1
+            stats["bytes_skipped"] += entry["size"]
+
+    return {"cids": cids, "stats": stats, "errors": added["errors"]}
+
+
+def directory_fingerprint(dir_path: Path) -> str:
+    """Hash of every file's relative path, size and mtime under ``dir_path``."""
+    digest = hashlib.sha256()
+    for file_path in sorted(dir_path.rglob("*")):
+        if file_path.is_file():
+            st = file_path.stat()
+            digest.update(f"{file_path.relative_to(dir_path)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
 def pin_evidence(content: str, metadata: dict) -> str:
     """Pin evidence for the Veritas protocol with metadata envelope.
 
@@ -189,7 +618,7 @@ def pin_evidence(content: str, metadata: dict) -> str:
     payload = json.dumps(package, ensure_ascii=False, indent=2)
 
     try:
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/add",
             files={"file": ("evidence.json", payload.encode("utf-8"))},
             timeout=60,
@@ -245,9 +674,13 @@ def _collect_files_by_glob(root: Path, patterns: list[str]) -> list[Path]:
     return sorted(found)
 
 
-def doomsday_archive() -> dict:
+def doomsday_archive(force: bool = False) -> dict:
     """Archive all critical files and directories to IPFS.
 
+    Only content that changed since the last run is uploaded (see
+    ``pin_files_indexed``); unchanged directories reuse their root CID
+    while it is still pinned on the node.  ``force`` re-pins everything.
+
     Returns a manifest dict mapping logical names to CIDs.
     """
     logger.info("=" * 60)
@@ -265,51 +698,70 @@ def doomsday_archive() -> dict:
         "whitepapers": {},
         "errors": [],
     }
+    index = load_content_index()
+    # One pin listing confirms every indexed file and directory CID
+    pinned = set() if force else pinned_cids()
+
+    # Gather every individual file first so each is pinned once per run:
+    # rel path -> manifest section
+    targets: dict[str, str] = {}
 
     # 1. Critical individual files
     for rel_path in CRITICAL_FILES:
         abs_path = PROJECT_ROOT / rel_path
-        if abs_path.exists():
-            cid = pin_file(str(abs_path))
-            if cid:
-                manifest["files"][rel_path] = cid
-            else:
-                manifest["errors"].append(f"Pin failed: {rel_path}")
+        if abs_path.is_file():
+            targets[rel_path] = "files"
         else:
             logger.warning("Critical file not found: %s", abs_path)
             manifest["errors"].append(f"Not found: {rel_path}")
 
-    # 2. Critical directories
+    # 2. All Solidity contracts
+    for contract_path in _collect_files_by_glob(PROJECT_ROOT, CONTRACT_GLOBS):
+        targets.setdefault(str(contract_path.relative_to(PROJECT_ROOT)), "contracts")
+
+    # 3. Whitepapers and documentation (critical files keep their section)
+    for wp_path in _collect_files_by_glob(PROJECT_ROOT, WHITEPAPER_GLOBS):
+        targets.setdefault(str(wp_path.relative_to(PROJECT_ROOT)), "whitepapers")
+
+    result = pin_files_indexed([PROJECT_ROOT / rel for rel in targets], index,
+                               force=force, pinned=pinned)
+    for rel, section in targets.items():
+        cid = result["cids"].get(PROJECT_ROOT / rel)
+        if cid:
+            manifest[section][rel] = cid
+        elif section == "files":
+            manifest["errors"].append(f"Pin failed: {rel}")
+        else:
+            logger.error("Failed to pin %s", rel)
+    stats = result["stats"]
+
+    # 4. Critical directories
+    stats["directories_unchanged"] = 0
     for rel_dir in CRITICAL_DIRS:
         abs_dir = PROJECT_ROOT / rel_dir
-        if abs_dir.is_dir():
-            result = pin_directory(str(abs_dir))
-            if result:
-                manifest["directories"][rel_dir] = result
-            else:
-                manifest["errors"].append(f"Dir pin failed: {rel_dir}")
-        else:
+        if not abs_dir.is_dir():
             logger.warning("Critical directory not found: %s", abs_dir)
             manifest["errors"].append(f"Dir not found: {rel_dir}")
-
-    # 3. All Solidity contracts
-    contracts = _collect_files_by_glob(PROJECT_ROOT, CONTRACT_GLOBS)
-    for contract_path in contracts:
-        rel = str(contract_path.relative_to(PROJECT_ROOT))
-        cid = pin_file(str(contract_path))
-        if cid:
-            manifest["contracts"][rel] = cid
-
-    # 4. Whitepapers and documentation
-    whitepapers = _collect_files_by_glob(PROJECT_ROOT, WHITEPAPER_GLOBS)
-    for wp_path in whitepapers:
-        rel = str(wp_path.relative_to(PROJECT_ROOT))
-        # Skip if already covered by critical files
-        if rel in manifest["files"]:
             continue
-        cid = pin_file(str(wp_path))
-        if cid:
-            manifest["whitepapers"][rel] = cid
+        fingerprint = directory_fingerprint(abs_dir)
+        cached = index["dirs"].get(str(abs_dir.resolve()))
+        if (not force and cached and cached["fingerprint"] == fingerprint
+                and cached["mapping"].get("_root") in pinned):
+            manifest["directories"][rel_dir] = cached["mapping"]
+            stats["directories_unchanged"] += 1
+            continue
+        result = pin_directory(str(abs_dir))
+        if result:
+            manifest["directories"][rel_dir] = result
+            index["dirs"][str(abs_dir.resolve())] = {"fingerprint": fingerprint, "mapping": result}
+            stats["requests"] += 1
+            stats["bytes_uploaded"] += sum(
+                p.stat().st_size for p in abs_dir.rglob("*") if p.is_file()
+            )
+        else:
+            manifest["errors"].append(f"Dir pin failed: {rel_dir}")
+
+    save_content_index(index)
 
     # Save manifest
     manifest_hash = hashlib.sha256(
@@ -324,6 +776,7 @@ def doomsday_archive() -> dict:
         + len(manifest["whitepapers"])
     )
     manifest["total_pinned"] = total_pinned
+    manifest["transfer"] = stats
 
     ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     manifest_path = MANIFEST_DIR / f"doomsday_{ts}.json"
@@ -331,9 +784,10 @@ def doomsday_archive() -> dict:
         json.dump(manifest, fh, ensure_ascii=False, indent=2)
 
     logger.info(
-        "Doomsday archive complete: %d items pinned, manifest: %s",
-        total_pinned,
-        manifest_path,
+        "Doomsday archive complete: %d items pinned (%d unchanged, %d deduplicated, "
+        "%d uploaded, %d bytes in %d requests), manifest: %s",
+        total_pinned, stats["unchanged"], stats["deduplicated"], stats["uploaded"],
+        stats["bytes_uploaded"], stats["requests"], manifest_path,
     )
     return manifest
 
@@ -359,7 +813,7 @@ def replicate_to_filecoin(cid: str) -> dict:
 
     try:
         # First, fetch the content from IPFS
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/cat",
             params={"arg": cid},
             timeout=120,
@@ -368,7 +822,7 @@ def replicate_to_filecoin(cid: str) -> dict:
         content = resp.content
 
         # Upload to web3.storage
-        upload_resp = http_requests.post(
+        upload_resp = _post(
             f"{WEB3_STORAGE_API}/upload",
             headers={
                 "Authorization": f"Bearer {WEB3_STORAGE_TOKEN}",
@@ -387,6 +841,11 @@ def replicate_to_filecoin(cid: str) -> dict:
         return {"error": str(exc)}
 
 
+def replicate_many(cids: list[str], max_inflight: int = IPFS_MAX_INFLIGHT) -> dict:
+    """Replicate many CIDs to Filecoin concurrently. Returns {cid: result}."""
+    return dict(zip(cids, run_pool(replicate_to_filecoin, list(cids), max_inflight)))
+
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
@@ -404,7 +863,7 @@ def verify_pin(cid: str) -> dict:
 
     # Check pin status
     try:
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/pin/ls",
             params={"arg": cid, "type": "all"},
             timeout=30,
@@ -419,7 +878,7 @@ def verify_pin(cid: str) -> dict:
 
     # Check accessibility via stat
     try:
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/object/stat",
             params={"arg": cid},
             timeout=30,
@@ -434,6 +893,23 @@ def verify_pin(cid: str) -> dict:
     return result
 
 
+def verify_many(cids: list[str], max_inflight: int = IPFS_MAX_INFLIGHT) -> list[dict]:
+    """Verify many CIDs concurrently. Results are in input order."""
+    return run_pool(verify_pin, list(cids), max_inflight)
+
+
+def manifest_cids(manifest: dict) -> list[str]:
+    """All distinct CIDs referenced by an archive manifest."""
+    cids = []
+    for section in ("files", "contracts", "whitepapers", "directories"):
+        for value in manifest.get(section, {}).values():
+            if isinstance(value, str):
+                cids.append(value)
+            elif isinstance(value, dict):
+                cids.extend(v for v in value.values() if isinstance(v, str))
+    return list(dict.fromkeys(c for c in cids if c))
+
+
 # ---------------------------------------------------------------------------
 # Manifest -> on-chain via IerahkwaVeritas
 # ---------------------------------------------------------------------------
@@ -488,7 +964,7 @@ def manifest_to_chain(manifest: dict) -> str:
         manifest_json = json.dumps(manifest, ensure_ascii=False)
         manifest_cid = ""
         try:
-            resp = http_requests.post(
+            resp = _post(
                 f"{IPFS_API_URL}/api/v0/add",
                 files={"file": ("manifest.json", manifest_json.encode("utf-8"))},
                 timeout=30,
@@ -522,7 +998,7 @@ def manifest_to_chain(manifest: dict) -> str:
 # ---------------------------------------------------------------------------
 
 
-def scheduled_backup() -> dict:
+def scheduled_backup(force: bool = False) -> dict:
     """Run a full doomsday archive + Filecoin replication.
 
     Designed to be called weekly via cron or systemd timer.
@@ -534,7 +1010,7 @@ def scheduled_backup() -> dict:
         logger.error("IPFS daemon is not responding at %s. Aborting backup.", IPFS_API_URL)
         return {"error": "IPFS not available"}
 
-    manifest = doomsday_archive()
+    manifest = doomsday_archive(force=force)
 
     # Store manifest on-chain
     tx = manifest_to_chain(manifest)
@@ -543,18 +1019,15 @@ def scheduled_backup() -> dict:
 
     # Replicate critical items to Filecoin
     if WEB3_STORAGE_TOKEN:
-        replicated = []
-        # Replicate the most important files
-        for name, cid in list(manifest.get("files", {}).items())[:10]:
-            result = replicate_to_filecoin(cid)
-            if "error" not in result:
-                replicated.append({"name": name, "cid": cid})
-        # Replicate all contracts
-        for name, cid in manifest.get("contracts", {}).items():
-            result = replicate_to_filecoin(cid)
-            if "error" not in result:
-                replicated.append({"name": name, "cid": cid})
-        manifest["filecoin_replicated"] = replicated
+        # The most important files plus all contracts
+        targets = list(manifest.get("files", {}).items())[:10]
+        targets += list(manifest.get("contracts", {}).items())
+        results = replicate_many(list(dict.fromkeys(cid for _, cid in targets if cid)))
+        manifest["filecoin_replicated"] = [
+            {"name": name, "cid": cid}
+            for name, cid in targets
+            if cid and "error" not in results.get(cid, {"error": ""})
+        ]
 
     logger.info("Scheduled backup complete.")
     return manifest
@@ -573,18 +1046,20 @@ def get_ipfs_status() -> dict:
         "pin_count": 0,
         "repo_size": 0,
         "repo_size_human": "",
+        "max_inflight": IPFS_MAX_INFLIGHT,
+        "api_stats": {},
     }
 
     try:
         # Node identity
-        resp = http_requests.post(f"{IPFS_API_URL}/api/v0/id", timeout=10)
+        resp = _post(f"{IPFS_API_URL}/api/v0/id", timeout=10)
         if resp.status_code == 200:
             data = resp.json()
             status["alive"] = True
             status["peer_id"] = data.get("ID", "")
 
         # Pin count
-        resp = http_requests.post(
+        resp = _post(
             f"{IPFS_API_URL}/api/v0/pin/ls",
             params={"type": "recursive"},
             timeout=30,
@@ -594,7 +1069,7 @@ def get_ipfs_status() -> dict:
             status["pin_count"] = len(keys)
 
         # Repo stats
-        resp = http_requests.post(f"{IPFS_API_URL}/api/v0/repo/stat", timeout=15)
+        resp = _post(f"{IPFS_API_URL}/api/v0/repo/stat", timeout=15)
         if resp.status_code == 200:
             stat = resp.json()
             repo_size = stat.get("RepoSize", 0)
@@ -609,6 +1084,7 @@ def get_ipfs_status() -> dict:
     except Exception as exc:
         logger.error("IPFS status check failed: %s", exc)
 
+    status["api_stats"] = api_stats.snapshot()
     return status
 
 
@@ -635,11 +1111,14 @@ def build_parser() -> argparse.ArgumentParser:
     ev_p.add_argument("--case-id", default="", help="Case identifier")
 
     # archive
-    sub.add_parser("archive", help="Run doomsday archive of all critical files")
+    arch_p = sub.add_parser("archive", help="Run doomsday archive of all critical files")
+    arch_p.add_argument("--force", action="store_true",
+                        help="Re-pin everything, ignoring the content index")
 
     # verify
-    ver_p = sub.add_parser("verify", help="Verify a CID is pinned and accessible")
-    ver_p.add_argument("cid", help="CID to verify")
+    ver_p = sub.add_parser("verify", help="Verify CIDs are pinned and accessible")
+    ver_p.add_argument("cid", nargs="*", help="CIDs to verify")
+    ver_p.add_argument("--manifest", help="Also verify every CID in this manifest file")
 
     # replicate
     rep_p = sub.add_parser("replicate", help="Replicate a CID to Filecoin")
@@ -649,7 +1128,9 @@ def build_parser() -> argparse.ArgumentParser:
     sub.add_parser("status", help="Show IPFS node status")
 
     # backup
-    sub.add_parser("backup", help="Run scheduled backup (archive + replicate)")
+    back_p = sub.add_parser("backup", help="Run scheduled backup (archive + replicate)")
+    back_p.add_argument("--force", action="store_true",
+                        help="Re-pin everything, ignoring the content index")
 
     return parser
 
@@ -699,16 +1180,22 @@ def main() -> None:
             sys.exit(1)
 
     elif args.command == "archive":
-        manifest = doomsday_archive()
+        manifest = doomsday_archive(force=args.force)
         print(json.dumps(manifest, indent=2, ensure_ascii=False))
         tx = manifest_to_chain(manifest)
         if tx:
             print(f"On-chain TX: {tx}")
 
     elif args.command == "verify":
-        result = verify_pin(args.cid)
-        print(json.dumps(result, indent=2))
-        if not result["pinned"]:
+        cids = list(args.cid)
+        if args.manifest:
+            with open(args.manifest, encoding="utf-8") as fh:
+                cids += manifest_cids(json.load(fh))
+        if not cids:
+            parser.error("verify needs at least one CID or --manifest")
+        results = verify_many(list(dict.fromkeys(cids)))
+        print(json.dumps(results[0] if len(results) == 1 else results, indent=2))
+        if not all(r["pinned"] for r in results):
             sys.exit(1)
 
     elif args.command == "replicate":
@@ -724,7 +1211,7 @@ def main() -> None:
             sys.exit(1)
 
     elif args.command == "backup":
-        manifest = scheduled_backup()
+        manifest = scheduled_backup(force=args.force)
         print(json.dumps(manifest, indent=2, ensure_ascii=False))
 
 
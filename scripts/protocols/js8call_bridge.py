@@ -27,14 +27,17 @@ LORA_FALLBACK         Enable LoRa cascade       (default: true)
 LOG_DIR               Logging directory          (default: logs/)
 """
 
+import argparse
 import asyncio
 import json
 import logging
 import os
+import re
 import socket
 import struct
 import sys
 import time
+import unicodedata
 import zlib
 from datetime import datetime, timezone
 from pathlib import Path
@@ -134,67 +137,150 @@ def lookup_matrix(matrix_id: str) -> Optional[str]:
 # ---------------------------------------------------------------------------
 # Compression for HF (extreme — every byte counts)
 # ---------------------------------------------------------------------------
+#
+# Wire format: <priority_code><body>, at most JS8_MAX_CHARS characters.
+#
+# The body is normalised to JS8_CHARSET (JS8Call transmits upper case only;
+# accents are stripped, other punctuation becomes a space) and then whole
+# words found in HF_CODEBOOK are replaced by short codes:
+#
+#   +X     X in A-Z   -> HF_CODEBOOK[0..25]    (2 chars)
+#   +dX    d in 0-9,
+#          X in A-Z0-9 -> HF_CODEBOOK[26..385]  (3 chars)
+#   ++     a literal "+"
+#
+# Codes are prefix-free, so decoding is a single left-to-right scan, and
+# only whole words are substituted, so "SUPPLYING" or "WATERFALL" are never
+# mangled.  JS8 already entropy-codes each character on air, so packing
+# into a denser alphabet would gain nothing; savings come from the
+# dictionary and from dropping characters JS8 cannot send.
+#
+# HF_CODEBOOK is part of the wire format: only ever append to it.
+
+JS8_CHARSET = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 .?/-+!")
+HF_ESCAPE = "+"
+_CODE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+HF_CODEBOOK = [
+    # 2-char codes: the longest, most frequent words
+    "EMERGENCY", "EMERGENCIA", "EVACUATION", "EVACUACION", "GUARDIANS",
+    "GUARDIANES", "GUARDIAN", "COMMUNITY", "COMUNIDAD", "CONFIRMED",
+    "CONFIRMADO", "LOCATION", "UBICACION", "POSITION", "POSICION",
+    "ASSISTANCE", "ASISTENCIA", "OPERATIONAL", "OPERATIVO", "SIMULACRO",
+    "HEARTBEAT", "IERAHKWA", "FREQUENCY", "FRECUENCIA", "RECEPCION",
+    "SOVEREIGNTY",
+    # 3-char codes
+    "MEDICAL", "MEDICO", "SHELTER", "REFUGIO", "SUPPLY", "SUPPLIES",
+    "SUMINISTROS", "WATER", "COMIDA", "ALIMENTOS", "NETWORK", "RECEIVED",
+    "RECIBIDO", "MESSAGE", "MENSAJE", "REQUEST", "SOLICITUD", "STATUS",
+    "ESTADO", "NEGATIVE", "NEGATIVO", "AFFIRMATIVE", "AFIRMATIVO",
+    "SOBERANIA", "RESPONDA", "RESPOND", "CONFIRM", "CONFIRMAR", "RECEIPT",
+    "CODIGO", "DRILL", "ALERT", "ALERTA", "WARNING", "ADVERTENCIA",
+    "CRITICAL", "CRITICO", "FUEGO", "INCENDIO", "FLOOD", "INUNDACION",
+    "EARTHQUAKE", "TERREMOTO", "SISMO", "INJURED", "HERIDO", "HERIDOS",
+    "DOCTOR", "HOSPITAL", "AMBULANCE", "AMBULANCIA", "AYUDA", "NECESITAMOS",
+    "NECESITA", "PEOPLE", "PERSONAS", "FAMILIES", "FAMILIAS", "CHILDREN",
+    "CAMINO", "CARRETERA", "BLOCKED", "BLOQUEADO", "BRIDGE", "PUENTE",
+    "POWER", "ENERGIA", "ELECTRICIDAD", "BATTERY", "BATERIA", "SIGNAL",
+    "WEATHER", "STORM", "TORMENTA", "HURRICANE", "HURACAN", "LLUVIA",
+    "NORTH", "NORTE", "SOUTH", "OESTE", "TOMORROW", "MANANA", "MORNING",
+    "NIGHT", "NOCHE", "HOURS", "HORAS", "MINUTES", "MINUTOS", "MEETING",
+    "REUNION", "COUNCIL", "CONSEJO", "VILLAGE", "PUEBLO", "RIVER",
+    "MOUNTAIN", "MONTANA", "PELIGRO", "DANGER", "SEGURO", "ARRIVED",
+    "LLEGAMOS", "LEAVING", "SALIENDO", "WAITING", "ESPERANDO", "REPEAT",
+    "REPITA", "UNKNOWN", "DESCONOCIDO", "THANKS", "GRACIAS", "PLEASE",
+    "FAVOR", "CAMBIO", "DESDE", "PEACE", "STATION", "ESTACION",
+    "OPERATOR", "OPERADOR", "TRANSMISSION", "TRANSMISION", "CONFIRMATION",
+    "CONFIRMACION", "IMMEDIATELY", "INMEDIATAMENTE", "REQUIRED",
+    "NECESARIO", "RESPONSE", "RESPUESTA", "REPORT", "REPORTE", "INFORME",
+    "CONFIRMADA", "COMUNITARIO", "COMUNITARIA", "CLOSED", "CERRADO",
+    "GENERATOR", "GENERADOR", "TONIGHT", "COASTAL",
+]
+
+HF_CODES = {}
+for _i, _word in enumerate(HF_CODEBOOK):
+    HF_CODES[_word] = HF_ESCAPE + (
+        _CODE_CHARS[_i] if _i < 26
+        else _CODE_CHARS[26 + (_i - 26) // 36] + _CODE_CHARS[(_i - 26) % 36]
+    )
+assert len(HF_CODES) == len(HF_CODEBOOK) <= 26 + 10 * 36, "duplicate or excess codebook entries"
+del _i, _word
+
+_TOKEN_RE = re.compile(r"[A-Z0-9]+|[^A-Z0-9]")
+
+
+def normalize_for_js8(text: str) -> str:
+    """Map text onto JS8_CHARSET: upper case, no accents, single spaces."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = "".join(c if c in JS8_CHARSET else " " for c in text.upper())
+    return " ".join(text.split())
+
+
+def encode_hf_body(text: str, max_chars: Optional[int] = None) -> str:
+    """Codebook-encode normalised text, truncating on a token boundary."""
+    out = []
+    length = 0
+    for token in _TOKEN_RE.findall(normalize_for_js8(text)):
+        code = HF_CODES.get(token)
+        if code is None:
+            code = HF_ESCAPE * 2 if token == HF_ESCAPE else token
+        if max_chars is not None and length + len(code) > max_chars:
+            if code is token and not out:
+                out.append(token[:max_chars])
+            break
+        out.append(code)
+        length += len(code)
+    return "".join(out).rstrip()
+
+
+def decode_hf_body(body: str) -> str:
+    """Inverse of encode_hf_body. Unknown codes pass through unchanged."""
+    out = []
+    i = 0
+    n = len(body)
+    while i < n:
+        c = body[i]
+        if c != HF_ESCAPE or i + 1 >= n:
+            out.append(c)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt == HF_ESCAPE:
+            out.append(HF_ESCAPE)
+            i += 2
+        elif "A" <= nxt <= "Z":
+            out.append(HF_CODEBOOK[ord(nxt) - 65])
+            i += 2
+        elif nxt.isdigit() and i + 2 < n and body[i + 2] in _CODE_CHARS:
+            index = 26 + int(nxt) * 36 + _CODE_CHARS.index(body[i + 2])
+            if index < len(HF_CODEBOOK):
+                out.append(HF_CODEBOOK[index])
+            else:
+                out.append(body[i:i + 3])
+            i += 3
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out)
+
 
 def compress_message(priority: str, body: str) -> str:
     """Compress a message for HF transmission.
 
-    Format: <priority_code><compressed_body>
-    Total must be <= JS8_MAX_CHARS characters.
-
-    Compression strategy:
-    - Single-char priority prefix
-    - Strip whitespace, lowercase
-    - Abbreviation table for common words
-    - Truncate to fit
+    Format: <priority_code><codebook-encoded body>
+    Total is at most JS8_MAX_CHARS characters; when the message does not
+    fit, whole words are dropped from the end.
     """
     ptype = PRIORITY_TYPES.get(priority.upper(), PRIORITY_TYPES["PEACE"])
     prefix = ptype["code"]
-
-    abbreviations = {
-        "emergency": "EMG",
-        "evacuation": "EVAC",
-        "medical": "MED",
-        "supply": "SUP",
-        "water": "H2O",
-        "food": "FD",
-        "shelter": "SHLT",
-        "guardian": "GRD",
-        "location": "LOC",
-        "confirmed": "CFM",
-        "negative": "NEG",
-        "affirmative": "AFM",
-        "assistance": "ASST",
-        "sovereignty": "SOV",
-        "ierahkwa": "IER",
-        "community": "COMM",
-        "network": "NET",
-        "operational": "OPR",
-        "frequency": "FREQ",
-        "received": "RCVD",
-        "message": "MSG",
-        "position": "POS",
-        "request": "REQ",
-        "status": "STS",
-    }
-
-    compressed = body.lower().strip()
-    for word, abbr in abbreviations.items():
-        compressed = compressed.replace(word, abbr)
-
-    # Remove redundant spaces
-    compressed = " ".join(compressed.split())
-
-    max_body = JS8_MAX_CHARS - len(prefix)
-    if len(compressed) > max_body:
-        compressed = compressed[:max_body]
-
-    return f"{prefix}{compressed}"
+    return prefix + encode_hf_body(body, JS8_MAX_CHARS - len(prefix))
 
 
 def decompress_message(encoded: str) -> tuple[str, str]:
     """Decompress an HF message back into priority and body.
 
-    Returns (priority_name, body).
+    Returns (priority_name, body).  The body comes back in JS8's upper-case
+    alphabet.
     """
     if not encoded:
         return "PEACE", ""
@@ -208,7 +294,116 @@ def decompress_message(encoded: str) -> tuple[str, str]:
             priority_name = name
             break
 
-    return priority_name, body
+    return priority_name, decode_hf_body(body)
+
+
+def _compress_message_legacy(priority: str, body: str) -> str:
+    """Previous substring-abbreviation scheme, uncapped, for benchmark comparison."""
+    ptype = PRIORITY_TYPES.get(priority.upper(), PRIORITY_TYPES["PEACE"])
+    abbreviations = {
+        "emergency": "EMG", "evacuation": "EVAC", "medical": "MED",
+        "supply": "SUP", "water": "H2O", "food": "FD", "shelter": "SHLT",
+        "guardian": "GRD", "location": "LOC", "confirmed": "CFM",
+        "negative": "NEG", "affirmative": "AFM", "assistance": "ASST",
+        "sovereignty": "SOV", "ierahkwa": "IER", "community": "COMM",
+        "network": "NET", "operational": "OPR", "frequency": "FREQ",
+        "received": "RCVD", "message": "MSG", "position": "POS",
+        "request": "REQ", "status": "STS",
+    }
+    compressed = body.lower().strip()
+    for word, abbr in abbreviations.items():
+        compressed = compressed.replace(word, abbr)
+    compressed = " ".join(compressed.split())
+    return ptype["code"] + compressed
+
+
+# Representative bridge traffic, used when no message log is supplied
+SAMPLE_MESSAGES = [
+    ("HEARTBEAT", f"{CALLSIGN} OPR"),
+    ("HEARTBEAT", f"{CALLSIGN} operational on 40m heartbeat"),
+    ("EMERGENCY", "Medical emergency at community shelter, need ambulance"),
+    ("EMERGENCY", "Emergencia medica en el refugio comunitario, necesitamos ambulancia"),
+    ("EMERGENCY", "Evacuation confirmed north bridge blocked, use south road"),
+    ("EMERGENCY", "Evacuacion confirmada, puente norte bloqueado"),
+    ("ALERT", "Hurricane warning for coastal village, move to shelter tonight"),
+    ("ALERT", "Alerta de huracan, lluvia fuerte esta noche, refugio abierto"),
+    ("ALERT", "Water supply request: 40 families waiting at the river station"),
+    ("ALERT", "Solicitud de suministros: agua y comida para 40 familias"),
+    ("PEACE", "Guardian council meeting tomorrow morning at the village"),
+    ("PEACE", "Reunion del consejo de guardianes manana en el pueblo"),
+    ("PEACE", "Message received, position confirmed, thanks"),
+    ("PEACE", "Mensaje recibido, posicion confirmada, gracias"),
+    ("PEACE", "Network status operational on frequency 7078 kHz"),
+    ("PEACE", "[SIMULACRO] Responda con su codigo de guardian para confirmar recepcion"),
+    ("PEACE", "THIS IS A DRILL. Respond with your guardian code to confirm receipt."),
+    ("ALERT", "Waterfall trail closed; supplying generators at the shelter"),
+]
+
+
+def load_message_log(path: Path) -> list[tuple[str, str]]:
+    """Read (priority, text) pairs from a message log.
+
+    Accepts JSON lines with "priority" and "text"/"body"/"message" keys,
+    or plain text with one message per line (priority PEACE).
+    """
+    messages = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                messages.append(("PEACE", line))
+                continue
+            if isinstance(record, dict):
+                text = record.get("text") or record.get("body") or record.get("message") or ""
+                if text:
+                    messages.append((str(record.get("priority", "PEACE")), str(text)))
+            elif isinstance(record, str):
+                messages.append(("PEACE", record))
+    return messages
+
+
+def benchmark_compression(messages: Optional[list[tuple[str, str]]] = None) -> dict:
+    """Compare codebook and legacy compression over a message set.
+
+    ``ratio`` is encoded characters over JS8-normalised characters, both
+    measured without the length cap; ``truncated`` counts messages that
+    would not fit JS8_MAX_CHARS; ``round_trip`` counts untruncated
+    messages whose decoded text equals the normalised input.
+    """
+    messages = messages if messages is not None else SAMPLE_MESSAGES
+    raw = normalized = coded = legacy = 0
+    truncated = legacy_truncated = round_trip = 0
+    for priority, text in messages:
+        plain = normalize_for_js8(text)
+        full = encode_hf_body(text)
+        raw += len(text)
+        normalized += len(plain)
+        coded += len(full)
+        if len(full) + 1 > JS8_MAX_CHARS:
+            truncated += 1
+        elif decompress_message(compress_message(priority, text))[1] == plain:
+            round_trip += 1
+        old = _compress_message_legacy(priority, text)
+        legacy += len(old) - 1
+        if len(old) > JS8_MAX_CHARS:
+            legacy_truncated += 1
+    count = len(messages)
+    return {
+        "messages": count,
+        "raw_chars": raw,
+        "normalized_chars": normalized,
+        "codebook_chars": coded,
+        "ratio": round(coded / normalized, 3) if normalized else None,
+        "truncated": truncated,
+        "legacy_truncated": legacy_truncated,
+        "legacy_chars": legacy,
+        "round_trip_ok": round_trip,
+        "round_trip_checked": count - truncated,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -662,4 +857,16 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="JS8Call HF Radio Bridge")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("run", help="Run the bridge (default)")
+    p_bench = sub.add_parser("benchmark", help="Measure HF message compression")
+    p_bench.add_argument("--log", type=Path, default=None,
+                         help="Message log (JSON lines or one message per line)")
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        corpus = load_message_log(args.log) if args.log else None
+        print(json.dumps(benchmark_compression(corpus), indent=2))
+    else:
+        main()
@@ -15,6 +15,7 @@ MATRIX_ROOM           Default room to bridge   (e.g. !abc:ierahkwa.org)
 MESHTASTIC_SERIAL     Serial port for device   (default: /dev/ttyUSB0)
 MESHTASTIC_CHANNEL    LoRa channel index       (default: 0)
 LORA_MAX_BYTES        Max payload bytes        (default: 230)
+LORA_ZPORT            Meshtastic port for compressed payloads (default: 287)
 PRIORITY_KEYWORDS     Comma-separated keywords that mark a message as critical
 INTERNET_CHECK_URL    URL to probe connectivity (default: https://matrix.ierahkwa.org/_matrix/client/versions)
 INTERNET_CHECK_INTERVAL  Seconds between connectivity checks (default: 30)
@@ -28,6 +29,7 @@ import logging
 import os
 import sys
 import time
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
 from collections import deque
@@ -59,6 +61,7 @@ MATRIX_ROOM = os.environ.get("MATRIX_ROOM", "")
 MESHTASTIC_SERIAL = os.environ.get("MESHTASTIC_SERIAL", "/dev/ttyUSB0")
 MESHTASTIC_CHANNEL = int(os.environ.get("MESHTASTIC_CHANNEL", "0"))
 LORA_MAX_BYTES = int(os.environ.get("LORA_MAX_BYTES", "230"))
+LORA_ZPORT = int(os.environ.get("LORA_ZPORT", "287"))
 PRIORITY_KEYWORDS = [
     kw.strip().lower()
     for kw in os.environ.get(
@@ -101,15 +104,75 @@ _node_sender_map: dict[str, str] = {}  # node_id -> first-seen sender address
 # ---------------------------------------------------------------------------
 
 
+# Messages that do not fit as plain text are sent as
+#   LORA_ZMAGIC + <dict version byte> + raw deflate(<sender_short>|<body>)
+# against a preset dictionary.  Published dictionaries must never change;
+# a new one is added under the next version byte.  Compressed payloads go
+# out on their own application port (LORA_ZPORT), which stock clients and
+# bridges that only listen on TEXT_MESSAGE_APP never deliver, instead of
+# the shared PRIVATE_APP port.
+LORA_ZMAGIC = b"\x1bZ"
+
+# Preset dictionary v1: satellite relay JSON and common alert phrasing,
+# most frequent strings last.
+LORA_ZDICT_V1 = (
+    b'"rx_count":0,"last_rssi":null,"last_snr":null,"frequency_mhz":433.0,"spreading_factor":12}'
+    b'{"id":"IER-SAT-001","lat":19.4326,"lon":-99.1332,"up":17'
+    b'"msg":"MAYDAY","lat":19.4326,"lon":-99.1332,"alt":2240.0,"sos":true,'
+    b'"node":"IER-SAT-001","ts":17'
+    b'sat|{"src":"SAT","type":"HEARTBEAT","data":{'
+    b'sat|{"src":"SAT","type":"ALERT","data":{"msg":"'
+    b' evacuacion inmediata. Punto de reunion: '
+    b' SIMULACRO de emergencia en la comunidad '
+    b'[ALERT] ALERTA: EMERGENCIA URGENTE en la red '
+    b'hf-bridge|[ALERT] sat-uplink|[SOS] '
+)
+
+LORA_ZDICTS = {1: LORA_ZDICT_V1}
+LORA_ZDICT_VERSION = 1
+
+
+def _lora_deflate(raw: bytes, version: int = LORA_ZDICT_VERSION) -> bytes:
+    comp = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, LORA_ZDICTS[version])
+    return LORA_ZMAGIC + bytes([version]) + comp.compress(raw) + comp.flush()
+
+
+def decode_from_lora(payload: bytes) -> str:
+    """Return the text of a LoRa payload, inflating dictionary-compressed ones.
+
+    Raises ValueError for an unknown dictionary version or corrupt stream.
+    """
+    if not payload.startswith(LORA_ZMAGIC):
+        return payload.decode("utf-8", errors="replace")
+    version = payload[len(LORA_ZMAGIC)] if len(payload) > len(LORA_ZMAGIC) else None
+    if version not in LORA_ZDICTS:
+        raise ValueError(f"unsupported LoRa dictionary version {version}")
+    try:
+        decomp = zlib.decompressobj(-15, zdict=LORA_ZDICTS[version])
+        raw = decomp.decompress(payload[len(LORA_ZMAGIC) + 1:]) + decomp.flush()
+    except zlib.error as exc:
+        raise ValueError(f"corrupt LoRa payload: {exc}") from exc
+    return raw.decode("utf-8", errors="replace")
+
+
 def compress_for_lora(sender: str, body: str) -> bytes:
     """Compress a message to fit within LoRa payload limits.
 
-    Format: <sender_short>|<truncated_body>
+    Format: <sender_short>|<body>
+    Sent as plain text when it fits, so stock Meshtastic clients can read
+    it; otherwise deflated against the preset dictionary.  Only if that is
+    still too large is the plain body truncated.
     The total encoded size must be <= LORA_MAX_BYTES.
     """
     sender_short = sender.split(":")[0].lstrip("@")[:12]
     prefix = f"{sender_short}|"
     prefix_bytes = prefix.encode("utf-8")
+    plain = prefix_bytes + body.encode("utf-8")
+    if len(plain) <= LORA_MAX_BYTES:
+        return plain
+    packed = _lora_deflate(plain)
+    if len(packed) <= LORA_MAX_BYTES:
+        return packed
     remaining = LORA_MAX_BYTES - len(prefix_bytes)
     if remaining <= 0:
         return prefix_bytes[:LORA_MAX_BYTES]
@@ -203,10 +266,16 @@ def send_to_lora(payload: bytes) -> bool:
     if _mesh_interface is None:
         logger.error("Meshtastic interface not initialized.")
         return False
+    # Dictionary-compressed payloads are binary; keep them off the text port
+    # and on a port legacy nodes do not listen to
+    if payload.startswith(LORA_ZMAGIC):
+        port = LORA_ZPORT
+    else:
+        port = meshtastic.portnums_pb2.PortNum.TEXT_MESSAGE_APP
     try:
         _mesh_interface.sendData(
             payload,
-            portNum=meshtastic.portnums_pb2.PortNum.TEXT_MESSAGE_APP,
+            portNum=port,
             channelIndex=MESHTASTIC_CHANNEL,
         )
         logger.info("Sent %d bytes to LoRa mesh.", len(payload))
@@ -226,8 +295,12 @@ def on_lora_receive(packet: dict, interface) -> None:
     if not text:
         # Try payload bytes
         payload = decoded.get("payload", b"")
-        if isinstance(payload, bytes):
-            text = payload.decode("utf-8", errors="replace")
+        if isinstance(payload, bytes) and payload.startswith(LORA_ZMAGIC):
+            try:
+                text = decode_from_lora(payload)
+            except ValueError as exc:
+                logger.warning("Dropping undecodable LoRa payload: %s", exc)
+                return
     if not text:
         return
 
@@ -494,6 +567,7 @@ async def main() -> None:
     # Register LoRa receive callback using the pub-sub system
     from pubsub import pub
     pub.subscribe(on_lora_receive, "meshtastic.receive.text")
+    pub.subscribe(on_lora_receive, f"meshtastic.receive.data.{LORA_ZPORT}")
 
     # Initialize Matrix client
     client = AsyncClient(MATRIX_HOMESERVER, MATRIX_USER)
@@ -29,17 +29,21 @@ Environment:
   SYNC_INTERVAL       Seconds between sync cycles (default: 60)
   LORA_DEVICE         Serial port for LoRa modem (default: /dev/ttyUSB0)
   SATELLITE_ENABLED   Enable satellite uplink (default: false)
+  SYNC_MAX_WORKERS    Peers synced concurrently per cycle (default: 8)
+  SYNC_PEER_DEADLINE  Seconds allowed per peer before it is marked failed (default: 20)
 """
 
 import hashlib
 import json
 import logging
 import os
+import queue
 import struct
 import sys
 import time
 import threading
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from dataclasses import dataclass, field, asdict, fields, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -61,6 +65,8 @@ logger = logging.getLogger("ierahkwa.sync")
 SYNC_INTERVAL = int(os.environ.get("SYNC_INTERVAL", "60"))
 LORA_DEVICE = os.environ.get("LORA_DEVICE", "/dev/ttyUSB0")
 SATELLITE_ENABLED = os.environ.get("SATELLITE_ENABLED", "false").lower() == "true"
+SYNC_MAX_WORKERS = int(os.environ.get("SYNC_MAX_WORKERS", "8"))
+SYNC_PEER_DEADLINE = float(os.environ.get("SYNC_PEER_DEADLINE", "20"))
 TOTAL_SUPPLY = 10_000_000_000_000  # 10T WMP
 
 
@@ -72,6 +78,8 @@ class SyncMsgType(IntEnum):
     BLOCK_ANNOUNCE = 0x05
     BLOCK_ACK = 0x06
     HEARTBEAT = 0x07
+    STATE_DIGEST = 0x08     # payload: truncated Merkle leaf hashes
+    STATE_DELTA = 0x09      # payload: only the fields that differ
     ALERT = 0x0F
 
 
@@ -116,8 +124,19 @@ class SyncMessage:
 
 # ── Node State ───────────────────────────────────────────────────────
 
+LEAF_DIGEST_BYTES = 4       # truncated leaf hash size in STATE_DIGEST payloads
+_EMPTY_LEAF = hashlib.sha256(b"").digest()
+
+
 @dataclass
 class WealthFundState:
+    """Fund state with a cached Merkle tree over its fields.
+
+    Each field is a leaf; assigning a field rehashes only that leaf and its
+    path to the root, so ``compute_hash`` is O(1) and peers can locate the
+    fields that differ from a digest of leaf hashes instead of shipping the
+    whole state.
+    """
     total_supply: int = TOTAL_SUPPLY
     treasury_balance: int = 0
     circulating: int = 0
@@ -130,9 +149,93 @@ class WealthFundState:
     last_block_hash: str = ""
     last_updated: str = ""
 
+    def __post_init__(self):
+        names = [f.name for f in fields(self)]
+        size = 1
+        while size < len(names):
+            size *= 2
+        object.__setattr__(self, "_leaf_index", {name: i for i, name in enumerate(names)})
+        object.__setattr__(self, "_leaf_count", size)
+        nodes = [_EMPTY_LEAF] * (2 * size)
+        for i, name in enumerate(names):
+            nodes[size + i] = self._hash_leaf(name, getattr(self, name))
+        for i in range(size - 1, 0, -1):
+            nodes[i] = hashlib.sha256(nodes[2 * i] + nodes[2 * i + 1]).digest()
+        object.__setattr__(self, "_nodes", nodes)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        nodes = self.__dict__.get("_nodes")
+        if nodes is None or name not in self._leaf_index:
+            return
+        i = self._leaf_count + self._leaf_index[name]
+        nodes[i] = self._hash_leaf(name, value)
+        i //= 2
+        while i:
+            nodes[i] = hashlib.sha256(nodes[2 * i] + nodes[2 * i + 1]).digest()
+            i //= 2
+
+    @staticmethod
+    def _hash_leaf(name: str, value) -> bytes:
+        return hashlib.sha256(f"{name}={json.dumps(value)}".encode()).digest()
+
     def compute_hash(self) -> str:
-        data = json.dumps(asdict(self), sort_keys=True).encode()
-        return hashlib.sha256(data).hexdigest()
+        return self._nodes[1].hex()
+
+    def leaf_hashes(self) -> list[bytes]:
+        start = self._leaf_count
+        return self._nodes[start : start + len(self._leaf_index)]
+
+    def encode_digest(self) -> bytes:
+        """Truncated leaf hashes, in field order, for a STATE_DIGEST payload."""
+        return b"".join(h[:LEAF_DIGEST_BYTES] for h in self.leaf_hashes())
+
+    def diff_digest(self, digest: bytes) -> list[str]:
+        """Names of fields whose leaf differs from a peer's STATE_DIGEST."""
+        names = list(self._leaf_index)
+        if len(digest) != len(names) * LEAF_DIGEST_BYTES:
+            return names
+        return [
+            name for i, (name, leaf) in enumerate(zip(names, self.leaf_hashes()))
+            if leaf[:LEAF_DIGEST_BYTES]
+            != digest[i * LEAF_DIGEST_BYTES : (i + 1) * LEAF_DIGEST_BYTES]
+        ]
+
+    def encode_delta(self, names: list[str]) -> bytes:
+        """Wire format per field: [1B field index][1B length][value].
+
+        Integers are minimal signed big-endian, strings UTF-8.
+        """
+        out = bytearray()
+        for name in names:
+            value = getattr(self, name)
+            if isinstance(value, int):
+                raw = value.to_bytes((value.bit_length() + 8) // 8 or 1, "big", signed=True)
+            else:
+                raw = str(value).encode("utf-8")
+            if len(raw) > 255:
+                raise ValueError(f"Field {name} too large for a delta ({len(raw)} bytes)")
+            out += bytes((self._leaf_index[name], len(raw))) + raw
+        return bytes(out)
+
+    @classmethod
+    def decode_delta(cls, payload: bytes) -> dict:
+        """Parse a STATE_DELTA payload into {field_name: value}."""
+        state_fields = fields(cls)
+        values = {}
+        pos = 0
+        while pos + 2 <= len(payload):
+            idx, length = payload[pos], payload[pos + 1]
+            raw = payload[pos + 2 : pos + 2 + length]
+            pos += 2 + length
+            if idx >= len(state_fields) or len(raw) != length:
+                raise ValueError(f"Malformed state delta at byte {pos}")
+            f = state_fields[idx]
+            if f.type in (int, "int"):
+                values[f.name] = int.from_bytes(raw, "big", signed=True)
+            else:
+                values[f.name] = raw.decode("utf-8")
+        return values
 
 
 @dataclass
@@ -150,6 +253,64 @@ class NexusPeer:
     synced: bool = False
 
 
+# ── Latency Histograms ───────────────────────────────────────────────
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket latency histogram (milliseconds)."""
+
+    BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._total = 0
+        self._failures = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, ms: float, ok: bool = True):
+        idx = len(self.BUCKETS_MS)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                idx = i
+                break
+        with self._lock:
+            self._counts[idx] += 1
+            self._total += 1
+            self._sum_ms += ms
+            self._max_ms = max(self._max_ms, ms)
+            if not ok:
+                self._failures += 1
+
+    def _quantile(self, q: float) -> float:
+        """Upper bucket bound containing the q-quantile (caller holds lock)."""
+        target = q * self._total
+        running = 0
+        for i, count in enumerate(self._counts):
+            running += count
+            if running >= target and count:
+                if i < len(self.BUCKETS_MS):
+                    return min(float(self.BUCKETS_MS[i]), round(self._max_ms, 1))
+                return round(self._max_ms, 1)
+        return self._max_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            if not self._total:
+                return {"count": 0}
+            buckets = {f"le_{b}": c for b, c in zip(self.BUCKETS_MS, self._counts)}
+            buckets["le_inf"] = self._counts[-1]
+            return {
+                "count": self._total,
+                "failures": self._failures,
+                "avg_ms": round(self._sum_ms / self._total, 1),
+                "p50_ms": self._quantile(0.5),
+                "p95_ms": self._quantile(0.95),
+                "max_ms": round(self._max_ms, 1),
+                "buckets": buckets,
+            }
+
+
 # ── Transport Adapters ───────────────────────────────────────────────
 
 class GrpcTransport:
@@ -168,12 +329,12 @@ class GrpcTransport:
         except Exception:
             return None
 
-    def request_state(self, peer: NexusPeer) -> Optional[WealthFundState]:
+    def request_state(self, peer: NexusPeer, timeout: float = 15) -> Optional[WealthFundState]:
         try:
             import urllib.request
             url = f"http://{peer.endpoint}:{peer.port}/api/v1/state"
             start = time.monotonic()
-            with urllib.request.urlopen(url, timeout=15) as resp:
+            with urllib.request.urlopen(url, timeout=timeout) as resp:
                 data = json.loads(resp.read().decode())
             peer.latency_ms = round((time.monotonic() - start) * 1000, 1)
             return WealthFundState(**data)
@@ -187,6 +348,12 @@ class LoRaTransport:
         self.device = device
         self.baud = baud
         self._serial = None
+        # One radio shared by all concurrent peer syncs
+        self._io_lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._serial is not None
 
     def _connect(self):
         if self._serial is not None:
@@ -201,6 +368,10 @@ class LoRaTransport:
             logger.warning("LoRa connect failed: %s", exc)
 
     def send(self, msg: SyncMessage) -> bool:
+        with self._io_lock:
+            return self._send_locked(msg)
+
+    def _send_locked(self, msg: SyncMessage) -> bool:
         self._connect()
         if self._serial is None:
             return False
@@ -218,6 +389,10 @@ class LoRaTransport:
             return False
 
     def receive(self, timeout: float = 5.0) -> Optional[SyncMessage]:
+        with self._io_lock:
+            return self._receive_locked(timeout)
+
+    def _receive_locked(self, timeout: float) -> Optional[SyncMessage]:
         self._connect()
         if self._serial is None:
             return None
@@ -239,7 +414,14 @@ class LoRaTransport:
 class SatelliteTransport:
     """TinyGS / Iridium SBD transport for extreme fallback."""
 
+    def __init__(self):
+        self._io_lock = threading.Lock()
+
     def send(self, msg: SyncMessage) -> bool:
+        with self._io_lock:
+            return self._send_locked(msg)
+
+    def _send_locked(self, msg: SyncMessage) -> bool:
         frame = msg.serialize()
         if len(frame) > 340:
             logger.warning("Satellite payload too large (%d bytes), truncating", len(frame))
@@ -289,6 +471,14 @@ class NexusSynchronizer:
         self._running = False
         self._lock = threading.Lock()
         self._divergences: list[dict] = []
+        self.max_workers = SYNC_MAX_WORKERS
+        self.peer_deadline = SYNC_PEER_DEADLINE
+        self._latency = {
+            "grpc": LatencyHistogram(),
+            "lora": LatencyHistogram(),
+            "satellite": LatencyHistogram(),
+        }
+        self._last_cycle: dict = {}
 
     def add_peer(self, peer: NexusPeer):
         self.peers[peer.node_id] = peer
@@ -315,34 +505,142 @@ class NexusSynchronizer:
             state_hash=bytes.fromhex(self.state.compute_hash()[:64]),
         )
 
-    def sync_peer(self, peer: NexusPeer) -> bool:
-        """Attempt to sync with a single peer using cascading transports."""
+    def _timed(self, transport: str, func, *args):
+        """Call a transport function and record its latency."""
+        start = time.monotonic()
+        result = None
+        try:
+            result = func(*args)
+            return result
+        finally:
+            self._latency[transport].observe(
+                (time.monotonic() - start) * 1000, ok=bool(result)
+            )
+
+    def _build_digest(self) -> SyncMessage:
+        return SyncMessage(
+            msg_type=SyncMsgType.STATE_DIGEST,
+            sender_id=self.numeric_id,
+            timestamp=int(time.time()),
+            supply=self.state.total_supply,
+            state_hash=bytes.fromhex(self.state.compute_hash()),
+            payload=self.state.encode_digest(),
+        )
+
+    def handle_message(self, msg: SyncMessage) -> Optional[SyncMessage]:
+        """Process a message from a constrained link and return the reply, if any.
+
+        HEARTBEAT with a different root -> reply STATE_DIGEST.
+        STATE_DIGEST -> reply STATE_DELTA carrying only the differing fields.
+        STATE_DELTA -> reconcile as if the full remote state had been fetched.
+        """
+        local_root = bytes.fromhex(self.state.compute_hash())
+        if msg.msg_type == SyncMsgType.HEARTBEAT:
+            if msg.state_hash != local_root:
+                return self._build_digest()
+            return None
+
+        if msg.msg_type == SyncMsgType.STATE_DIGEST:
+            if msg.state_hash == local_root:
+                return None
+            with self._lock:
+                names = self.state.diff_digest(msg.payload)
+                payload = self.state.encode_delta(names)
+            logger.info("Delta for node %d: %d fields, %d bytes (full state %d bytes)",
+                        msg.sender_id, len(names), len(payload),
+                        len(json.dumps(asdict(self.state))))
+            return SyncMessage(
+                msg_type=SyncMsgType.STATE_DELTA,
+                sender_id=self.numeric_id,
+                timestamp=int(time.time()),
+                supply=self.state.total_supply,
+                state_hash=local_root,
+                payload=payload,
+            )
+
+        if msg.msg_type == SyncMsgType.STATE_DELTA:
+            peer = next(
+                (p for p in self.peers.values() if p.numeric_id == msg.sender_id), None
+            )
+            if peer is None:
+                logger.warning("STATE_DELTA from unknown node %d ignored", msg.sender_id)
+                return None
+            try:
+                values = WealthFundState.decode_delta(msg.payload)
+            except ValueError as exc:
+                logger.warning("Bad STATE_DELTA from %s: %s", peer.node_id, exc)
+                return None
+            with self._lock:
+                remote = replace(self.state, **values)
+            self._reconcile(peer, remote)
+            return None
+
+        return None
+
+    def _listen(self, duration: float):
+        """Serve LoRa digest/delta exchanges until ``duration`` seconds pass."""
+        deadline = time.monotonic() + duration
+        while self._running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            msg = self.lora.receive(timeout=min(5.0, remaining))
+            if msg is None:
+                if not self.lora.connected:
+                    time.sleep(max(0.0, deadline - time.monotonic()))
+                    return
+                continue
+            reply = self.handle_message(msg)
+            if reply is not None:
+                self.lora.send(reply)
+
+    def sync_peer(self, peer: NexusPeer, timeout: float = 15,
+                  cancelled: Optional[threading.Event] = None) -> bool:
+        """Attempt to sync with a single peer using cascading transports.
+
+        ``cancelled`` is set (under ``_lock``) by run_sync_cycle once the
+        peer's deadline has passed; from then on this call neither touches
+        ``peer`` nor the local state, so an abandoned thread cannot
+        overwrite the TIMEOUT verdict when its request finally returns.
+        """
         # Try gRPC / HTTP first
-        remote_state = self.grpc.request_state(peer)
+        remote_state = self._timed("grpc", self.grpc.request_state, peer, timeout)
         if remote_state:
-            return self._reconcile(peer, remote_state)
+            return self._reconcile(peer, remote_state, cancelled)
+        if cancelled is not None and cancelled.is_set():
+            return False
 
         # Fallback: LoRa heartbeat
         hb = self._build_heartbeat()
-        if self.lora.send(hb):
-            peer.transport = "lora"
-            peer.last_seen = time.time()
-            logger.info("  [%s] LoRa heartbeat sent", peer.node_id)
-            return True
+        if self._timed("lora", self.lora.send, hb):
+            return self._mark_reached(peer, "lora", cancelled)
 
         # Emergency: Satellite
-        if self.satellite:
-            if self.satellite.send(hb):
-                peer.transport = "satellite"
-                peer.last_seen = time.time()
-                logger.info("  [%s] Satellite uplink sent", peer.node_id)
-                return True
+        if self.satellite and not (cancelled is not None and cancelled.is_set()):
+            if self._timed("satellite", self.satellite.send, hb):
+                return self._mark_reached(peer, "satellite", cancelled)
 
-        peer.synced = False
+        with self._lock:
+            if cancelled is None or not cancelled.is_set():
+                peer.synced = False
         return False
 
-    def _reconcile(self, peer: NexusPeer, remote: WealthFundState) -> bool:
+    def _mark_reached(self, peer: NexusPeer, transport: str,
+                      cancelled: Optional[threading.Event]) -> bool:
         with self._lock:
+            if cancelled is not None and cancelled.is_set():
+                return False
+            peer.transport = transport
+            peer.last_seen = time.time()
+        logger.info("  [%s] %s sent", peer.node_id,
+                    "LoRa heartbeat" if transport == "lora" else "Satellite uplink")
+        return True
+
+    def _reconcile(self, peer: NexusPeer, remote: WealthFundState,
+                   cancelled: Optional[threading.Event] = None) -> bool:
+        with self._lock:
+            if cancelled is not None and cancelled.is_set():
+                return False
             local_hash = self.state.compute_hash()
             remote_hash = remote.compute_hash()
 
@@ -380,25 +678,98 @@ class NexusSynchronizer:
             return True
 
     def run_sync_cycle(self):
+        """Sync all peers concurrently.
+
+        At most ``max_workers`` peers are in flight at once, each on its own
+        daemon thread.  Every peer gets ``peer_deadline`` seconds from the
+        moment its sync starts; when that passes it is reported as timed
+        out, its cancel flag is set so the abandoned thread cannot change
+        any state, and its slot goes to the next queued peer.  One dead peer
+        therefore never delays or eats into the budget of the others.
+        """
         logger.info("=== SYNC CYCLE %s ===", datetime.now(timezone.utc).strftime("%H:%M:%S"))
         logger.info("Local state hash: %s", self.state.compute_hash()[:16])
 
+        peers = list(self.peers.values())
+        cycle_start = time.monotonic()
         synced_count = 0
-        for peer in self.peers.values():
-            ok = self.sync_peer(peer)
-            if ok:
-                synced_count += 1
-            logger.info("  [%s] %s via %s (latency=%.0fms)",
-                        peer.node_id,
-                        "SYNCED" if peer.synced else "FAILED",
-                        peer.transport,
-                        peer.latency_ms)
-
-        logger.info("Sync: %d/%d peers | Divergences: %d",
-                     synced_count, len(self.peers), len(self._divergences))
+        timed_out = []
+
+        if peers:
+            workers = max(1, min(self.max_workers, len(peers)))
+            request_timeout = min(15, self.peer_deadline)
+            results: queue.Queue = queue.Queue()
+            waiting = deque(peers)
+            # node_id -> (peer, deadline, cancel flag)
+            running: dict[str, tuple[NexusPeer, float, threading.Event]] = {}
+
+            while waiting or running:
+                while waiting and len(running) < workers:
+                    peer = waiting.popleft()
+                    cancelled = threading.Event()
+                    running[peer.node_id] = (peer, time.monotonic() + self.peer_deadline,
+                                             cancelled)
+                    threading.Thread(
+                        target=self._sync_worker,
+                        args=(peer, request_timeout, cancelled, results),
+                        name=f"nexus-sync-{peer.node_id}", daemon=True,
+                    ).start()
+
+                next_deadline = min(deadline for _, deadline, _ in running.values())
+                try:
+                    node_id, ok, error = results.get(
+                        timeout=max(0.0, next_deadline - time.monotonic()))
+                except queue.Empty:
+                    now = time.monotonic()
+                    for node_id, (peer, deadline, cancelled) in list(running.items()):
+                        if deadline > now:
+                            continue
+                        with self._lock:
+                            cancelled.set()
+                            peer.synced = False
+                        del running[node_id]
+                        timed_out.append(node_id)
+                        logger.warning("  [%s] TIMEOUT after %gs deadline",
+                                       node_id, self.peer_deadline)
+                    continue
+
+                if node_id not in running:
+                    # Late result from a peer already reported as TIMEOUT
+                    continue
+                peer, _, _ = running.pop(node_id)
+                if error is not None:
+                    logger.error("  [%s] sync error: %s", node_id, error)
+                    peer.synced = False
+                if ok:
+                    synced_count += 1
+                logger.info("  [%s] %s via %s (latency=%.0fms)",
+                            peer.node_id,
+                            "SYNCED" if peer.synced else "FAILED",
+                            peer.transport,
+                            peer.latency_ms)
+
+        duration = time.monotonic() - cycle_start
+        self._last_cycle = {
+            "duration_s": round(duration, 3),
+            "peers": len(peers),
+            "synced": synced_count,
+            "timed_out": timed_out,
+            "finished": datetime.now(timezone.utc).isoformat(),
+        }
+
+        logger.info("Sync: %d/%d peers in %.1fs | Timeouts: %d | Divergences: %d",
+                     synced_count, len(self.peers), duration, len(timed_out),
+                     len(self._divergences))
 
         return synced_count
 
+    def _sync_worker(self, peer: NexusPeer, timeout: float,
+                     cancelled: threading.Event, results: queue.Queue) -> None:
+        try:
+            results.put((peer.node_id, self.sync_peer(peer, timeout, cancelled), None))
+        except Exception as exc:
+            results.put((peer.node_id, False, exc))
+
     def start(self, interval: int = SYNC_INTERVAL):
         self._running = True
         logger.info("Synchronizer starting (node=%s, interval=%ds, peers=%d)",
@@ -409,7 +780,7 @@ class NexusSynchronizer:
                 self.run_sync_cycle()
             except Exception as exc:
                 logger.error("Sync cycle error: %s", exc)
-            time.sleep(interval)
+            self._listen(interval)
 
     def stop(self):
         self._running = False
@@ -424,6 +795,10 @@ class NexusSynchronizer:
             "peers_synced": sum(1 for p in self.peers.values() if p.synced),
             "divergences": len(self._divergences),
             "satellite_enabled": self.satellite is not None,
+            "last_cycle": self._last_cycle,
+            "transport_latency_ms": {
+                name: hist.snapshot() for name, hist in self._latency.items()
+            },
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
@@ -437,10 +812,16 @@ def main():
     parser.add_argument("--interval", type=int, default=SYNC_INTERVAL, help="Sync interval (seconds)")
     parser.add_argument("--once", action="store_true", help="Run one cycle and exit")
     parser.add_argument("--status", action="store_true", help="Print status JSON and exit")
+    parser.add_argument("--workers", type=int, default=SYNC_MAX_WORKERS,
+                        help="Peers synced concurrently per cycle")
+    parser.add_argument("--peer-deadline", type=float, default=SYNC_PEER_DEADLINE,
+                        help="Seconds allowed per peer before it is marked failed")
     args = parser.parse_args()
 
     numeric = int(args.node_id.split("-")[-1]) if "-" in args.node_id else 1
     sync = NexusSynchronizer(local_id=args.node_id, numeric_id=numeric)
+    sync.max_workers = args.workers
+    sync.peer_deadline = args.peer_deadline
 
     # Load peers
     try:
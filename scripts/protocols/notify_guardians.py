@@ -13,9 +13,14 @@ NTFY_AUTH_TOKEN       Optional bearer token for authenticated servers
 SIGNING_KEY           Hex-encoded HMAC-SHA256 key  (optional, for signature verification)
 RATE_LIMIT_RED        Min seconds between RED alerts per region (default: 3600)
 RATE_LIMIT_WARNING    Min seconds between WARNING alerts per region (default: 600)
+                      (rate limits are shared across processes; see
+                      alert_limiter.py for burst settings and the store path)
 GUARDIAN_LIST_PATH    Path to JSON file listing guardians and regions (optional)
 MAX_RETRIES           Retry count for HTTP failures (default: 3)
 RETRY_DELAY           Seconds between retries      (default: 5)
+                      (batch sends back off exponentially from this)
+RETRY_DELAY_MAX       Backoff ceiling for batch sends (default: 60)
+NOTIFY_WORKERS        Concurrent deliveries / pooled connections (default: 32)
 LOG_DIR               Logging directory             (default: logs/)
 """
 
@@ -24,17 +29,26 @@ import hmac
 import json
 import logging
 import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     sys.exit("requests is required: pip install requests")
 
+try:
+    from scripts.protocols.alert_limiter import get_limiter
+except ImportError:
+    from alert_limiter import get_limiter
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -43,11 +57,11 @@ NTFY_URL = os.environ.get("NTFY_URL", "https://ntfy.sh")
 NTFY_TOPIC_PREFIX = os.environ.get("NTFY_TOPIC_PREFIX", "ierahkwa")
 NTFY_AUTH_TOKEN = os.environ.get("NTFY_AUTH_TOKEN", "")
 SIGNING_KEY = os.environ.get("SIGNING_KEY", "")
-RATE_LIMIT_RED = int(os.environ.get("RATE_LIMIT_RED", "3600"))
-RATE_LIMIT_WARNING = int(os.environ.get("RATE_LIMIT_WARNING", "600"))
 GUARDIAN_LIST_PATH = os.environ.get("GUARDIAN_LIST_PATH", "")
 MAX_RETRIES = int(os.environ.get("MAX_RETRIES", "3"))
 RETRY_DELAY = float(os.environ.get("RETRY_DELAY", "5"))
+RETRY_DELAY_MAX = float(os.environ.get("RETRY_DELAY_MAX", "60"))
+NOTIFY_WORKERS = int(os.environ.get("NOTIFY_WORKERS", "32"))
 LOG_DIR = Path(os.environ.get("LOG_DIR", "logs"))
 
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -63,30 +77,18 @@ logging.basicConfig(
 logger = logging.getLogger("ierahkwa.notify")
 
 # ---------------------------------------------------------------------------
-# Rate limiter state
+# Rate limiting (shared with other alert senders via alert_limiter)
 # ---------------------------------------------------------------------------
 
-# Key: (level, region) -> timestamp of last alert
-_rate_limit_tracker: dict[tuple[int, str], float] = {}
 
+def _acquire_alert(level: int, region: str) -> bool:
+    """Take a rate-limit token for level/region; False if rate-limited."""
+    return get_limiter().acquire_guardian(level, region, scope="guardians")
 
-def _is_rate_limited(level: int, region: str) -> bool:
-    """Check whether an alert at the given level/region is rate-limited."""
-    key = (level, region)
-    now = time.time()
-    last = _rate_limit_tracker.get(key)
-    if last is None:
-        return False
-    if level >= 5:
-        return (now - last) < RATE_LIMIT_RED
-    if level >= 4:
-        return (now - last) < RATE_LIMIT_WARNING
-    # Info-level alerts are not rate-limited
-    return False
 
-
-def _record_alert(level: int, region: str) -> None:
-    _rate_limit_tracker[(level, region)] = time.time()
+def _refund_alert(level: int, region: str) -> None:
+    """Give the token back when nothing was delivered."""
+    get_limiter().refund_guardian(level, region, scope="guardians")
 
 # ---------------------------------------------------------------------------
 # Digital signature
@@ -114,8 +116,13 @@ def verify_signature(message: str, timestamp: str, signature: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def load_guardians() -> list[dict]:
-    """Load guardian list from JSON file.
+class GuardianRegistry:
+    """Cached guardian list with a hierarchical region index.
+
+    The JSON file is re-read only when its mtime or size changes.  Each
+    guardian is indexed under its full region code and every hyphen
+    prefix of it, so ``MX`` matches ``MX-OAX`` and ``MX-OAX-01``.  Lookups
+    are case-insensitive.  If a reload fails, the last good list is kept.
 
     Expected format:
     [
@@ -123,18 +130,92 @@ def load_guardians() -> list[dict]:
         ...
     ]
     """
-    if not GUARDIAN_LIST_PATH:
-        return []
-    path = Path(GUARDIAN_LIST_PATH)
-    if not path.exists():
-        logger.warning("Guardian list not found at %s", path)
-        return []
-    with open(path, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
-    if not isinstance(data, list):
-        logger.error("Guardian list must be a JSON array.")
-        return []
-    return data
+
+    def __init__(self, path: str):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._stamp: Optional[tuple[int, int]] = None
+        self._guardians: list[dict] = []
+        self._by_region: dict[str, list[dict]] = {}
+        self.loads = 0
+
+    @staticmethod
+    def region_keys(region: str) -> list[str]:
+        """``MX-OAX-01`` -> ``["MX", "MX-OAX", "MX-OAX-01"]``."""
+        parts = region.upper().split("-")
+        return ["-".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+    def _refresh(self) -> None:
+        if self.path is None:
+            return
+        try:
+            st = self.path.stat()
+        except OSError:
+            if self._stamp != (0, -1):
+                logger.warning("Guardian list not found at %s", self.path)
+                self._stamp = (0, -1)
+                self._guardians, self._by_region = [], {}
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp  # don't retry a bad file until it changes again
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.error("Cannot load guardian list %s: %s", self.path, exc)
+            return
+        if not isinstance(data, list):
+            logger.error("Guardian list must be a JSON array.")
+            return
+
+        guardians = [g for g in data if isinstance(g, dict)]
+        by_region: dict[str, list[dict]] = {}
+        for guardian in guardians:
+            for key in self.region_keys(guardian.get("region", "global")):
+                by_region.setdefault(key, []).append(guardian)
+        self._guardians, self._by_region = guardians, by_region
+        self.loads += 1
+        logger.info("Guardian registry loaded: %d guardians, %d region keys",
+                    len(guardians), len(by_region))
+
+    def all(self) -> list[dict]:
+        """Every guardian, in file order."""
+        with self._lock:
+            self._refresh()
+            return list(self._guardians)
+
+    def in_region(self, region: str) -> list[dict]:
+        """Guardians whose region is ``region`` or nested under it."""
+        with self._lock:
+            self._refresh()
+            return list(self._by_region.get(region.upper(), []))
+
+    def regions(self) -> dict[str, int]:
+        """Guardian count per indexed region key."""
+        with self._lock:
+            self._refresh()
+            return {key: len(members) for key, members in sorted(self._by_region.items())}
+
+
+_registries: dict[str, GuardianRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(path: Optional[str] = None) -> GuardianRegistry:
+    """Shared registry for ``path`` (default GUARDIAN_LIST_PATH)."""
+    path = GUARDIAN_LIST_PATH if path is None else path
+    with _registries_lock:
+        registry = _registries.get(path)
+        if registry is None:
+            registry = _registries[path] = GuardianRegistry(path)
+        return registry
+
+
+def load_guardians() -> list[dict]:
+    """Load guardian list from the cached registry (see GuardianRegistry)."""
+    return get_registry().all()
 
 # ---------------------------------------------------------------------------
 # Core alert function
@@ -176,37 +257,21 @@ def send_alert(
     """
     level = max(1, min(5, level))
 
-    if _is_rate_limited(level, region):
+    if not _acquire_alert(level, region):
         logger.info(
             "Alert suppressed (rate limit) -- level=%d region=%s", level, region
         )
         return False
 
-    priority_str, label = LEVEL_MAP.get(level, ("default", "Info"))
     timestamp = datetime.now(timezone.utc).isoformat()
     signature = compute_signature(message, timestamp)
-
     topic = topic_override or f"{NTFY_TOPIC_PREFIX}-{region}"
-    url = f"{NTFY_URL}/{topic}"
-
-    headers = {
-        "Title": f"[{label}] Ierahkwa -- {region}",
-        "Priority": priority_str,
-        "Tags": _level_tags(level),
-        "X-Timestamp": timestamp,
-    }
-    if signature:
-        headers["X-Signature"] = signature
-    if NTFY_AUTH_TOKEN:
-        headers["Authorization"] = f"Bearer {NTFY_AUTH_TOKEN}"
-
+    url, headers = _build_request(level, region, topic, timestamp, signature)
     body = message.encode("utf-8")
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            resp = requests.post(url, data=body, headers=headers, timeout=15)
-            resp.raise_for_status()
-            _record_alert(level, region)
+            _deliver(url, body, headers)
             logger.info(
                 "Alert sent -- level=%d region=%s topic=%s", level, region, topic
             )
@@ -219,9 +284,53 @@ def send_alert(
                 time.sleep(RETRY_DELAY)
 
     logger.error("Failed to send alert after %d attempts.", MAX_RETRIES)
+    _refund_alert(level, region)
     return False
 
 
+def _build_request(level: int, region: str, topic: str,
+                   timestamp: str, signature: str) -> tuple[str, dict]:
+    """Return (url, headers) for one ntfy publish."""
+    priority_str, label = LEVEL_MAP.get(level, ("default", "Info"))
+    headers = {
+        "Title": f"[{label}] Ierahkwa -- {region}",
+        "Priority": priority_str,
+        "Tags": _level_tags(level),
+        "X-Timestamp": timestamp,
+    }
+    if signature:
+        headers["X-Signature"] = signature
+    if NTFY_AUTH_TOKEN:
+        headers["Authorization"] = f"Bearer {NTFY_AUTH_TOKEN}"
+    return f"{NTFY_URL}/{topic}", headers
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session with room for NOTIFY_WORKERS connections.
+
+    Retries are handled by the callers, so the adapter does not retry.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=NOTIFY_WORKERS)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _deliver(url: str, body: bytes, headers: dict) -> None:
+    """One publish attempt; raises requests.RequestException on failure."""
+    resp = get_session().post(url, data=body, headers=headers, timeout=15)
+    resp.raise_for_status()
+
+
 def _level_tags(level: int) -> str:
     if level >= 5:
         return "rotating_light,skull"
@@ -234,40 +343,153 @@ def _level_tags(level: int) -> str:
 # ---------------------------------------------------------------------------
 
 
+class _Delivery:
+    __slots__ = ("region", "topic", "url", "headers", "attempts", "due")
+
+    def __init__(self, region: str, topic: str, url: str, headers: dict):
+        self.region = region
+        self.topic = topic
+        self.url = url
+        self.headers = headers
+        self.attempts = 0
+        self.due = 0.0
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with equal jitter, starting at RETRY_DELAY.
+
+    The delay is drawn from [ceiling/2, ceiling], so retries are spread out
+    but never fire sooner than half the nominal backoff.
+    """
+    ceiling = min(RETRY_DELAY_MAX, RETRY_DELAY * (2 ** (attempt - 1)))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def dispatch(deliveries: list[_Delivery], body: bytes,
+             workers: int = NOTIFY_WORKERS) -> dict:
+    """Publish ``body`` to every delivery concurrently.
+
+    Attempts run on a thread pool sharing one keep-alive session.  A failed
+    attempt does not hold its worker: it is re-queued with its own backoff
+    while other topics keep flowing, up to MAX_RETRIES attempts each.
+
+    Returns {"sent": [...], "failed": [...], "attempts": n, "latencies": [...]}
+    where latencies are seconds from dispatch start to each success.
+    """
+    result = {"sent": [], "failed": [], "attempts": 0, "latencies": []}
+    if not deliveries:
+        return result
+
+    start = time.monotonic()
+    waiting = list(deliveries)  # due for (re)try, ordered by due time
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(deliveries))),
+                            thread_name_prefix="notify") as pool:
+        while waiting or in_flight:
+            now = time.monotonic()
+            while waiting and waiting[0].due <= now:
+                item = waiting.pop(0)
+                item.attempts += 1
+                result["attempts"] += 1
+                in_flight[pool.submit(_deliver, item.url, body, item.headers)] = item
+
+            timeout = max(0.0, waiting[0].due - now) if waiting else None
+            if not in_flight:
+                time.sleep(timeout)
+                continue
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                exc = future.exception()
+                if exc is None:
+                    result["sent"].append(item)
+                    result["latencies"].append(time.monotonic() - start)
+                    continue
+                logger.warning("ntfy %s attempt %d/%d failed: %s",
+                               item.topic, item.attempts, MAX_RETRIES, exc)
+                if item.attempts >= MAX_RETRIES:
+                    result["failed"].append(item)
+                else:
+                    item.due = time.monotonic() + _backoff(item.attempts)
+                    waiting.append(item)
+                    waiting.sort(key=lambda d: d.due)
+    return result
+
+
 def notify_all_guardians(level: int, message: str, region_filter: Optional[str] = None) -> dict:
     """Send an alert to all guardians, optionally filtered by region.
 
-    Returns a dict with counts: {"sent": N, "skipped": N, "failed": N}.
-    """
-    guardians = load_guardians()
-    if not guardians:
-        # Fall back to default topic
-        success = send_alert(level, message)
-        return {"sent": int(success), "skipped": 0, "failed": int(not success)}
+    ``region_filter`` is hierarchical: ``MX`` reaches ``MX-OAX`` and
+    every other ``MX-*`` guardian.  One rate-limit token is taken per
+    region before dispatch, so every guardian in a region receives the
+    alert (not just the first), and it is refunded if nobody in that
+    region could be reached.  Deliveries run concurrently through
+    dispatch().
 
-    stats = {"sent": 0, "skipped": 0, "failed": 0}
+    Returns a dict with counts {"sent", "skipped", "failed", "rate_limited"}
+    plus batch timing: elapsed_ms, attempts, and p50/p95/max delivery ms.
+    """
+    level = max(1, min(5, level))
+    registry = get_registry()
+    guardians = registry.all()
+    fallback = not guardians
+    if fallback:
+        # Fall back to the default topic, through the same path so the
+        # result carries the same keys
+        guardians = [{"region": "global", "topic": "global"}]
+
+    stats = {"sent": 0, "skipped": 0, "failed": 0, "rate_limited": 0}
+    if region_filter and not fallback:
+        matched = registry.in_region(region_filter)
+        stats["skipped"] = len(guardians) - len(matched)
+        guardians = matched
+    timestamp = datetime.now(timezone.utc).isoformat()
+    signature = compute_signature(message, timestamp)
+    limited: dict[str, bool] = {}
+    deliveries = []
     for guardian in guardians:
         g_region = guardian.get("region", "global")
         g_topic = guardian.get("topic", "")
-        if region_filter and g_region != region_filter:
-            stats["skipped"] += 1
-            continue
         if not g_topic:
             stats["skipped"] += 1
             continue
+        if g_region not in limited:
+            limited[g_region] = not _acquire_alert(level, g_region)
+        if limited[g_region]:
+            stats["rate_limited"] += 1
+            continue
 
         full_topic = f"{NTFY_TOPIC_PREFIX}-{g_topic}"
-        success = send_alert(level, message, region=g_region, topic_override=full_topic)
-        if success:
-            stats["sent"] += 1
-        else:
-            stats["failed"] += 1
+        url, headers = _build_request(level, g_region, full_topic, timestamp, signature)
+        deliveries.append(_Delivery(g_region, full_topic, url, headers))
+
+    start = time.monotonic()
+    outcome = dispatch(deliveries, message.encode("utf-8"))
+    elapsed = time.monotonic() - start
+
+    delivered = {item.region for item in outcome["sent"]}
+    for region in {item.region for item in deliveries} - delivered:
+        _refund_alert(level, region)
+    stats["sent"] = len(outcome["sent"])
+    stats["failed"] = len(outcome["failed"])
+    stats["attempts"] = outcome["attempts"]
+    stats["elapsed_ms"] = round(elapsed * 1000, 1)
+    latencies = sorted(outcome["latencies"])
+    if latencies:
+        stats["p50_ms"] = round(latencies[int(0.50 * (len(latencies) - 1))] * 1000, 1)
+        stats["p95_ms"] = round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1)
+        stats["max_ms"] = round(latencies[-1] * 1000, 1)
+    for item in outcome["failed"]:
+        logger.error("Failed to notify %s after %d attempts.", item.topic, item.attempts)
+    if stats["rate_limited"]:
+        logger.info("Alert suppressed (rate limit) for %d guardians", stats["rate_limited"])
 
     logger.info(
-        "Batch notification complete -- sent=%d skipped=%d failed=%d",
+        "Batch notification complete -- sent=%d skipped=%d failed=%d in %.0f ms",
         stats["sent"],
         stats["skipped"],
         stats["failed"],
+        stats["elapsed_ms"],
     )
     return stats
 
@@ -287,7 +509,8 @@ def main() -> None:
     )
     parser.add_argument("message", help="Notification message body")
     parser.add_argument(
-        "--region", default="global", help="Target region code (default: global)"
+        "--region", default="global",
+        help="Target region code; with --batch a prefix like MX matches MX-OAX (default: global)"
     )
     parser.add_argument(
         "--batch", action="store_true", help="Send to all guardians in the list"
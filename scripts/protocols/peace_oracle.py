@@ -35,6 +35,11 @@ try:
 except ImportError:
     sys.exit("requests is required: pip install requests")
 
+try:
+    from scripts.protocols.alert_limiter import get_limiter
+except ImportError:
+    from alert_limiter import get_limiter
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -220,16 +225,13 @@ def fetch_acled_events(page: int = 1, page_size: int = 500) -> list[dict]:
 # Notifications via ntfy
 # ---------------------------------------------------------------------------
 
-_last_red_alert: dict[str, float] = {}  # region -> timestamp
-
-
 def send_ntfy_alert(event: dict) -> None:
     """Send a push notification via ntfy for a RED-level event."""
     region = event.get("country", "Unknown")
-    now = time.time()
 
-    # Rate limit: max 1 RED alert per hour per region
-    if region in _last_red_alert and (now - _last_red_alert[region]) < 3600:
+    # Rate limit: max 1 RED alert per hour per region, shared across processes
+    limiter = get_limiter()
+    if not limiter.acquire_guardian(5, region, scope="peace", interval=3600, burst=1):
         logger.info("RED alert for %s suppressed (rate limit).", region)
         return
 
@@ -251,7 +253,6 @@ def send_ntfy_alert(event: dict) -> None:
         try:
             resp = requests.post(url, data=body.encode("utf-8"), headers=headers, timeout=15)
             resp.raise_for_status()
-            _last_red_alert[region] = now
             logger.info("RED alert sent for %s via ntfy.", region)
             return
         except requests.RequestException as exc:
@@ -259,6 +260,7 @@ def send_ntfy_alert(event: dict) -> None:
             if attempt < MAX_RETRIES:
                 time.sleep(RETRY_DELAY)
     logger.error("Failed to send ntfy alert for %s.", region)
+    limiter.refund_guardian(5, region, scope="peace", interval=3600, burst=1)
 
 # ---------------------------------------------------------------------------
 # Main loop
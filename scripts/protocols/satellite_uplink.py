@@ -22,6 +22,12 @@ SAT_GPS_LAT            Station latitude               (default: 19.4326)
 SAT_GPS_LON            Station longitude              (default: -99.1332)
 SAT_GPS_ALT            Station altitude in meters     (default: 2240)
 SAT_TLE_PATH           Path to TLE data file          (default: data/tle_catalog.json)
+SAT_MTU                Max radio payload in bytes     (default: 252)
+SAT_TX_GUARD_S         Guard time between frames, s   (default: 0.5)
+SAT_FRAME_CODEC        Newest payload codec this node
+                       advertises and may emit        (default: 2, preset dictionary v1)
+SAT_PEER_TTL_H         Hours a peer's codec
+                       advertisement stays valid      (default: 72)
 MATRIX_HOMESERVER      Matrix server URL              (default: https://matrix.ierahkwa.org)
 MATRIX_USER            Bot Matrix user ID
 MATRIX_PASSWORD        Bot password
@@ -31,12 +37,15 @@ NTFY_TOPIC             ntfy topic                     (default: ierahkwa-sat)
 LOG_DIR                Logging directory              (default: logs/)
 """
 
+import argparse
 import asyncio
+import binascii
+import bisect
+import heapq
 import json
 import logging
 import math
 import os
-import struct
 import sys
 import time
 import zlib
@@ -55,6 +64,11 @@ try:
 except ImportError:
     aiohttp = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -69,6 +83,10 @@ SAT_GPS_LAT = float(os.environ.get("SAT_GPS_LAT", "19.4326"))
 SAT_GPS_LON = float(os.environ.get("SAT_GPS_LON", "-99.1332"))
 SAT_GPS_ALT = float(os.environ.get("SAT_GPS_ALT", "2240"))
 SAT_TLE_PATH = Path(os.environ.get("SAT_TLE_PATH", "data/tle_catalog.json"))
+SAT_MTU = int(os.environ.get("SAT_MTU", "252"))
+SAT_TX_GUARD_S = float(os.environ.get("SAT_TX_GUARD_S", "0.5"))
+SAT_FRAME_CODEC = int(os.environ.get("SAT_FRAME_CODEC", "2"))
+SAT_PEER_TTL_H = float(os.environ.get("SAT_PEER_TTL_H", "72"))
 MATRIX_HOMESERVER = os.environ.get("MATRIX_HOMESERVER", "https://matrix.ierahkwa.org")
 MATRIX_USER = os.environ.get("MATRIX_USER", "@sat-uplink:ierahkwa.org")
 MATRIX_PASSWORD = os.environ.get("MATRIX_PASSWORD", "")
@@ -94,8 +112,9 @@ logger = logging.getLogger("ierahkwa.sat_uplink")
 # IERAHKWA_SAT Frame Protocol
 # ---------------------------------------------------------------------------
 # Header:  4 bytes  "ISAT"
-# Type:    1 byte   (0=HEARTBEAT, 1=ALERT, 2=DATA, 3=SOS)
-# Payload: N bytes  (zlib compressed)
+# Type:    1 byte   low nibble:  0=HEARTBEAT, 1=ALERT, 2=DATA, 3=SOS, 4=BATCH
+#                   high nibble: payload codec (see FRAME_CODECS)
+# Payload: N bytes  (JSON, encoded by the codec)
 # CRC:     2 bytes  (CRC-16/CCITT)
 
 FRAME_HEADER = b"ISAT"
@@ -103,14 +122,97 @@ MSG_HEARTBEAT = 0x00
 MSG_ALERT = 0x01
 MSG_DATA = 0x02
 MSG_SOS = 0x03
+MSG_BATCH = 0x04  # payload {"m": [[type, payload], ...]}
 
 MSG_TYPE_NAMES = {
     MSG_HEARTBEAT: "HEARTBEAT",
     MSG_ALERT: "ALERT",
     MSG_DATA: "DATA",
     MSG_SOS: "SOS",
+    MSG_BATCH: "BATCH",
 }
 
+# Payload codecs, carried in the high nibble of the type byte.  Codec 0 is
+# the original zlib stream: a codec-0 frame is byte-for-byte the legacy frame
+# (high nibble zero), so older receivers parse it.  Nodes emit codec 0 until
+# every peer they have heard from advertises a newer codec in its heartbeat
+# ("cx", see CodecNegotiator); heartbeats themselves always go out as codec 0.
+# Dictionary codecs are append-only: a published dictionary must never
+# change, a new one gets the next codec id.
+CODEC_ZLIB = 0x0
+CODEC_STORED = 0x1
+CODEC_ZDICT_V1 = 0x2
+
+# Preset deflate dictionary v1, built from the heartbeat, SOS, alert, batch
+# and mesh-relay payloads this module emits.  Most frequent strings last,
+# where deflate back-references are cheapest.
+#
+# These bytes are part of the codec-2 wire format and must be identical on
+# every node.  The node id and coordinates below are the reference station's
+# defaults, kept only as substrings for deflate to match; they are NOT read
+# from SAT_NODE_ID / SAT_GPS_*, and a site with other values still decodes
+# correctly, it just compresses a little less.  Never edit them in place.
+SAT_ZDICT_V1 = (
+    b'{"src":"SAT","type":"DATA","data":{"msg":"'
+    b'"priority":"DATA"}'
+    b'"rx_count":0,"last_rssi":null,"last_snr":null,'
+    b'"frequency_mhz":433.0,"spreading_factor":12}'
+    b',"q":0,"stats":{"tx_count":'
+    b'{"id":"IER-SAT-001","lat":19.4326,"lon":-99.1332,"up":17'
+    b'{"m":[[0,{"id":"IER-SAT-'
+    b'{"m":[[3,{"msg":"MAYDAY","lat":'
+    b',"alt":2240.0,"sos":true,'
+    b'"priority":"ALERT","node":"IER-SAT-'
+    b'"priority":"SOS","node":"IER-SAT-001","ts":17'
+    b'"node":"IER-SAT-001","ts":17'
+)
+
+FRAME_ZDICTS = {CODEC_ZDICT_V1: SAT_ZDICT_V1}
+FRAME_CODECS = {
+    CODEC_ZLIB: "zlib",
+    CODEC_STORED: "stored",
+    CODEC_ZDICT_V1: "zdict-v1",
+}
+
+
+def _deflate_with_dict(raw: bytes, zdict: bytes) -> bytes:
+    comp = zlib.compressobj(9, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, zdict)
+    return comp.compress(raw) + comp.flush()
+
+
+def encode_payload(raw: bytes, codec: int = CODEC_ZLIB) -> tuple[int, bytes]:
+    """Encode raw JSON with ``codec``.
+
+    Codec 0 always yields the legacy zlib stream, even when that is larger
+    than the JSON.  Newer codecs fall back to stored when deflate would
+    grow the payload.  Returns (codec_used, encoded_bytes).
+    """
+    if codec == CODEC_ZLIB:
+        return CODEC_ZLIB, zlib.compress(raw, level=9)
+    if codec in FRAME_ZDICTS:
+        candidate = _deflate_with_dict(raw, FRAME_ZDICTS[codec])
+    else:
+        return CODEC_STORED, raw
+    if len(candidate) >= len(raw):
+        return CODEC_STORED, raw
+    return codec, candidate
+
+
+def decode_payload(codec: int, data) -> bytes:
+    """Invert ``encode_payload``. Raises ValueError for an unknown codec."""
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_STORED:
+        return bytes(data)
+    if codec in FRAME_ZDICTS:
+        decomp = zlib.decompressobj(-15, zdict=FRAME_ZDICTS[codec])
+        raw = decomp.decompress(data) + decomp.flush()
+        if not decomp.eof:
+            raise zlib.error("truncated deflate stream")
+        return raw
+    raise ValueError(f"unsupported payload codec {codec}")
+
+
 # Supported frequency bands
 FREQ_BANDS = {
     "433": {"min": 433.0, "max": 434.79, "region": "Global ISM"},
@@ -119,8 +221,19 @@ FREQ_BANDS = {
 }
 
 
-def crc16_ccitt(data: bytes) -> int:
-    """Compute CRC-16/CCITT over raw bytes."""
+def crc16_ccitt(data, crc: int = 0xFFFF) -> int:
+    """Compute CRC-16/CCITT (poly 0x1021, init 0xFFFF) over any bytes-like.
+
+    Backed by ``binascii.crc_hqx``, CPython's table-driven CRC-CCITT, so it
+    accepts memoryviews without copying and can be chained by passing the
+    previous result as ``crc``.  Other protocol framing should import this
+    rather than carrying its own loop.
+    """
+    return binascii.crc_hqx(data, crc)
+
+
+def _crc16_ccitt_reference(data: bytes) -> int:
+    """Bit-by-bit CRC-16/CCITT, kept to verify and benchmark the fast path."""
     crc = 0xFFFF
     for byte in data:
         crc ^= byte << 8
@@ -133,36 +246,48 @@ def crc16_ccitt(data: bytes) -> int:
     return crc
 
 
-def build_frame(msg_type: int, payload: dict) -> bytes:
-    """Build an IERAHKWA_SAT frame with header, type, compressed payload, CRC."""
+def build_frame(msg_type: int, payload: dict, codec: int = CODEC_ZLIB) -> bytes:
+    """Build an IERAHKWA_SAT frame with header, type, encoded payload, CRC.
+
+    Only pass a codec other than CODEC_ZLIB once the receivers are known to
+    decode it (see CodecNegotiator).
+    """
     raw_payload = json.dumps(payload, separators=(",", ":")).encode("utf-8")
-    compressed = zlib.compress(raw_payload, level=9)
-    body = FRAME_HEADER + struct.pack("B", msg_type) + compressed
-    crc = crc16_ccitt(body)
-    return body + struct.pack(">H", crc)
+    used, encoded = encode_payload(raw_payload, codec)
+    frame = bytearray(FRAME_HEADER)
+    frame.append((used << 4) | (msg_type & 0x0F))
+    frame += encoded
+    frame += crc16_ccitt(frame).to_bytes(2, "big")
+    return bytes(frame)
 
 
-def parse_frame(data: bytes) -> Optional[dict]:
-    """Parse an IERAHKWA_SAT frame. Returns dict or None on failure."""
-    if len(data) < 7:
+def parse_frame(data) -> Optional[dict]:
+    """Parse an IERAHKWA_SAT frame. Returns dict or None on failure.
+
+    Works on a memoryview of ``data``: header check, CRC and decompression
+    all read the original buffer, so nothing is copied before the CRC has
+    been verified.  The verified CRC is returned so relays can forward the
+    frame without recomputing it.
+    """
+    view = memoryview(data)
+    if len(view) < 7:
         return None
-    if data[:4] != FRAME_HEADER:
+    if view[:4] != FRAME_HEADER:
         return None
 
-    crc_received = struct.unpack(">H", data[-2:])[0]
-    body = data[:-2]
-    crc_computed = crc16_ccitt(body)
+    crc_received = int.from_bytes(view[-2:], "big")
+    crc_computed = crc16_ccitt(view[:-2])
     if crc_received != crc_computed:
         logger.warning("CRC mismatch: received 0x%04X, computed 0x%04X", crc_received, crc_computed)
         return None
 
-    msg_type = struct.unpack("B", data[4:5])[0]
-    compressed = data[5:-2]
+    msg_type = view[4] & 0x0F
+    codec = view[4] >> 4
 
     try:
-        raw_payload = zlib.decompress(compressed)
-        payload = json.loads(raw_payload.decode("utf-8"))
-    except (zlib.error, json.JSONDecodeError, UnicodeDecodeError) as exc:
+        raw_payload = decode_payload(codec, view[5:-2])
+        payload = json.loads(raw_payload)
+    except (ValueError, zlib.error, UnicodeDecodeError) as exc:
         logger.warning("Frame payload decode failed: %s", exc)
         return None
 
@@ -170,7 +295,137 @@ def parse_frame(data: bytes) -> Optional[dict]:
         "type": msg_type,
         "type_name": MSG_TYPE_NAMES.get(msg_type, "UNKNOWN"),
         "payload": payload,
+        "codec": codec,
+        "crc": crc_received,
+    }
+
+
+def build_batch_frame(messages: list[tuple[int, dict]], codec: int = CODEC_ZLIB) -> bytes:
+    """Pack several (msg_type, payload) messages into one BATCH frame."""
+    return build_frame(MSG_BATCH, {"m": [[t, p] for t, p in messages]}, codec)
+
+
+class CodecNegotiator:
+    """Per-peer table of advertised payload codecs.
+
+    Every heartbeat carries ``"cx"``, the newest codec its sender decodes;
+    legacy nodes send no ``cx`` and are recorded as codec 0.  Frames go out
+    over a shared satellite downlink, so the codec to emit is the lowest one
+    any recently heard peer supports, capped by our own SAT_FRAME_CODEC.
+    Until some peer has been heard it is CODEC_ZLIB.  Entries older than
+    ``ttl`` seconds are forgotten.
+    """
+
+    def __init__(self, local_max: int = SAT_FRAME_CODEC, ttl: float = SAT_PEER_TTL_H * 3600):
+        self.local_max = local_max
+        self.ttl = ttl
+        self.peers: dict[str, tuple[int, float]] = {}  # node -> (codec, last heard)
+
+    def observe(self, payload: dict, now: Optional[float] = None) -> None:
+        """Record the capability advertised in a received heartbeat payload."""
+        node = payload.get("id") or payload.get("node")
+        if not node or node == SAT_NODE_ID:
+            return
+        try:
+            codec = int(payload.get("cx", CODEC_ZLIB))
+        except (TypeError, ValueError):
+            codec = CODEC_ZLIB
+        # A peer newer than us can still only be sent the codecs we know
+        codec = max(CODEC_ZLIB, min(codec, max(FRAME_CODECS)))
+        self.peers[str(node)] = (codec, time.time() if now is None else now)
+
+    def codec(self, now: Optional[float] = None) -> int:
+        """Newest codec every live peer decodes (CODEC_ZLIB when none heard)."""
+        now = time.time() if now is None else now
+        for node in [n for n, (_, seen) in self.peers.items() if now - seen > self.ttl]:
+            del self.peers[node]
+        if not self.peers:
+            return CODEC_ZLIB
+        return min(self.local_max, *(c for c, _ in self.peers.values()))
+
+
+def unpack_frame(parsed: dict) -> list[dict]:
+    """Expand a parsed frame into per-message dicts (BATCH frames fan out)."""
+    if parsed["type"] != MSG_BATCH:
+        return [parsed]
+    messages = []
+    for item in parsed["payload"].get("m", []):
+        try:
+            msg_type, payload = int(item[0]), item[1]
+        except (TypeError, ValueError, IndexError):
+            logger.warning("Malformed BATCH entry skipped: %r", item)
+            continue
+        messages.append({
+            "type": msg_type,
+            "type_name": MSG_TYPE_NAMES.get(msg_type, "UNKNOWN"),
+            "payload": payload,
+        })
+    return messages
+
+
+def benchmark_frame_codec(sizes: tuple = (16, 32, 64, 128, SAT_MTU), rounds: int = 2000) -> list[dict]:
+    """Time CRC and frame build/parse for frames from 16 B up to the MTU.
+
+    Payloads are random hex so zlib cannot shrink them; the actual frame
+    length for each target size is reported alongside per-call timings.
+    """
+    results = []
+    for target in sizes:
+        n = 0
+        while True:
+            payload = {"d": os.urandom(n).hex()}
+            frame = build_frame(MSG_DATA, payload)
+            if len(frame) >= target or n > target:
+                break
+            n += 1
+        if parse_frame(frame)["payload"] != payload:
+            raise AssertionError("Frame codec failed to round-trip")
+        if _crc16_ccitt_reference(frame) != crc16_ccitt(frame):
+            raise AssertionError("CRC engine differs from bitwise reference")
+
+        def per_call_us(func, arg) -> float:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                func(arg)
+            return (time.perf_counter() - start) / rounds * 1e6
+
+        crc_ref = per_call_us(_crc16_ccitt_reference, frame)
+        crc_fast = per_call_us(crc16_ccitt, frame)
+        results.append({
+            "frame_bytes": len(frame),
+            "crc_reference_us": round(crc_ref, 2),
+            "crc_us": round(crc_fast, 3),
+            "crc_speedup": round(crc_ref / crc_fast, 1),
+            "build_us": round(per_call_us(lambda p: build_frame(MSG_DATA, p), payload), 2),
+            "parse_us": round(per_call_us(parse_frame, frame), 2),
+        })
+    for row in results:
+        logger.info("Frame codec benchmark: %s", row)
+    return results
+
+
+def compression_report(node_id: str = SAT_NODE_ID) -> list[dict]:
+    """Frame sizes per payload codec for representative uplink messages."""
+    now = int(time.time())
+    samples = {
+        "heartbeat": (MSG_HEARTBEAT, {
+            "id": node_id, "lat": SAT_GPS_LAT, "lon": SAT_GPS_LON, "up": now,
+            "cx": SAT_FRAME_CODEC, "q": 2,
+            "stats": LoRaSatelliteRadio().stats,
+        }),
+        "sos": (MSG_SOS, {
+            "msg": "MAYDAY", "lat": SAT_GPS_LAT, "lon": SAT_GPS_LON, "alt": SAT_GPS_ALT, "sos": True,
+        }),
+        "alert": (MSG_ALERT, {"msg": "Inundacion en el valle, evacuar", "priority": "ALERT"}),
     }
+    rows = []
+    for name, (msg_type, payload) in samples.items():
+        payload.update(node=node_id, ts=now)
+        row = {"message": name, "json_bytes": len(json.dumps(payload, separators=(",", ":")))}
+        for codec, codec_name in FRAME_CODECS.items():
+            row[f"{codec_name}_frame_bytes"] = len(build_frame(msg_type, payload, codec=codec))
+        rows.append(row)
+    return rows
 
 
 # ---------------------------------------------------------------------------
@@ -259,6 +514,55 @@ class SimpleTLE:
 
         return lat, lon, alt
 
+    def satellite_positions(self, t_unix):
+        """Vectorized ``satellite_position`` over a NumPy array of times.
+
+        Same simplified Keplerian model as the scalar version, rearranged
+        for arrays: Kepler's equation stops iterating once converged, and
+        the in-plane position comes straight from the eccentric anomaly
+        (perifocal coordinates rotated by the argument of perigee) instead
+        of going through the true anomaly.
+        Returns (lat, lon, alt_km) arrays.
+        """
+        dt = t_unix - self.epoch_unix
+        ecc = self.eccentricity
+        mean_anom = (self.mean_anomaly + self.mean_motion * dt) % TWO_PI
+
+        E = mean_anom
+        for _ in range(5):
+            step = (E - ecc * np.sin(E) - mean_anom) / (1 - ecc * np.cos(E))
+            E = E - step
+            if np.max(np.abs(step)) < 1e-12:
+                break
+        cos_e = np.cos(E)
+
+        # Perifocal position, rotated into the orbital plane's node frame
+        p = self.semi_major_axis * (cos_e - ecc)
+        q = self.semi_major_axis * math.sqrt(1 - ecc * ecc) * np.sin(E)
+        cos_w = math.cos(self.arg_perigee)
+        sin_w = math.sin(self.arg_perigee)
+        x_orb = p * cos_w - q * sin_w
+        y_orb = p * sin_w + q * cos_w
+        r = self.semi_major_axis * (1 - ecc * cos_e)
+
+        raan = self.raan + (-1.5 * J2 * (EARTH_RADIUS_KM / self.semi_major_axis) ** 2 *
+                            math.cos(self.inclination) * self.mean_motion) * dt
+        cos_raan = np.cos(raan)
+        sin_raan = np.sin(raan)
+        cos_inc = math.cos(self.inclination)
+        y_inc = y_orb * cos_inc
+
+        x = x_orb * cos_raan - y_inc * sin_raan
+        y = x_orb * sin_raan + y_inc * cos_raan
+        z = y_orb * math.sin(self.inclination)
+
+        earth_rotation_rate = 7.2921159e-5  # rad/s
+        lon = (np.arctan2(y, x) - earth_rotation_rate * dt) * RAD2DEG
+        lon = ((lon + 180) % 360) - 180
+        lat = np.arctan2(z, np.hypot(x, y)) * RAD2DEG
+
+        return lat, lon, r - EARTH_RADIUS_KM
+
 
 def angular_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Compute great-circle angular distance in degrees."""
@@ -279,6 +583,148 @@ def max_elevation_angle(distance_deg: float, alt_km: float) -> float:
     return max(0, elev)
 
 
+def angular_distances(station_lat: float, station_lon: float, lat, lon):
+    """Vectorized ``angular_distance`` from the station over arrays."""
+    phi1 = station_lat * DEG2RAD
+    phi2 = lat * DEG2RAD
+    dphi = (lat - station_lat) * DEG2RAD
+    dlam = (lon - station_lon) * DEG2RAD
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlam / 2) ** 2
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))) * RAD2DEG
+
+
+def elevation_angles(station_lat: float, station_lon: float, lat, lon, alt_km):
+    """Vectorized ``angular_distance`` + ``max_elevation_angle`` over arrays."""
+    distance_deg = angular_distances(station_lat, station_lon, lat, lon)
+    distance_km = distance_deg * DEG2RAD * EARTH_RADIUS_KM
+    elev = np.arctan2(alt_km - EARTH_RADIUS_KM * (1 - np.cos(distance_deg * DEG2RAD)),
+                      distance_km) * RAD2DEG
+    return np.where(distance_km <= 0, 90.0, np.maximum(0.0, elev))
+
+
+# ---------------------------------------------------------------------------
+# Pass Index
+# ---------------------------------------------------------------------------
+
+class PassIndex:
+    """Sorted interval index over predicted passes.
+
+    Passes are kept ordered by ``start_time`` (bisected for window bounds)
+    with a max-``end_time`` segment tree over that order, so point, next-pass
+    and window-overlap queries cost O(log n + k) instead of a full scan.
+    The tree is rebuilt lazily on the first query after a mutation.
+    """
+
+    def __init__(self, passes: Optional[list[dict]] = None):
+        self._passes: list[dict] = []
+        self._starts: list[float] = []
+        self._tree: list[float] = []
+        self._size = 0
+        self._dirty = False
+        for p in passes or ():
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self._passes)
+
+    def __iter__(self):
+        return iter(self._passes)
+
+    # -- Mutation --
+
+    def add(self, p: dict) -> None:
+        """Insert a pass, keeping start order (ties keep insertion order)."""
+        i = bisect.bisect_right(self._starts, p["start_time"])
+        self._starts.insert(i, p["start_time"])
+        self._passes.insert(i, p)
+        self._dirty = True
+
+    def prune(self, before: float) -> int:
+        """Drop passes that ended before ``before``. Returns count removed."""
+        hi = bisect.bisect_left(self._starts, before)
+        keep = [p for p in self._passes[:hi] if p["end_time"] >= before]
+        removed = hi - len(keep)
+        if removed:
+            self._passes[:hi] = keep
+            self._starts[:hi] = [p["start_time"] for p in keep]
+            self._dirty = True
+        return removed
+
+    def update(self, passes: list[dict], now: float) -> None:
+        """Merge a fresh prediction computed from ``now`` onwards.
+
+        Expired passes are pruned and future passes are superseded by the
+        new prediction.  Passes already in progress keep their original
+        AOS; the recomputed copy (clipped to start at ``now``) is dropped.
+        """
+        self.prune(now)
+        hi = bisect.bisect_left(self._starts, now)
+        in_progress = self._passes[:hi]
+        active_sats = {(p["satellite"], p.get("norad_id")) for p in in_progress}
+        self._passes = in_progress
+        self._starts = self._starts[:hi]
+        self._dirty = True
+        for p in passes:
+            if (p["start_time"] <= now
+                    and (p["satellite"], p.get("norad_id")) in active_sats):
+                continue
+            self.add(p)
+
+    # -- Queries --
+
+    def _build(self) -> None:
+        n = len(self._passes)
+        size = 1
+        while size < n:
+            size <<= 1
+        tree = [-math.inf] * (2 * size)
+        for i, p in enumerate(self._passes):
+            tree[size + i] = p["end_time"]
+        for i in range(size - 1, 0, -1):
+            tree[i] = max(tree[2 * i], tree[2 * i + 1])
+        self._tree, self._size, self._dirty = tree, size, False
+
+    def _collect(self, t0: float, hi: int, first_only: bool) -> list[int]:
+        """Indices < ``hi`` whose end_time >= ``t0``, in start order."""
+        if self._dirty:
+            self._build()
+        if hi <= 0 or not self._passes:
+            return []
+        tree, size = self._tree, self._size
+        found: list[int] = []
+        stack = [(1, 0, size)]
+        while stack:
+            node, lo, span_hi = stack.pop()
+            if lo >= hi or tree[node] < t0:
+                continue
+            if node >= size:
+                found.append(lo)
+                if first_only:
+                    break
+                continue
+            mid = (lo + span_hi) // 2
+            # Right child pushed first so the left subtree is visited first
+            stack.append((2 * node + 1, mid, span_hi))
+            stack.append((2 * node, lo, mid))
+        return found
+
+    def active_at(self, t: float) -> Optional[dict]:
+        """Earliest-starting pass with start <= t <= end, or None."""
+        hi = bisect.bisect_right(self._starts, t)
+        idx = self._collect(t, hi, first_only=True)
+        return self._passes[idx[0]] if idx else None
+
+    def next_after(self, t: float) -> Optional[dict]:
+        """Earliest-starting pass that has not ended by ``t`` (may be active)."""
+        idx = self._collect(math.nextafter(t, math.inf), len(self._passes), first_only=True)
+        return self._passes[idx[0]] if idx else None
+
+    def overlapping(self, t0: float, t1: float) -> list[dict]:
+        """All passes intersecting the closed window [t0, t1], by start time."""
+        hi = bisect.bisect_right(self._starts, t1)
+        return [self._passes[i] for i in self._collect(t0, hi, first_only=False)]
+
+
 # ---------------------------------------------------------------------------
 # Pass Scheduler
 # ---------------------------------------------------------------------------
@@ -286,6 +732,9 @@ def max_elevation_angle(distance_deg: float, alt_km: float) -> float:
 class PassScheduler:
     """Schedule satellite passes and determine transmission windows."""
 
+    # Vectorized search screens every Nth grid sample first
+    COARSE_FACTOR = 8
+
     def __init__(self, station_lat: float, station_lon: float, station_alt: float,
                  min_elevation: float = 10.0):
         self.station_lat = station_lat
@@ -293,7 +742,7 @@ class PassScheduler:
         self.station_alt = station_alt
         self.min_elevation = min_elevation
         self.satellites: list[SimpleTLE] = []
-        self._pass_cache: list[dict] = []
+        self._pass_index = PassIndex()
 
     def load_tle_catalog(self, path: Path) -> int:
         """Load satellite TLE data from JSON catalog. Returns count loaded."""
@@ -348,80 +797,222 @@ class PassScheduler:
             self.satellites.append(tle)
         logger.info("Loaded %d default satellite entries", len(self.satellites))
 
-    def find_next_passes(self, duration_hours: float = 24.0, step_seconds: float = 30.0) -> list[dict]:
+    def elevation_at(self, sat: SimpleTLE, t_unix: float) -> float:
+        """Elevation of ``sat`` above this station at a single instant."""
+        lat, lon, alt = sat.satellite_position(t_unix)
+        dist = angular_distance(self.station_lat, self.station_lon, lat, lon)
+        return max_elevation_angle(dist, alt)
+
+    def _refine_edge(self, sat: SimpleTLE, t_below: float, t_above: float,
+                     tolerance: float) -> float:
+        """Bisect between a sample below and one above the mask to ``tolerance``."""
+        while abs(t_above - t_below) > tolerance:
+            mid = (t_below + t_above) / 2
+            if self.elevation_at(sat, mid) >= self.min_elevation:
+                t_above = mid
+            else:
+                t_below = mid
+        return t_above
+
+    def _refine_edges(self, sat: SimpleTLE, t_below, t_above, tolerance: float):
+        """Vectorized edge refinement over arrays of bracketing samples.
+
+        Rather than bisecting each bracket with many tiny evaluations, every
+        bracket is resampled at ``tolerance`` spacing in a single
+        propagator call, and the first sample that meets the mask (walking
+        from the below side) is returned.
+        """
+        if not t_below.size:
+            return t_above
+        span = t_above - t_below
+        steps = max(1, math.ceil(float(np.max(np.abs(span))) / tolerance))
+        grid = t_below[:, None] + span[:, None] * (np.arange(1, steps + 1) / steps)
+        lat, lon, alt = sat.satellite_positions(grid.ravel())
+        above = (elevation_angles(self.station_lat, self.station_lon, lat, lon, alt)
+                 >= self.min_elevation).reshape(grid.shape)
+        # The last column is t_above itself, so every row has a hit
+        return grid[np.arange(len(grid)), np.argmax(above, axis=1)]
+
+    @staticmethod
+    def _interpolate_peak(before: float, peak: float, after: float) -> float:
+        """Parabolic fit through the best sample and its neighbours."""
+        denom = before - 2 * peak + after
+        if denom >= 0:
+            return peak
+        offset = 0.5 * (before - after) / denom
+        return min(90.0, max(peak, peak - 0.25 * (before - after) * offset))
+
+    def _pass_record(self, sat: SimpleTLE, start: float, end: float, peak: float) -> dict:
+        return {
+            "satellite": sat.name,
+            "norad_id": sat.norad_id,
+            "start_time": start,
+            "end_time": end,
+            "max_elevation": round(peak, 1),
+            "duration_s": round(end - start),
+            "altitude_km": round(sat.altitude_km, 1),
+        }
+
+    def _visibility_radius(self, alt_km: float) -> float:
+        """Largest ground distance (deg) at which ``min_elevation`` is still met."""
+        lo, hi = 0.0, 180.0
+        if max_elevation_angle(hi, alt_km) >= self.min_elevation:
+            return hi
+        for _ in range(40):
+            mid = (lo + hi) / 2
+            if max_elevation_angle(mid, alt_km) >= self.min_elevation:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    def _screen_grid(self, sat: SimpleTLE, times):
+        """Indices of grid samples that could possibly be above the mask.
+
+        Samples every COARSE_FACTOR steps and keeps only the neighbourhood
+        of coarse samples whose ground distance, minus how far the
+        sub-satellite point can move in COARSE_FACTOR steps, is inside the
+        visibility radius at apogee. Everything screened out is provably
+        below the mask.
+        """
+        count = len(times)
+        k = self.COARSE_FACTOR
+        if count <= 2 * k:
+            return np.arange(count)
+
+        coarse = np.arange(0, count, k)
+        if coarse[-1] != count - 1:
+            coarse = np.append(coarse, count - 1)
+        lat, lon, _ = sat.satellite_positions(times[coarse])
+        dist = angular_distances(self.station_lat, self.station_lon, lat, lon)
+
+        ecc = sat.eccentricity
+        apogee_km = sat.semi_major_axis * (1 + ecc) - EARTH_RADIUS_KM
+        # Upper bound on ground-track angular speed: peak orbital rate + Earth spin
+        rate_deg_s = 1.05 * RAD2DEG * (
+            sat.mean_motion * (1 + ecc) ** 2 / (1 - ecc * ecc) ** 1.5 + 7.2921159e-5
+        )
+        reach = rate_deg_s * k * float(times[1] - times[0])
+        near = coarse[dist <= self._visibility_radius(apogee_km) + reach]
+        if not near.size:
+            return near
+
+        window = (near[:, None] + np.arange(-k, k + 1)).ravel()
+        mask = np.zeros(count, dtype=bool)
+        mask[np.clip(window, 0, count - 1)] = True
+        return np.flatnonzero(mask)
+
+    def _passes_vectorized(self, sat: SimpleTLE, times, end_time: float,
+                           refine_seconds: float) -> list[dict]:
+        """Pass windows for one satellite with NumPy over the whole grid."""
+        candidates = self._screen_grid(sat, times)
+        if not candidates.size:
+            return []
+        elev = np.zeros(len(times))
+        lat, lon, alt = sat.satellite_positions(times[candidates])
+        elev[candidates] = elevation_angles(self.station_lat, self.station_lon, lat, lon, alt)
+        above = elev >= self.min_elevation
+        if not above.any():
+            return []
+
+        edges = np.diff(np.concatenate(([0], above.astype(np.int8), [0])))
+        rises = np.flatnonzero(edges == 1)
+        sets = np.flatnonzero(edges == -1)  # first index below the mask (or len)
+        count = len(times)
+
+        # AOS lies in (rise-1, rise]; a pass already in progress starts now.
+        # LOS lies in [set-1, set); a pass still open ends with the window.
+        # Both kinds of bracket are refined together in one call.
+        inner = rises > 0
+        closed = sets < count
+        refined = self._refine_edges(
+            sat,
+            np.concatenate((times[rises[inner] - 1], times[sets[closed]])),
+            np.concatenate((times[rises[inner]], times[sets[closed] - 1])),
+            refine_seconds,
+        )
+        n_inner = int(inner.sum())
+        starts = times[rises].astype(float)
+        starts[inner] = refined[:n_inner]
+        ends = np.full(len(sets), end_time, dtype=float)
+        ends[closed] = refined[n_inner:]
+
+        passes = []
+        for rise, stop, start, end in zip(rises, sets, starts, ends):
+            peak_idx = rise + int(np.argmax(elev[rise:stop]))
+            peak = float(elev[peak_idx])
+            if 0 < peak_idx < count - 1:
+                peak = self._interpolate_peak(
+                    float(elev[peak_idx - 1]), peak, float(elev[peak_idx + 1]))
+            passes.append(self._pass_record(sat, float(start), float(end), peak))
+        return passes
+
+    def _passes_scalar(self, sat: SimpleTLE, times: list[float], end_time: float,
+                       refine_seconds: float) -> list[dict]:
+        """Pure-Python fallback for ``_passes_vectorized``."""
+        elev = [self.elevation_at(sat, t) for t in times]
+        count = len(times)
+        passes = []
+        i = 0
+        while i < count:
+            if elev[i] < self.min_elevation:
+                i += 1
+                continue
+            rise = i
+            while i < count and elev[i] >= self.min_elevation:
+                i += 1
+            peak_idx = max(range(rise, i), key=elev.__getitem__)
+
+            start = times[0] if rise == 0 else self._refine_edge(
+                sat, times[rise - 1], times[rise], refine_seconds)
+            end = end_time if i == count else self._refine_edge(
+                sat, times[i], times[i - 1], refine_seconds)
+            peak = elev[peak_idx]
+            if 0 < peak_idx < count - 1:
+                peak = self._interpolate_peak(elev[peak_idx - 1], peak, elev[peak_idx + 1])
+            passes.append(self._pass_record(sat, start, end, peak))
+        return passes
+
+    def find_next_passes(self, duration_hours: float = 24.0, step_seconds: float = 30.0,
+                         refine_seconds: float = 1.0) -> list[dict]:
         """Find all satellite passes within the next duration_hours.
+
+        Elevation is sampled on a ``step_seconds`` grid (one vectorized
+        evaluation per satellite when NumPy is installed), AOS/LOS are
+        bisected to ``refine_seconds`` and the peak is interpolated from
+        its neighbouring samples.
         Returns list of {satellite, start_time, end_time, max_elevation, duration}.
         """
         passes = []
         now = time.time()
         end_time = now + duration_hours * 3600
+        count = int((end_time - now) // step_seconds) + 1
 
-        for sat in self.satellites:
-            in_pass = False
-            pass_start = 0.0
-            peak_elev = 0.0
-            t = now
-
-            while t < end_time:
-                lat, lon, alt = sat.satellite_position(t)
-                dist = angular_distance(self.station_lat, self.station_lon, lat, lon)
-                elev = max_elevation_angle(dist, alt)
-
-                if elev >= self.min_elevation:
-                    if not in_pass:
-                        in_pass = True
-                        pass_start = t
-                        peak_elev = elev
-                    else:
-                        peak_elev = max(peak_elev, elev)
-                else:
-                    if in_pass:
-                        passes.append({
-                            "satellite": sat.name,
-                            "norad_id": sat.norad_id,
-                            "start_time": pass_start,
-                            "end_time": t,
-                            "max_elevation": round(peak_elev, 1),
-                            "duration_s": round(t - pass_start),
-                            "altitude_km": round(sat.altitude_km, 1),
-                        })
-                        in_pass = False
-                        peak_elev = 0.0
-
-                t += step_seconds
-
-            # Close any open pass at end of window
-            if in_pass:
-                passes.append({
-                    "satellite": sat.name,
-                    "norad_id": sat.norad_id,
-                    "start_time": pass_start,
-                    "end_time": end_time,
-                    "max_elevation": round(peak_elev, 1),
-                    "duration_s": round(end_time - pass_start),
-                    "altitude_km": round(sat.altitude_km, 1),
-                })
+        if np is not None:
+            times = now + np.arange(count) * step_seconds
+            for sat in self.satellites:
+                passes.extend(self._passes_vectorized(sat, times, end_time, refine_seconds))
+        else:
+            times = [now + i * step_seconds for i in range(count)]
+            for sat in self.satellites:
+                passes.extend(self._passes_scalar(sat, times, end_time, refine_seconds))
 
         passes.sort(key=lambda p: p["start_time"])
-        self._pass_cache = passes
+        self._pass_index.update(passes, now)
         logger.info("Found %d satellite passes in next %.0fh", len(passes), duration_hours)
         return passes
 
-    def next_pass(self) -> Optional[dict]:
-        """Return the soonest upcoming pass or None."""
-        now = time.time()
-        for p in self._pass_cache:
-            if p["end_time"] > now:
-                return p
-        return None
+    def next_pass(self, now: Optional[float] = None) -> Optional[dict]:
+        """Return the soonest upcoming (or in-progress) pass or None."""
+        return self._pass_index.next_after(time.time() if now is None else now)
 
-    def is_pass_active(self) -> Optional[dict]:
+    def is_pass_active(self, now: Optional[float] = None) -> Optional[dict]:
         """Return the currently active pass, or None."""
-        now = time.time()
-        for p in self._pass_cache:
-            if p["start_time"] <= now <= p["end_time"]:
-                return p
-        return None
+        return self._pass_index.active_at(time.time() if now is None else now)
+
+    def passes_in_window(self, t0: float, t1: float) -> list[dict]:
+        """Return all cached passes overlapping [t0, t1], ordered by start."""
+        return self._pass_index.overlapping(t0, t1)
 
 
 # ---------------------------------------------------------------------------
@@ -551,6 +1142,33 @@ class LoRaSatelliteRadio:
             except Exception:
                 pass
 
+    def time_on_air(self, n_bytes: int) -> float:
+        """LoRa time-on-air in seconds for an n-byte payload (Semtech AN1200.13).
+
+        Includes the 4-byte RadioHead header adafruit_rfm9x prepends, an
+        8-symbol preamble, explicit header and CRC.
+        """
+        sf = self.sf
+        t_sym = (1 << sf) / self.bandwidth
+        low_dr = 1 if t_sym > 0.016 else 0
+        payload_len = n_bytes + 4
+        num = 8 * payload_len - 4 * sf + 28 + 16
+        symbols = 8 + max(math.ceil(num / (4 * (sf - 2 * low_dr))) * self.coding_rate, 0)
+        return (8 + 4.25 + symbols) * t_sym
+
+    def max_payload_for(self, seconds: float, mtu: int = SAT_MTU) -> int:
+        """Largest payload (<= mtu) whose time-on-air fits in ``seconds``."""
+        if seconds <= 0 or self.time_on_air(0) > seconds:
+            return 0
+        lo, hi = 0, mtu
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.time_on_air(mid) <= seconds:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
     @property
     def stats(self) -> dict:
         return {
@@ -583,6 +1201,108 @@ def log_transmission(entry: dict) -> None:
         logger.error("Failed to write TX log: %s", exc)
 
 
+# ---------------------------------------------------------------------------
+# Transmit Queue
+# ---------------------------------------------------------------------------
+
+# Lower rank transmits first: SOS > alerts > data > heartbeats
+TX_RANK = {MSG_SOS: 0, MSG_ALERT: 1, MSG_DATA: 2, MSG_HEARTBEAT: 3}
+
+
+class TxQueue:
+    """Priority heap of pending uplink messages.
+
+    Entries are ordered by (type rank, -priority, arrival).  Only the newest
+    heartbeat is kept; older ones are cancelled in place and skipped when
+    popped.  ``pack`` greedily fills one frame up to a byte limit, folding
+    several messages into a BATCH frame when they fit together.
+    """
+
+    # Consecutive misfits tolerated before pack() stops looking deeper
+    PACK_LOOKAHEAD = 8
+
+    def __init__(self, codec: int = CODEC_ZLIB):
+        self._heap: list[list] = []
+        self._seq = 0
+        self._live = 0
+        self._heartbeat: Optional[list] = None
+        self.codec = codec
+
+    def codec_for(self, msg_types) -> int:
+        """Codec for a frame holding ``msg_types``.
+
+        Heartbeats carry the capability advertisement, so any frame with
+        one stays legacy-readable.
+        """
+        return CODEC_ZLIB if MSG_HEARTBEAT in msg_types else self.codec
+
+    def set_codec(self, codec: int) -> None:
+        """Switch the emitted codec and re-encode frames already queued."""
+        if codec == self.codec:
+            return
+        self.codec = codec
+        for entry in self._heap:
+            if entry[6]:
+                entry[5] = build_frame(entry[3], entry[4], self.codec_for((entry[3],)))
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __bool__(self) -> bool:
+        return self._live > 0
+
+    def push(self, msg_type: int, payload: dict, priority: int = 0) -> bytes:
+        """Queue a message and return its standalone frame."""
+        frame = build_frame(msg_type, payload, self.codec_for((msg_type,)))
+        # [rank, -priority, seq, msg_type, payload, frame, alive]
+        entry = [TX_RANK.get(msg_type, 2), -priority, self._seq, msg_type, payload, frame, True]
+        self._seq += 1
+        if msg_type == MSG_HEARTBEAT:
+            if self._heartbeat is not None and self._heartbeat[6]:
+                self._heartbeat[6] = False
+                self._live -= 1
+                logger.debug("Dropped stale queued heartbeat")
+            self._heartbeat = entry
+        heapq.heappush(self._heap, entry)
+        self._live += 1
+        return frame
+
+    def pack(self, max_bytes: int) -> Optional[tuple[bytes, int]]:
+        """Pop messages into one frame of at most ``max_bytes``.
+
+        Messages are taken in priority order; one that does not fit is set
+        aside so smaller, lower-priority messages can use the space.
+        Returns (frame, message_count) or None when nothing fits.
+        """
+        batch: list[list] = []
+        frame = b""
+        deferred: list[list] = []
+        misses = 0
+        while self._heap and misses < self.PACK_LOOKAHEAD:
+            entry = heapq.heappop(self._heap)
+            if not entry[6]:
+                continue
+            if batch:
+                messages = [(e[3], e[4]) for e in batch] + [(entry[3], entry[4])]
+                trial = build_batch_frame(messages, self.codec_for([t for t, _ in messages]))
+            else:
+                trial = entry[5]
+            if len(trial) <= max_bytes:
+                batch.append(entry)
+                frame = trial
+            else:
+                deferred.append(entry)
+                misses += 1
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+        if not batch:
+            return None
+        for entry in batch:
+            entry[6] = False
+        self._live -= len(batch)
+        return frame, len(batch)
+
+
 # ---------------------------------------------------------------------------
 # Satellite Uplink Orchestrator
 # ---------------------------------------------------------------------------
@@ -595,8 +1315,9 @@ class SatelliteUplink:
         self.scheduler = PassScheduler(SAT_GPS_LAT, SAT_GPS_LON, SAT_GPS_ALT)
         self.matrix_client: Optional[AsyncClient] = None
         self._running = False
-        self._tx_queue: list[bytes] = []
+        self._tx_queue = TxQueue()
         self._rx_buffer: list[dict] = []
+        self.codecs = CodecNegotiator()
 
     async def start(self) -> None:
         """Initialize and start the satellite uplink system."""
@@ -647,16 +1368,27 @@ class SatelliteUplink:
 
     # -- Transmission --
 
-    def queue_message(self, msg_type: int, payload: dict, priority: int = 0) -> None:
-        """Queue a message for satellite transmission."""
+    def queue_message(self, msg_type: int, payload: dict, priority: int = 0) -> bool:
+        """Queue a message for satellite transmission.
+
+        Returns False if the encoded frame can never fit the radio MTU.
+        """
         payload["node"] = SAT_NODE_ID
         payload["ts"] = int(time.time())
-        frame = build_frame(msg_type, payload)
-        self._tx_queue.append(frame)
+        self._tx_queue.set_codec(self.codecs.codec())
+        frame = build_frame(msg_type, payload, self._tx_queue.codec_for((msg_type,)))
+        if len(frame) > SAT_MTU:
+            logger.error(
+                "Dropping %s message: frame is %d bytes, radio MTU is %d",
+                MSG_TYPE_NAMES.get(msg_type, "?"), len(frame), SAT_MTU,
+            )
+            return False
+        self._tx_queue.push(msg_type, payload, priority)
         logger.info(
             "Queued %s frame (%d bytes, queue size: %d)",
             MSG_TYPE_NAMES.get(msg_type, "?"), len(frame), len(self._tx_queue),
         )
+        return True
 
     def send_sos(self, distress_message: str = "MAYDAY") -> None:
         """Send emergency SOS with GPS coordinates."""
@@ -667,9 +1399,8 @@ class SatelliteUplink:
             "alt": SAT_GPS_ALT,
             "sos": True,
         }
-        # SOS goes to front of queue
-        frame = build_frame(MSG_SOS, payload)
-        self._tx_queue.insert(0, frame)
+        # SOS ranks above everything else in the TX heap
+        self.queue_message(MSG_SOS, payload, priority=100)
         logger.critical("SOS QUEUED: %s at (%.4f, %.4f)", distress_message, SAT_GPS_LAT, SAT_GPS_LON)
 
         log_transmission({
@@ -696,29 +1427,55 @@ class SatelliteUplink:
             await asyncio.sleep(7200)
 
     async def _tx_queue_processor(self) -> None:
-        """Process TX queue during active satellite passes."""
+        """Process TX queue during active satellite passes.
+
+        Each frame is packed to the smaller of the radio MTU and what the
+        remaining pass time can carry, and frames are paced by their actual
+        time-on-air rather than a fixed delay.
+        """
         while self._running:
             active_pass = self.scheduler.is_pass_active()
             if active_pass and self._tx_queue:
                 logger.info(
-                    "Pass active: %s -- transmitting %d queued frames",
+                    "Pass active: %s -- transmitting %d queued messages",
                     active_pass["satellite"], len(self._tx_queue),
                 )
                 self.radio.wake()
-
-                while self._tx_queue and self.scheduler.is_pass_active():
-                    frame = self._tx_queue.pop(0)
+                sent_bytes = sent_msgs = 0
+                starved = False
+
+                while self._tx_queue:
+                    now = time.time()
+                    if not self.scheduler.is_pass_active(now):
+                        break
+                    remaining = active_pass["end_time"] - now - SAT_TX_GUARD_S
+                    packed = self._tx_queue.pack(self.radio.max_payload_for(remaining))
+                    if packed is None:
+                        logger.info("No queued message fits the remaining %.0fs of pass", remaining)
+                        starved = True
+                        break
+                    frame, count = packed
                     success = self.radio.transmit(frame)
+                    if success:
+                        sent_bytes += len(frame)
+                        sent_msgs += count
                     log_transmission({
                         "type": "TX",
                         "satellite": active_pass["satellite"],
                         "bytes": len(frame),
+                        "messages": count,
                         "success": success,
                         "frequency_mhz": self.radio.freq_mhz,
                         "snr": self.radio._last_snr,
                     })
-                    await asyncio.sleep(2)  # Inter-frame delay
+                    await asyncio.sleep(self.radio.time_on_air(len(frame)) + SAT_TX_GUARD_S)
 
+                logger.info(
+                    "Pass %s: sent %d messages in %d bytes, %d still queued",
+                    active_pass["satellite"], sent_msgs, sent_bytes, len(self._tx_queue),
+                )
+                if starved:
+                    await asyncio.sleep(10)
                 if not self.scheduler.is_pass_active():
                     logger.info("Pass ended -- returning to sleep")
                     self.radio.sleep()
@@ -737,13 +1494,17 @@ class SatelliteUplink:
                 if data:
                     parsed = parse_frame(data)
                     if parsed:
-                        logger.info(
-                            "Downlink received: %s from %s",
-                            parsed["type_name"], active_pass["satellite"],
-                        )
-                        self._rx_buffer.append(parsed)
-                        await self._relay_to_mesh(parsed)
-                        await self._relay_to_matrix(parsed, active_pass["satellite"])
+                        for message in unpack_frame(parsed):
+                            logger.info(
+                                "Downlink received: %s from %s",
+                                message["type_name"], active_pass["satellite"],
+                            )
+                            if message["type"] == MSG_HEARTBEAT:
+                                self.codecs.observe(message["payload"])
+                                self._tx_queue.set_codec(self.codecs.codec())
+                            self._rx_buffer.append(message)
+                            await self._relay_to_mesh(message)
+                            await self._relay_to_matrix(message, active_pass["satellite"])
                     else:
                         logger.debug("Received unrecognized downlink packet (%d bytes)", len(data))
             else:
@@ -757,6 +1518,7 @@ class SatelliteUplink:
                 "lat": SAT_GPS_LAT,
                 "lon": SAT_GPS_LON,
                 "up": int(time.time()),
+                "cx": SAT_FRAME_CODEC,
                 "q": len(self._tx_queue),
                 "stats": self.radio.stats,
             })
@@ -767,17 +1529,18 @@ class SatelliteUplink:
     async def _relay_to_mesh(self, parsed: dict) -> None:
         """Forward received satellite data to the LoRa mesh network."""
         try:
-            relay_payload = json.dumps({
+            relay_text = json.dumps({
                 "src": "SAT",
                 "type": parsed["type_name"],
                 "data": parsed["payload"],
-            }, separators=(",", ":")).encode("utf-8")
+            }, separators=(",", ":"))
 
             # Attempt to import and use the mesh bridge
             try:
-                from scripts.protocols.lora_mesh_bridge import send_to_lora
-                send_to_lora(relay_payload[:230])
-                logger.info("Relayed satellite data to LoRa mesh (%d bytes)", len(relay_payload[:230]))
+                from scripts.protocols.lora_mesh_bridge import compress_for_lora, send_to_lora
+                relay_payload = compress_for_lora("sat", relay_text)
+                send_to_lora(relay_payload)
+                logger.info("Relayed satellite data to LoRa mesh (%d bytes)", len(relay_payload))
             except ImportError:
                 logger.debug("LoRa mesh bridge not available for relay")
         except Exception as exc:
@@ -960,4 +1723,17 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Ierahkwa LoRa-to-Satellite Uplink Driver")
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("run", help="Run the uplink (default)")
+    p_bench = sub.add_parser("benchmark", help="Benchmark CRC and frame codec")
+    p_bench.add_argument("--rounds", type=int, default=2000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    if args.command == "benchmark":
+        print(json.dumps({
+            "frame_codec": benchmark_frame_codec(rounds=args.rounds),
+            "compression": compression_report(),
+        }, indent=2))
+    else:
+        asyncio.run(main())
@@ -14,12 +14,16 @@ Features:
   - GPG encryption of individual shares for distribution
   - On-chain share hash verification via IerahkwaPulse
   - Interactive ceremony mode with secure memory wiping
-  - CLI with subcommands: split, reconstruct, distribute, verify, ceremony, recover
+  - Compact binary share files, streamed in fixed-size chunks for large secrets
+  - Batched engine: table-driven multiply over whole shares, cached Lagrange basis
+  - CLI with subcommands: split, reconstruct, distribute, verify, ceremony, recover,
+    benchmark
 
 Environment variables
 ---------------------
 MAMEYNODE_RPC         MameyNode JSON-RPC endpoint   (default: http://mameynode:8545)
 PULSE_ADDRESS         IerahkwaPulse contract addr   (default: 0x...placeholder)
+SHAMIR_CHUNK_SIZE     Bytes per streamed chunk      (default: 65536)
 LOG_DIR               Logging directory             (default: logs/)
 """
 
@@ -29,9 +33,12 @@ import json
 import logging
 import os
 import secrets
+import struct
 import subprocess
 import sys
+import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -48,6 +55,7 @@ MAMEYNODE_RPC = os.environ.get("MAMEYNODE_RPC", "http://mameynode:8545")
 PULSE_ADDRESS = os.environ.get(
     "PULSE_ADDRESS", "0x0000000000000000000000000000000000000000"
 )
+SHAMIR_CHUNK_SIZE = int(os.environ.get("SHAMIR_CHUNK_SIZE", "65536"))
 LOG_DIR = Path(os.environ.get("LOG_DIR", "logs"))
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -77,7 +85,8 @@ def _init_gf256_tables():
     for i in range(255):
         _GF256_EXP[i] = x
         _GF256_LOG[x] = i
-        x <<= 1
+        # Multiply by the generator 0x03; 0x02 only has order 51 under 0x11B
+        x ^= x << 1
         if x & 0x100:
             x ^= 0x11B
     # Extend exp table for convenience (handles wrap-around)
@@ -168,6 +177,45 @@ def _lagrange_interpolate(points: list[tuple[int, int]], x: int = 0) -> int:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Batched GF(256) engine
+# ---------------------------------------------------------------------------
+# Multiplying every byte of a buffer by the same constant is a 256-entry
+# substitution, so ``bytes.translate`` with a precomputed row of the
+# multiplication table scales a whole share in C. Addition (XOR) of two
+# buffers goes through ``int.from_bytes``. Together they let split and
+# reconstruct work on all byte positions at once instead of byte by byte.
+
+_GF256_MUL_TABLES = [bytes(gf256_mul(c, v) for v in range(256)) for c in range(256)]
+
+
+def gf256_scale(data: bytes, c: int) -> bytes:
+    """Multiply every byte of data by the constant c in GF(256)."""
+    return data.translate(_GF256_MUL_TABLES[c])
+
+
+@lru_cache(maxsize=128)
+def lagrange_basis_at_zero(xs: tuple[int, ...]) -> tuple[int, ...]:
+    """Lagrange basis coefficients l_i(0) for the share indices xs.
+
+    The secret is sum(l_i(0) * y_i), so the O(k^2) work depends only on
+    which shares are present and is done once per index set.
+    """
+    if len(set(xs)) != len(xs):
+        raise ValueError("Duplicate share indices")
+    basis = []
+    for i, xi in enumerate(xs):
+        num = 1
+        den = 1
+        for j, xj in enumerate(xs):
+            if i == j:
+                continue
+            num = gf256_mul(num, xj)
+            den = gf256_mul(den, gf256_sub(xi, xj))
+        basis.append(gf256_div(num, den))
+    return tuple(basis)
+
+
 # ---------------------------------------------------------------------------
 # Shamir's Secret Sharing
 # ---------------------------------------------------------------------------
@@ -176,6 +224,10 @@ def _lagrange_interpolate(points: list[tuple[int, int]], x: int = 0) -> int:
 def split_secret(secret: bytes, n: int = 100, k: int = 34) -> list[tuple[int, bytes]]:
     """Split a secret into n shares, requiring k to reconstruct.
 
+    Every byte position uses its own random polynomial of degree k-1;
+    the polynomials are evaluated for all positions at once by scaling
+    whole coefficient buffers by x^d and XOR-accumulating them.
+
     Parameters
     ----------
     secret : bytes
@@ -202,22 +254,20 @@ def split_secret(secret: bytes, n: int = 100, k: int = 34) -> list[tuple[int, by
         raise ValueError("Secret must not be empty")
 
     secret_len = len(secret)
-    shares = [(i, bytearray(secret_len)) for i in range(1, n + 1)]
-
-    for byte_idx in range(secret_len):
-        # Random polynomial of degree k-1 with secret byte as constant term
-        coeffs = [secret[byte_idx]]
-        for _ in range(k - 1):
-            coeffs.append(secrets.randbelow(256))
+    secret_int = int.from_bytes(secret, "big")
+    # Random coefficients for degrees 1..k-1, one byte per secret position
+    coeffs = [secrets.token_bytes(secret_len) for _ in range(k - 1)]
 
-        # Evaluate at each share point
-        for share_idx in range(n):
-            x = shares[share_idx][0]
-            y = _eval_poly(coeffs, x)
-            shares[share_idx][1][byte_idx] = y
+    shares = []
+    for x in range(1, n + 1):
+        log_x = _GF256_LOG[x]
+        acc = secret_int
+        for degree, coeff in enumerate(coeffs, start=1):
+            x_pow = _GF256_EXP[(log_x * degree) % 255]
+            acc ^= int.from_bytes(gf256_scale(coeff, x_pow), "big")
+        shares.append((x, acc.to_bytes(secret_len, "big")))
 
-    # Convert bytearrays to bytes
-    return [(idx, bytes(data)) for idx, data in shares]
+    return shares
 
 
 def reconstruct_secret(shares: list[tuple[int, bytes]]) -> bytes:
@@ -241,13 +291,84 @@ def reconstruct_secret(shares: list[tuple[int, bytes]]) -> bytes:
         if len(data) != secret_len:
             raise ValueError(f"Share {idx} has inconsistent length")
 
-    result = bytearray(secret_len)
+    basis = lagrange_basis_at_zero(tuple(idx for idx, _ in shares))
+
+    acc = 0
+    for (_, data), coeff in zip(shares, basis):
+        acc ^= int.from_bytes(gf256_scale(bytes(data), coeff), "big")
+
+    return acc.to_bytes(secret_len, "big")
+
+
+def _split_secret_reference(secret: bytes, n: int, k: int) -> list[tuple[int, bytes]]:
+    """Per-byte polynomial evaluation, kept for benchmarking the batched engine."""
+    shares = [(i, bytearray(len(secret))) for i in range(1, n + 1)]
+    for byte_idx in range(len(secret)):
+        coeffs = [secret[byte_idx]] + [secrets.randbelow(256) for _ in range(k - 1)]
+        for x, data in shares:
+            data[byte_idx] = _eval_poly(coeffs, x)
+    return [(idx, bytes(data)) for idx, data in shares]
+
+
+def _reconstruct_secret_reference(shares: list[tuple[int, bytes]]) -> bytes:
+    """Per-byte Lagrange interpolation, kept for benchmarking the batched engine."""
+    return bytes(
+        _lagrange_interpolate([(idx, data[byte_idx]) for idx, data in shares], 0)
+        for byte_idx in range(len(shares[0][1]))
+    )
+
+
+def benchmark_engine(sizes: list[int], n: int = 100, k: int = 34,
+                     reference_limit: int = 4096) -> list[dict]:
+    """Time batched split/reconstruct against the per-byte reference.
+
+    The reference path is only timed for secrets up to ``reference_limit``
+    bytes; beyond that it takes minutes.
+
+    Returns
+    -------
+    list of dict
+        One row per size with seconds for each path and the speedups.
+    """
+    rows = []
+    for size in sizes:
+        secret = secrets.token_bytes(size)
+
+        start = time.perf_counter()
+        shares = split_secret(secret, n, k)
+        split_s = time.perf_counter() - start
+
+        subset = shares[-k:]
+        start = time.perf_counter()
+        recovered = reconstruct_secret(subset)
+        reconstruct_s = time.perf_counter() - start
+        if recovered != secret:
+            raise AssertionError(f"Batched engine failed to round-trip {size} bytes")
+
+        row = {
+            "size": size,
+            "split_s": round(split_s, 4),
+            "reconstruct_s": round(reconstruct_s, 4),
+        }
+
+        if size <= reference_limit:
+            start = time.perf_counter()
+            _split_secret_reference(secret, n, k)
+            ref_split_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if _reconstruct_secret_reference(subset) != secret:
+                raise AssertionError("Reference interpolation disagrees with engine")
+            ref_reconstruct_s = time.perf_counter() - start
 
-    for byte_idx in range(secret_len):
-        points = [(idx, data[byte_idx]) for idx, data in shares]
-        result[byte_idx] = _lagrange_interpolate(points, 0)
+            row["reference_split_s"] = round(ref_split_s, 4)
+            row["reference_reconstruct_s"] = round(ref_reconstruct_s, 4)
+            row["split_speedup"] = round(ref_split_s / split_s, 1)
+            row["reconstruct_speedup"] = round(ref_reconstruct_s / reconstruct_s, 1)
 
-    return bytes(result)
+        logger.info("Shamir benchmark: %s", row)
+        rows.append(row)
+    return rows
 
 
 # ---------------------------------------------------------------------------
@@ -271,6 +392,15 @@ def seed_checksum(seed: bytes) -> str:
     return hashlib.sha256(seed).hexdigest()
 
 
+def file_checksum(path: str, chunk_size: int = SHAMIR_CHUNK_SIZE) -> str:
+    """Compute SHA-256 checksum of a secret file without loading it whole."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # GPG distribution
 # ---------------------------------------------------------------------------
@@ -450,11 +580,33 @@ def secure_wipe(data: bytearray) -> None:
 # ---------------------------------------------------------------------------
 
 
-def ceremony_mode(secret: bytes, n: int = 100, k: int = 34) -> dict:
+def _ceremony_share_files(share_paths: dict[int, str]):
+    """Yield (index, hash, length, data, path) for each written share file.
+
+    ``data`` is only read back for shares short enough to display.
+    """
+    for idx in sorted(share_paths):
+        hdr = read_share_header(share_paths[idx])
+        data = None
+        if hdr["length"] <= SHARE_DISPLAY_MAX:
+            with open(share_paths[idx], "rb") as fh:
+                fh.seek(SHARE_HEADER.size)
+                data = fh.read(hdr["length"])
+        yield idx, hdr["share_hash"], hdr["length"], data, share_paths[idx]
+
+
+def ceremony_mode(secret: Optional[bytes], n: int = 100, k: int = 34,
+                  share_dir: Optional[str] = None,
+                  secret_path: Optional[str] = None) -> dict:
     """Interactive ceremony for distributing shares to Guardians.
 
     Displays each share on screen one at a time, waits for Guardian
-    confirmation, then securely wipes the share from memory.
+    confirmation, then securely wipes the share from memory. When
+    ``share_dir`` is given each share is also written as a binary share
+    file, and shares too large to read aloud are shown by path only.
+    With ``share_dir`` the secret (``secret`` bytes or the file at
+    ``secret_path``) is split chunk by chunk straight into the share files,
+    so the n shares are never held in memory together.
 
     Returns a dict with ceremony metadata.
     """
@@ -463,8 +615,24 @@ def ceremony_mode(secret: bytes, n: int = 100, k: int = 34) -> dict:
     logger.info("  Shares: %d, Threshold: %d", n, k)
     logger.info("=" * 60)
 
-    checksum = seed_checksum(secret)
-    shares = split_secret(secret, n, k)
+    if share_dir:
+        if secret_path:
+            chunks = _read_chunks(secret_path)
+        else:
+            chunks = (secret[i:i + SHAMIR_CHUNK_SIZE]
+                      for i in range(0, len(secret), SHAMIR_CHUNK_SIZE))
+        split = _split_chunks_to_files(chunks, share_dir, n, k)
+        checksum = split["checksum_sha256"]
+        shares = _ceremony_share_files(split["paths"])
+    else:
+        if secret is None:
+            with open(secret_path, "rb") as fh:
+                secret = fh.read()
+        checksum = seed_checksum(secret)
+        shares = (
+            (idx, hashlib.sha256(data).hexdigest(), len(data), data, "")
+            for idx, data in split_secret(secret, n, k)
+        )
 
     ceremony_log = {
         "type": "key_ceremony",
@@ -481,14 +649,17 @@ def ceremony_mode(secret: bytes, n: int = 100, k: int = 34) -> dict:
     print(f"  Secret checksum (SHA-256): {checksum}")
     print("=" * 60)
 
-    for idx, share_data in shares:
-        share_hex = share_data.hex()
-        share_hash = hashlib.sha256(share_data).hexdigest()
+    if share_dir:
+        ceremony_log["share_dir"] = str(share_dir)
 
+    for idx, share_hash, share_len, share_data, share_file in shares:
         print(f"\n--- Share {idx}/{n} ---")
         print(f"Guardian, please record this share:")
         print(f"  Index: {idx}")
-        print(f"  Data:  {share_hex}")
+        if share_data is not None:
+            print(f"  Data:  {share_data.hex()}")
+        if share_file:
+            print(f"  File:  {share_file} ({share_len:,} bytes)")
         print(f"  Hash:  {share_hash}")
         print(f"---")
 
@@ -517,13 +688,15 @@ def ceremony_mode(secret: bytes, n: int = 100, k: int = 34) -> dict:
                 print("Please type 'yes', 'si', 'y', or 'skip'.")
 
         # Secure wipe the share from memory
-        share_buf = bytearray(share_data)
-        secure_wipe(share_buf)
-        print(f"[Share {idx} wiped from memory]")
+        if share_data is not None:
+            share_buf = bytearray(share_data)
+            secure_wipe(share_buf)
+            print(f"[Share {idx} wiped from memory]")
 
     # Wipe the secret from memory
-    secret_buf = bytearray(secret)
-    secure_wipe(secret_buf)
+    if secret is not None:
+        secret_buf = bytearray(secret)
+        secure_wipe(secret_buf)
 
     confirmed_count = sum(
         1 for s in ceremony_log["shares_distributed"] if s["confirmed"]
@@ -546,15 +719,49 @@ def ceremony_mode(secret: bytes, n: int = 100, k: int = 34) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def recovery_mode(expected_checksum: str = "") -> Optional[bytes]:
+def recovery_mode(expected_checksum: str = "",
+                  share_files: Optional[list[str]] = None,
+                  output_path: str = "") -> Optional[bytes | Path]:
     """Interactive recovery: collect shares from Guardians and reconstruct.
 
-    Returns the reconstructed secret or None on failure.
+    With ``share_files`` the shares are read from binary share files and
+    the secret is reconstructed chunk by chunk into ``output_path``, so
+    large key bundles never have to fit in memory.
+
+    Returns the reconstructed secret (or the output path when streaming
+    from share files) or None on failure.
     """
     print("\n" + "=" * 60)
     print("  IERAHKWA KEY RECOVERY -- Recuperacion de Claves")
     print("=" * 60)
 
+    if share_files:
+        if not output_path:
+            output_path = input("Output path for the recovered secret: ").strip()
+        if not output_path:
+            print("No output path provided. Recovery aborted.")
+            return None
+
+        print(f"\nAttempting streamed reconstruction from {len(share_files)} share files...")
+        try:
+            result = reconstruct_from_share_files(share_files, output_path)
+        except Exception as exc:
+            print(f"Reconstruction failed: {exc}")
+            logger.error("Recovery failed: %s", exc)
+            return None
+
+        checksum = result["checksum_sha256"]
+        print(f"Reconstructed {result['size']:,} bytes to {output_path}")
+        print(f"Reconstructed secret checksum: {checksum}")
+        if expected_checksum:
+            if checksum == expected_checksum:
+                print("Checksum MATCHES expected value.")
+            else:
+                print(f"WARNING: Checksum MISMATCH! Expected: {expected_checksum}")
+
+        logger.info("Key recovery complete. Checksum: %s", checksum)
+        return Path(output_path)
+
     shares = []
     print("\nEnter shares one at a time. Type 'done' when finished.\n")
 
@@ -638,17 +845,239 @@ def share_to_json(idx: int, share_data: bytes) -> str:
 
 
 def shares_from_json_file(path: str) -> list[tuple[int, bytes]]:
-    """Load shares from a JSON file (array of share objects)."""
+    """Load shares from a JSON file (array of share objects, or the
+    ``split`` command output with the array under ``shares``)."""
     with open(path, "r", encoding="utf-8") as fh:
         data = json.load(fh)
+    if isinstance(data, dict):
+        data = data.get("shares", [])
     shares = []
     for entry in data:
-        idx = entry["share_index"]
+        idx = int(entry["share_index"])
+        if not 1 <= idx <= 255:
+            raise ValueError(f"{path}: invalid share index {idx}")
         share_data = bytes.fromhex(entry["share_hex"])
         shares.append((idx, share_data))
     return shares
 
 
+# ---------------------------------------------------------------------------
+# Binary share files
+# ---------------------------------------------------------------------------
+# Share file format (big-endian), followed by the raw share bytes:
+# - 4 bytes: magic number ("IGS1")
+# - 1 byte:  format version
+# - 1 byte:  share index
+# - 1 byte:  threshold k
+# - 1 byte:  total shares n
+# - 8 bytes: share length (uint64)
+# - 32 bytes: SHA-256 of the share bytes
+
+SHARE_MAGIC = b"IGS1"
+SHARE_VERSION = 1
+SHARE_HEADER = struct.Struct(">4sBBBBQ32s")
+SHARE_DISPLAY_MAX = 64  # larger shares are shown by file path in ceremonies
+
+
+def write_share_file(path, idx: int, k: int, n: int, share_data: bytes) -> str:
+    """Write a single in-memory share as a binary share file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = SHARE_HEADER.pack(
+        SHARE_MAGIC, SHARE_VERSION, idx, k, n, len(share_data),
+        hashlib.sha256(share_data).digest(),
+    )
+    with open(path, "wb") as fh:
+        fh.write(header)
+        fh.write(share_data)
+    return str(path)
+
+
+def read_share_header(path) -> dict:
+    """Read and validate the header of a binary share file."""
+    with open(path, "rb") as fh:
+        raw = fh.read(SHARE_HEADER.size)
+    if len(raw) < SHARE_HEADER.size:
+        raise ValueError(f"{path}: too short to be a share file")
+    magic, version, idx, k, n, length, digest = SHARE_HEADER.unpack(raw)
+    if magic != SHARE_MAGIC:
+        raise ValueError(f"{path}: not a share file (magic {magic!r})")
+    if version != SHARE_VERSION:
+        raise ValueError(f"{path}: unsupported share file version {version}")
+    if idx == 0:
+        # x = 0 is where the polynomial holds the secret; no real share has it
+        raise ValueError(f"{path}: invalid share index 0")
+    return {
+        "path": str(path),
+        "index": idx,
+        "k": k,
+        "n": n,
+        "length": length,
+        "share_hash": digest.hex(),
+    }
+
+
+def _split_chunks_to_files(chunks, output_dir: str, n: int, k: int) -> dict:
+    """Split an iterable of secret chunks into n binary share files.
+
+    Only one chunk of the secret and its n share chunks are in memory at a
+    time, and share files are opened for append per chunk, so no more than
+    one output handle is open at once.  Share hashes and the secret
+    checksum are accumulated while writing; the hashes are patched into
+    the headers at the end.
+
+    Returns a dict with ``paths`` (share index -> path), ``size`` and
+    ``checksum_sha256`` of the secret.
+    """
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    paths = {idx: out / f"share_{idx:03d}.igs" for idx in range(1, n + 1)}
+    hashes = {idx: hashlib.sha256() for idx in paths}
+    secret_hash = hashlib.sha256()
+    size = 0
+
+    placeholder = SHARE_HEADER.pack(SHARE_MAGIC, SHARE_VERSION, 0, k, n, 0, bytes(32))
+    for path in paths.values():
+        with open(path, "wb") as fh:
+            fh.write(placeholder)
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        secret_hash.update(chunk)
+        size += len(chunk)
+        for idx, share_chunk in split_secret(chunk, n, k):
+            with open(paths[idx], "ab") as fh:
+                fh.write(share_chunk)
+            hashes[idx].update(share_chunk)
+    if size == 0:
+        for path in paths.values():
+            path.unlink(missing_ok=True)
+        raise ValueError("Secret must not be empty")
+
+    for idx, path in paths.items():
+        with open(path, "r+b") as fh:
+            fh.write(SHARE_HEADER.pack(
+                SHARE_MAGIC, SHARE_VERSION, idx, k, n, size, hashes[idx].digest(),
+            ))
+    return {"paths": {idx: str(path) for idx, path in paths.items()},
+            "size": size, "checksum_sha256": secret_hash.hexdigest()}
+
+
+def _read_chunks(path: str, chunk_size: int = SHAMIR_CHUNK_SIZE):
+    with open(path, "rb") as src:
+        yield from iter(lambda: src.read(chunk_size), b"")
+
+
+def split_to_share_files(secret_path: str, output_dir: str, n: int = 100,
+                         k: int = 34, chunk_size: int = SHAMIR_CHUNK_SIZE) -> dict[int, str]:
+    """Split a secret file into n binary share files, chunk by chunk.
+
+    See ``_split_chunks_to_files`` for the memory and handle bounds.
+
+    Returns
+    -------
+    dict mapping share index -> share file path
+    """
+    if Path(secret_path).stat().st_size == 0:
+        raise ValueError("Secret must not be empty")
+    result = _split_chunks_to_files(_read_chunks(secret_path, chunk_size), output_dir, n, k)
+    logger.info("Split %s (%d bytes) into %d share files in %s (k=%d)",
+                secret_path, result["size"], n, output_dir, k)
+    return result["paths"]
+
+
+def write_shares_json(share_paths: dict[int, str], fh, n: int, k: int, checksum: str,
+                      chunk_size: int = SHAMIR_CHUNK_SIZE) -> None:
+    """Write the ``split`` JSON document from binary share files.
+
+    Share data is hex-encoded chunk by chunk straight into ``fh``, so the
+    shares never have to be held in memory together.
+    """
+    fh.write(f'{{\n  "n": {n},\n  "k": {k},\n  "secret_checksum": "{checksum}",\n'
+             f'  "shares": [')
+    for i, idx in enumerate(sorted(share_paths)):
+        hdr = read_share_header(share_paths[idx])
+        fh.write(f'{"," if i else ""}\n    {{\n      "share_index": {idx},\n'
+                 f'      "share_hex": "')
+        with open(share_paths[idx], "rb") as src:
+            src.seek(SHARE_HEADER.size)
+            for chunk in iter(lambda: src.read(chunk_size), b""):
+                fh.write(chunk.hex())
+        fh.write(f'",\n      "share_hash": "{hdr["share_hash"]}"\n    }}')
+    fh.write("\n  ]\n}\n")
+
+
+def reconstruct_from_share_files(paths: list[str], output_path: str,
+                                 chunk_size: int = SHAMIR_CHUNK_SIZE) -> dict:
+    """Reconstruct a secret from binary share files, chunk by chunk.
+
+    Uses the first k valid shares. Each share is hashed while it is read;
+    if any share does not match its header the output is removed and
+    ValueError is raised.
+
+    Returns
+    -------
+    dict with size, checksum_sha256 and the share indices used
+    """
+    headers = [read_share_header(p) for p in paths]
+    if not headers:
+        raise ValueError("No share files provided")
+
+    k, n, length = headers[0]["k"], headers[0]["n"], headers[0]["length"]
+    for hdr in headers:
+        if (hdr["k"], hdr["n"], hdr["length"]) != (k, n, length):
+            raise ValueError(f"{hdr['path']}: does not belong to the same split")
+    if len({hdr["index"] for hdr in headers}) != len(headers):
+        raise ValueError("Duplicate share indices")
+    if len(headers) < k:
+        raise ValueError(f"Need at least {k} shares, got {len(headers)}")
+
+    selected = headers[:k]
+    hashes = [hashlib.sha256() for _ in selected]
+    secret_hash = hashlib.sha256()
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    handles = [open(hdr["path"], "rb") for hdr in selected]
+    try:
+        for fh in handles:
+            fh.seek(SHARE_HEADER.size)
+        with open(out, "wb") as dst:
+            remaining = length
+            while remaining:
+                size = min(chunk_size, remaining)
+                chunks = [fh.read(size) for fh in handles]
+                for hdr, chunk in zip(selected, chunks):
+                    if len(chunk) != size:
+                        raise ValueError(f"{hdr['path']}: truncated share data")
+                for digest, chunk in zip(hashes, chunks):
+                    digest.update(chunk)
+                secret_chunk = reconstruct_secret(
+                    [(hdr["index"], chunk) for hdr, chunk in zip(selected, chunks)]
+                )
+                dst.write(secret_chunk)
+                secret_hash.update(secret_chunk)
+                remaining -= size
+
+        for hdr, digest in zip(selected, hashes):
+            if digest.hexdigest() != hdr["share_hash"]:
+                raise ValueError(f"Share {hdr['index']} failed checksum verification")
+    except Exception:
+        out.unlink(missing_ok=True)
+        raise
+    finally:
+        for fh in handles:
+            fh.close()
+
+    logger.info("Reconstructed %d bytes from %d share files -> %s", length, k, out)
+    return {
+        "size": length,
+        "checksum_sha256": secret_hash.hexdigest(),
+        "shares_used": [hdr["index"] for hdr in selected],
+    }
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -667,10 +1096,16 @@ def build_parser() -> argparse.ArgumentParser:
     split_p.add_argument("-n", type=int, default=100, help="Total shares (default: 100)")
     split_p.add_argument("-k", type=int, default=34, help="Threshold (default: 34)")
     split_p.add_argument("--output", default="", help="Output file for shares JSON")
+    split_p.add_argument("--share-dir", default="",
+                         help="Write binary share files here (streams --secret-file)")
 
     # reconstruct
     recon_p = sub.add_parser("reconstruct", help="Reconstruct secret from shares")
-    recon_p.add_argument("--shares-file", required=True, help="JSON file with shares")
+    recon_src = recon_p.add_mutually_exclusive_group(required=True)
+    recon_src.add_argument("--shares-file", help="JSON file with shares")
+    recon_src.add_argument("--share-files", nargs="+", help="Binary share files")
+    recon_p.add_argument("--output", default="",
+                         help="Write the secret here (required with --share-files)")
     recon_p.add_argument("--checksum", default="", help="Expected SHA-256 checksum")
 
     # distribute
@@ -692,10 +1127,25 @@ def build_parser() -> argparse.ArgumentParser:
     cer_p.add_argument("-k", type=int, default=34, help="Threshold (default: 34)")
     cer_p.add_argument("--output-log", default="data/ceremony_log.json",
                        help="Output path for ceremony log")
+    cer_p.add_argument("--secret-file", default="",
+                       help="Escrow this file instead of a fresh genesis seed")
+    cer_p.add_argument("--share-dir", default="",
+                       help="Also write each share as a binary share file")
 
     # recover
     rec_p = sub.add_parser("recover", help="Interactive key recovery")
     rec_p.add_argument("--checksum", default="", help="Expected SHA-256 checksum")
+    rec_p.add_argument("--share-files", nargs="+", default=None,
+                       help="Binary share files (streamed reconstruction)")
+    rec_p.add_argument("--output", default="",
+                       help="Output path for a secret recovered from share files")
+
+    # benchmark
+    bench_p = sub.add_parser("benchmark", help="Benchmark split/reconstruct throughput")
+    bench_p.add_argument("--sizes", default="1024,65536,1048576",
+                         help="Comma-separated secret sizes in bytes")
+    bench_p.add_argument("-n", type=int, default=100, help="Total shares (default: 100)")
+    bench_p.add_argument("-k", type=int, default=34, help="Threshold (default: 34)")
 
     return parser
 
@@ -708,13 +1158,33 @@ def main() -> None:
         parser.print_help()
         sys.exit(0)
 
-    if args.command == "split":
+    if args.command == "split" and args.share_dir and args.secret_file:
+        paths = split_to_share_files(args.secret_file, args.share_dir, args.n, args.k)
+        print(f"Share files written to {args.share_dir}")
+        print(f"\nSecret checksum: {file_checksum(args.secret_file)}")
+        print(f"Shares generated: {len(paths)}, threshold: {args.k}")
+
+    elif args.command == "split" and args.secret_file:
+        # Stream through temporary share files rather than reading the
+        # secret and all n shares into memory.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            split = _split_chunks_to_files(_read_chunks(args.secret_file), tmp_dir,
+                                           args.n, args.k)
+            checksum = split["checksum_sha256"]
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as fh:
+                    write_shares_json(split["paths"], fh, args.n, args.k, checksum)
+                print(f"Shares written to {args.output}")
+            else:
+                write_shares_json(split["paths"], sys.stdout, args.n, args.k, checksum)
+
+        print(f"\nSecret checksum: {checksum}")
+        print(f"Shares generated: {args.n}, threshold: {args.k}")
+
+    elif args.command == "split":
         # Get secret
         if args.secret:
             secret = bytes.fromhex(args.secret)
-        elif args.secret_file:
-            with open(args.secret_file, "rb") as fh:
-                secret = fh.read()
         else:
             print("Enter secret as hex (or pipe via stdin):")
             secret = bytes.fromhex(sys.stdin.readline().strip())
@@ -737,7 +1207,13 @@ def main() -> None:
             ],
         }
 
-        if args.output:
+        if args.share_dir:
+            for idx, data in shares:
+                write_share_file(
+                    Path(args.share_dir) / f"share_{idx:03d}.igs", idx, args.k, args.n, data
+                )
+            print(f"Share files written to {args.share_dir}")
+        elif args.output:
             with open(args.output, "w", encoding="utf-8") as fh:
                 json.dump(output, fh, indent=2)
             print(f"Shares written to {args.output}")
@@ -747,6 +1223,22 @@ def main() -> None:
         print(f"\nSecret checksum: {checksum}")
         print(f"Shares generated: {len(shares)}, threshold: {args.k}")
 
+    elif args.command == "reconstruct" and args.share_files:
+        if not args.output:
+            parser.error("--output is required with --share-files")
+        result = reconstruct_from_share_files(args.share_files, args.output)
+        checksum = result["checksum_sha256"]
+
+        print(f"Reconstructed {result['size']:,} bytes to {args.output}")
+        print(f"Checksum: {checksum}")
+
+        if args.checksum:
+            if checksum == args.checksum:
+                print("Checksum MATCHES.")
+            else:
+                print(f"Checksum MISMATCH! Expected: {args.checksum}")
+                sys.exit(1)
+
     elif args.command == "reconstruct":
         shares = shares_from_json_file(args.shares_file)
         secret = reconstruct_secret(shares)
@@ -781,8 +1273,12 @@ def main() -> None:
             sys.exit(1)
 
     elif args.command == "ceremony":
-        seed = generate_genesis_seed()
-        log = ceremony_mode(seed, args.n, args.k)
+        if args.secret_file:
+            log = ceremony_mode(None, args.n, args.k, share_dir=args.share_dir or None,
+                                secret_path=args.secret_file)
+        else:
+            log = ceremony_mode(generate_genesis_seed(), args.n, args.k,
+                                share_dir=args.share_dir or None)
 
         log_path = Path(args.output_log)
         log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -791,12 +1287,29 @@ def main() -> None:
         print(f"Ceremony log saved to {log_path}")
 
     elif args.command == "recover":
-        secret = recovery_mode(expected_checksum=args.checksum)
-        if secret:
+        secret = recovery_mode(
+            expected_checksum=args.checksum,
+            share_files=args.share_files,
+            output_path=args.output,
+        )
+        if isinstance(secret, Path):
+            print(f"Recovered secret written to {secret}")
+        elif secret:
             print(f"Recovered secret (hex): {secret.hex()}")
         else:
             sys.exit(1)
 
+    elif args.command == "benchmark":
+        sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+        rows = benchmark_engine(sizes, args.n, args.k)
+        print(f"\nShamir engine benchmark (n={args.n}, k={args.k})")
+        print(f"{'size':>10} {'split s':>10} {'recon s':>10} {'split x':>9} {'recon x':>9}")
+        for row in rows:
+            print(
+                f"{row['size']:>10} {row['split_s']:>10.4f} {row['reconstruct_s']:>10.4f} "
+                f"{row.get('split_speedup', '-'):>9} {row.get('reconstruct_speedup', '-'):>9}"
+            )
+
 
 if __name__ == "__main__":
     main()
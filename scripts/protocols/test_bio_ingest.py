@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Ierahkwa Bio-Ledger Ingest Test Suite
+Feeds malformed and valid JSON lines through SensorIngest and checks that a
+bad line (null or non-numeric sensor fields, non-object JSON, garbage) is
+skipped without stopping the consumer, so later readings are still handled.
+
+Environment variables
+---------------------
+LOG_DIR         Logging directory     (default: logs/)
+BIO_DB_PATH     bio_ledger database   (default: data/bio_ledger.db)
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bio_ledger import SensorIngest, parse_sensor_json  # noqa: E402
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+LOG_DIR = Path(os.environ.get("LOG_DIR", "logs"))
+
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    handlers=[
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler(LOG_DIR / "test_bio_ingest.log", encoding="utf-8"),
+    ],
+)
+logger = logging.getLogger("ierahkwa.test_bio_ingest")
+
+# ---------------------------------------------------------------------------
+# Test lines
+# ---------------------------------------------------------------------------
+
+MALFORMED_LINES = [
+    b'{"soil_moisture": null}',
+    b'{"co2_ppm": "high"}',
+    b'{"temperature_c": [21.5]}',
+    b'{"uv_index": 1e999, "co2_ppm": 1e999}',
+    b'[1, 2, 3]',
+    b'not json at all',
+]
+
+VALID_LINE = b'{"soil_moisture": 41.5, "co2_ppm": 420, "device_id": "esp32-test"}'
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def check_parse_rejects_malformed() -> list[str]:
+    errors = []
+    for line in MALFORMED_LINES:
+        try:
+            reading = parse_sensor_json(line.decode())
+        except Exception as exc:
+            errors.append(f"parse_sensor_json raised on {line!r}: {exc!r}")
+            continue
+        if reading is not None:
+            errors.append(f"parse_sensor_json accepted {line!r}")
+    reading = parse_sensor_json(VALID_LINE.decode())
+    if reading is None or reading.soil_moisture != 41.5 or reading.co2_ppm != 420:
+        errors.append(f"parse_sensor_json mangled valid line: {reading!r}")
+    return errors
+
+
+async def _ingest(lines: list[bytes], expected: int, timeout: float = 5.0) -> list:
+    handled = []
+    done = asyncio.Event()
+
+    def handler(reading) -> None:
+        handled.append(reading)
+        if len(handled) >= expected:
+            loop.call_soon_threadsafe(done.set)
+
+    loop = asyncio.get_running_loop()
+    ingest = SensorIngest(handler, serial_specs=[])
+    runner = asyncio.create_task(ingest.run())
+    await asyncio.sleep(0)
+    for line in lines:
+        ingest.offer_nowait("udp:test", line)
+    try:
+        await asyncio.wait_for(done.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    ingest.stop()
+    await runner
+    return handled
+
+
+def check_consumer_survives_malformed() -> list[str]:
+    errors = []
+    for bad in MALFORMED_LINES:
+        handled = asyncio.run(_ingest([bad, VALID_LINE], expected=1))
+        if len(handled) != 1 or handled[0].device_id != "esp32-test":
+            errors.append(f"valid reading after {bad!r} not handled: {handled!r}")
+    return errors
+
+
+def test_parse_rejects_malformed() -> None:
+    errors = check_parse_rejects_malformed()
+    assert not errors, errors
+
+
+def test_consumer_survives_malformed() -> None:
+    errors = check_consumer_survives_malformed()
+    assert not errors, errors
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    tests = [check_parse_rejects_malformed, check_consumer_survives_malformed]
+    failed = 0
+    for test in tests:
+        errors = test()
+        if errors:
+            failed += 1
+            for error in errors:
+                logger.error("%s: %s", test.__name__, error)
+        else:
+            logger.info("%s: PASS", test.__name__)
+
+    if failed:
+        logger.warning("%d tests failed.", failed)
+        sys.exit(1)
+    else:
+        logger.info("All tests passed.")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()